@@ -499,20 +499,19 @@ def decrypt_cmd(
             with FridaClient(udid=udid, host=host) as client:
                 progress.update(task, description="Connected. Initializing dumper...")
 
-                dumper = AppDumper(
+                with AppDumper(
                     frida_client=client,
                     ssh_host=ssh_host,
                     ssh_port=ssh_port,
                     ssh_user=ssh_user,
                     ssh_password=ssh_password,
-                )
-
-                result = dumper.dump(
-                    bundle_id=bundle_id,
-                    output_path=output_path,
-                    include_frameworks=not no_frameworks,
-                    progress_callback=on_progress,
-                )
+                ) as dumper:
+                    result = dumper.dump(
+                        bundle_id=bundle_id,
+                        output_path=output_path,
+                        include_frameworks=not no_frameworks,
+                        progress_callback=on_progress,
+                    )
 
         console.print()
         console.print(f"[green]Successfully decrypted![/green]")
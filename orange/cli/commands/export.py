@@ -13,7 +13,7 @@ from typing import Optional
 
 from rich.console import Console
 
-from orange.constants import DEFAULT_BACKUP_DIR, DEFAULT_EXPORT_DIR
+from orange import constants
 from orange.core.backup.reader import BackupReader
 from orange.core.context import get_context
 from orange.core.export import (
@@ -75,7 +75,7 @@ def _find_backup(backup_path: Optional[str] = None) -> Path:
         return last_backup.path_obj
 
     # Fall back to looking for backups in default location
-    backup_dir = DEFAULT_BACKUP_DIR
+    backup_dir = constants.DEFAULT_BACKUP_DIR
     if not backup_dir.exists():
         raise click.ClickException(
             f"No backups found. Create one with 'orange backup create' "
@@ -109,7 +109,7 @@ def _get_output_path(
         return Path(output)
 
     # Use default export directory
-    export_dir = DEFAULT_EXPORT_DIR / export_type
+    export_dir = constants.DEFAULT_EXPORT_DIR / export_type
     export_dir.mkdir(parents=True, exist_ok=True)
     return export_dir / default_name
 
@@ -16,14 +16,10 @@ from typing import Any, Optional
 
 from dotenv import load_dotenv
 
+from orange import constants
 from orange.constants import (
-    DEFAULT_BACKUP_DIR,
     DEFAULT_CHUNK_SIZE,
-    DEFAULT_CONFIG_DIR,
-    DEFAULT_CONFIG_FILE,
     DEFAULT_CONNECTION_TIMEOUT,
-    DEFAULT_EXPORT_DIR,
-    DEFAULT_LOG_DIR,
     DEFAULT_PAIRING_TIMEOUT,
     MAX_CONCURRENT_TRANSFERS,
     AUDIO_FORMAT_ALAC,
@@ -97,10 +93,10 @@ class Config:
     """
 
     # Directory paths
-    config_dir: Path = field(default_factory=lambda: DEFAULT_CONFIG_DIR)
-    backup_dir: Path = field(default_factory=lambda: DEFAULT_BACKUP_DIR)
-    export_dir: Path = field(default_factory=lambda: DEFAULT_EXPORT_DIR)
-    log_dir: Path = field(default_factory=lambda: DEFAULT_LOG_DIR)
+    config_dir: Path = field(default_factory=lambda: constants.DEFAULT_CONFIG_DIR)
+    backup_dir: Path = field(default_factory=lambda: constants.DEFAULT_BACKUP_DIR)
+    export_dir: Path = field(default_factory=lambda: constants.DEFAULT_EXPORT_DIR)
+    log_dir: Path = field(default_factory=lambda: constants.DEFAULT_LOG_DIR)
 
     # Sub-configurations
     connection: ConnectionConfig = field(default_factory=ConnectionConfig)
@@ -134,7 +130,7 @@ class Config:
         # Load environment variables from .env file if present
         load_dotenv()
 
-        config_path = config_path or DEFAULT_CONFIG_FILE
+        config_path = config_path or constants.DEFAULT_CONFIG_FILE
         config_data: dict[str, Any] = {}
 
         # Load from file if it exists
@@ -215,10 +211,10 @@ class Config:
         export_data = data.pop("export", {})
 
         return cls(
-            config_dir=Path(data.get("config_dir", DEFAULT_CONFIG_DIR)),
-            backup_dir=Path(data.get("backup_dir", DEFAULT_BACKUP_DIR)),
-            export_dir=Path(data.get("export_dir", DEFAULT_EXPORT_DIR)),
-            log_dir=Path(data.get("log_dir", DEFAULT_LOG_DIR)),
+            config_dir=Path(data.get("config_dir", constants.DEFAULT_CONFIG_DIR)),
+            backup_dir=Path(data.get("backup_dir", constants.DEFAULT_BACKUP_DIR)),
+            export_dir=Path(data.get("export_dir", constants.DEFAULT_EXPORT_DIR)),
+            log_dir=Path(data.get("log_dir", constants.DEFAULT_LOG_DIR)),
             connection=ConnectionConfig(**connection_data),
             transfer=TransferConfig(**transfer_data),
             conversion=ConversionConfig(**conversion_data),
@@ -235,7 +231,7 @@ class Config:
             config_path: Optional path to save to. If not provided,
                         uses default location.
         """
-        config_path = config_path or DEFAULT_CONFIG_FILE
+        config_path = config_path or constants.DEFAULT_CONFIG_FILE
 
         # Ensure directory exists
         config_path.parent.mkdir(parents=True, exist_ok=True)
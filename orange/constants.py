@@ -7,17 +7,38 @@ hardcoding values elsewhere.
 """
 
 from pathlib import Path
+from typing import Any, Callable
 
 # Version info
 VERSION = "0.1.0"
 APP_NAME = "Orange"
 
 # Default paths
-DEFAULT_CONFIG_DIR = Path.home() / ".orange"
-DEFAULT_BACKUP_DIR = DEFAULT_CONFIG_DIR / "backups"
-DEFAULT_EXPORT_DIR = DEFAULT_CONFIG_DIR / "exports"
-DEFAULT_LOG_DIR = DEFAULT_CONFIG_DIR / "logs"
-DEFAULT_CONFIG_FILE = DEFAULT_CONFIG_DIR / "config.json"
+# Reason: Path.home() hits the environment/passwd database, and this module
+# is imported by nearly everything. The DEFAULT_*_DIR/FILE names are resolved
+# on first access via the module __getattr__ below, then cached as globals.
+CONFIG_DIR_NAME = ".orange"
+
+_LAZY_PATHS: dict[str, Callable[[], Path]] = {
+    "DEFAULT_CONFIG_DIR": lambda: Path.home() / CONFIG_DIR_NAME,
+    "DEFAULT_BACKUP_DIR": lambda: __getattr__("DEFAULT_CONFIG_DIR") / "backups",
+    "DEFAULT_EXPORT_DIR": lambda: __getattr__("DEFAULT_CONFIG_DIR") / "exports",
+    "DEFAULT_LOG_DIR": lambda: __getattr__("DEFAULT_CONFIG_DIR") / "logs",
+    "DEFAULT_CACHE_DIR": lambda: __getattr__("DEFAULT_CONFIG_DIR") / "cache",
+    "DEFAULT_CONFIG_FILE": lambda: __getattr__("DEFAULT_CONFIG_DIR") / "config.json",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the default path constants on first access."""
+    if name in globals():
+        return globals()[name]
+    factory = _LAZY_PATHS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = factory()
+    globals()[name] = value
+    return value
 
 # Connection settings
 DEFAULT_CONNECTION_TIMEOUT = 30  # seconds
@@ -30,6 +51,30 @@ RECONNECT_DELAY = 2  # seconds
 DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 MB
 MAX_CONCURRENT_TRANSFERS = 4
 
+# File types that are already compressed; deflating them again burns CPU
+# for essentially no size reduction, so they are stored as-is in IPAs
+INCOMPRESSIBLE_SUFFIXES = frozenset(
+    {
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".heic",
+        ".webp",
+        ".mp4",
+        ".mov",
+        ".caf",
+        ".m4a",
+        ".mp3",
+        ".aac",
+        ".car",
+        ".pdf",
+        ".ttf",
+        ".otf",
+        ".woff",
+        ".woff2",
+    }
+)
+
 # Wi-Fi discovery
 WIFI_DISCOVERY_TIMEOUT = 5  # seconds
 BONJOUR_SERVICE_TYPE = "_apple-mobdev2._tcp.local."
@@ -46,8 +91,8 @@ SERVICE_SYSLOG = "com.apple.syslog_relay"
 SERVICE_CRASHREPORT = "com.apple.crashreportcopymobile"
 SERVICE_HOUSE_ARREST = "com.apple.mobile.house_arrest"
 
-# Device information keys
-DEVICE_INFO_KEYS = [
+# Device information keys (a tuple so the shared constant cannot be mutated)
+DEVICE_INFO_KEYS = (
     "DeviceName",
     "DeviceClass",
     "ProductType",
@@ -65,7 +110,7 @@ DEVICE_INFO_KEYS = [
     "ActivationState",
     "BatteryCurrentCapacity",
     "BatteryIsCharging",
-]
+)
 
 # Battery level thresholds
 BATTERY_LOW = 20
@@ -80,13 +125,13 @@ EXPORT_FORMAT_TXT = "txt"
 EXPORT_FORMAT_VCF = "vcf"  # vCard for contacts
 EXPORT_FORMAT_ICS = "ics"  # iCalendar
 
-SUPPORTED_EXPORT_FORMATS = [
+SUPPORTED_EXPORT_FORMATS = (
     EXPORT_FORMAT_PDF,
     EXPORT_FORMAT_CSV,
     EXPORT_FORMAT_JSON,
     EXPORT_FORMAT_HTML,
     EXPORT_FORMAT_TXT,
-]
+)
 
 # Audio formats
 AUDIO_FORMAT_ALAC = "alac"
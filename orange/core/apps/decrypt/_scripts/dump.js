@@ -0,0 +1,89 @@
+// Frida script for dumping decrypted memory of the main executable
+
+'use strict';
+
+// Get the main executable module
+var modules = Process.enumerateModules();
+var mainModule = modules[0];
+
+// Result object
+var result = {
+    moduleName: mainModule.name,
+    modulePath: mainModule.path,
+    moduleBase: mainModule.base.toString(),
+    moduleSize: mainModule.size,
+    encryptionInfo: null
+};
+
+// Parse Mach-O header to find encryption info
+function findEncryptionInfo() {
+    var header = mainModule.base;
+    var magic = Memory.readU32(header);
+
+    // Determine if 64-bit
+    var is64 = (magic === 0xfeedfacf || magic === 0xcffaedfe);
+    var headerSize = is64 ? 32 : 28;
+
+    // Read number and total size of load commands
+    var ncmds = Memory.readU32(header.add(16));
+    var sizeofcmds = Memory.readU32(header.add(20));
+
+    // Read all load commands in one native call and walk them as a
+    // typed array instead of calling Memory.readU32 per field
+    var buf = Memory.readByteArray(header.add(headerSize), sizeofcmds);
+    var u32 = new Uint32Array(buf);
+    var off = 0;
+
+    for (var i = 0; i < ncmds && off + 8 <= sizeofcmds; i++) {
+        var idx = off / 4;
+        var cmd = u32[idx];
+        var cmdSize = u32[idx + 1];
+
+        // LC_ENCRYPTION_INFO_64 = 0x2C, LC_ENCRYPTION_INFO = 0x21
+        if (cmd === 0x2c || cmd === 0x21) {
+            return {
+                cryptoff: u32[idx + 2],
+                cryptsize: u32[idx + 3],
+                cryptid: u32[idx + 4],
+                cmdOffset: headerSize + off
+            };
+        }
+
+        if (cmdSize === 0) {
+            break;
+        }
+        off += cmdSize;
+    }
+
+    return null;
+}
+
+// Stream the decrypted section from memory in fixed-size chunks so the
+// target never allocates (or transfers) the whole section at once
+var CHUNK_SIZE = __CHUNK_SIZE__;
+
+function dumpDecryptedSection(encInfo) {
+    var startAddr = mainModule.base.add(encInfo.cryptoff);
+
+    for (var off = 0; off < encInfo.cryptsize; off += CHUNK_SIZE) {
+        var n = Math.min(CHUNK_SIZE, encInfo.cryptsize - off);
+        send({type: 'chunk', offset: off},
+             Memory.readByteArray(startAddr.add(off), n));
+    }
+}
+
+// Main execution
+try {
+    result.encryptionInfo = findEncryptionInfo();
+    send({type: 'info', info: result});
+
+    // The decrypted bytes always travel as binary attachments so they
+    // stay contiguous buffers instead of being serialized into JSON
+    if (result.encryptionInfo && result.encryptionInfo.cryptid !== 0) {
+        dumpDecryptedSection(result.encryptionInfo);
+    }
+
+    send({type: 'done'});
+} catch (e) {
+    send({error: e.toString()});
+}
@@ -0,0 +1,32 @@
+// Frida script for enumerating all binaries (main + frameworks)
+
+'use strict';
+
+function enumerateBinaries() {
+    var binaries = [];
+    var modules = Process.enumerateModules();
+
+    // Filter to app-related modules
+    var appPath = modules[0].path;
+    var appDir = appPath.substring(0, appPath.lastIndexOf('/'));
+
+    for (var i = 0; i < modules.length; i++) {
+        var mod = modules[i];
+
+        // Include main executable and app frameworks
+        if (mod.path.startsWith(appDir) || mod.path.indexOf('.app/') !== -1) {
+            binaries.push({
+                name: mod.name,
+                path: mod.path,
+                base: mod.base.toString(),
+                size: mod.size
+            });
+        }
+    }
+
+    return binaries;
+}
+
+rpc.exports = {
+    enumerate: enumerateBinaries
+};
@@ -12,12 +12,18 @@ This module handles the full workflow of dumping decrypted apps:
 from __future__ import annotations
 
 import logging
+import shlex
+import shutil
+import tarfile
 import tempfile
+import threading
 import time
+from importlib import resources
 from dataclasses import dataclass, field
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Optional, Callable, Any
 
+from orange.constants import DEFAULT_CHUNK_SIZE
 from orange.core.apps.decrypt.frida_client import FridaClient
 from orange.core.apps.decrypt.macho import MachOParser, EncryptionInfo
 from orange.core.apps.decrypt.exceptions import (
@@ -28,120 +34,102 @@ from orange.core.apps.decrypt.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# SSH channel window for streaming app bundles with tar
+TAR_STREAM_WINDOW_SIZE = 4 * 1024 * 1024  # 4 MB
 
-# Frida script for dumping decrypted memory
-DUMP_SCRIPT = """
-'use strict';
-
-// Get the main executable module
-var modules = Process.enumerateModules();
-var mainModule = modules[0];
-
-// Result object
-var result = {
-    moduleName: mainModule.name,
-    modulePath: mainModule.path,
-    moduleBase: mainModule.base.toString(),
-    moduleSize: mainModule.size,
-    encryptionInfo: null,
-    decryptedData: null
-};
-
-// Parse Mach-O header to find encryption info
-function findEncryptionInfo() {
-    var header = mainModule.base;
-    var magic = Memory.readU32(header);
-
-    // Determine if 64-bit
-    var is64 = (magic === 0xfeedfacf || magic === 0xcffaedfe);
-    var headerSize = is64 ? 32 : 28;
-
-    // Read number of load commands
-    var ncmds = Memory.readU32(header.add(16));
-
-    // Iterate through load commands
-    var cmdPtr = header.add(headerSize);
-
-    for (var i = 0; i < ncmds; i++) {
-        var cmd = Memory.readU32(cmdPtr);
-        var cmdSize = Memory.readU32(cmdPtr.add(4));
-
-        // LC_ENCRYPTION_INFO_64 = 0x2C, LC_ENCRYPTION_INFO = 0x21
-        if (cmd === 0x2c || cmd === 0x21) {
-            var cryptoff = Memory.readU32(cmdPtr.add(8));
-            var cryptsize = Memory.readU32(cmdPtr.add(12));
-            var cryptid = Memory.readU32(cmdPtr.add(16));
-
-            return {
-                cryptoff: cryptoff,
-                cryptsize: cryptsize,
-                cryptid: cryptid,
-                cmdOffset: cmdPtr.sub(mainModule.base).toInt32()
-            };
-        }
+# Minimum interval between repeated progress ticks within one stage (stage
+# or message changes and the final event always fire)
+PROGRESS_MIN_INTERVAL = 0.05  # seconds
 
-        cmdPtr = cmdPtr.add(cmdSize);
-    }
 
-    return null;
-}
+def _minify_js(source: str) -> str:
+    """
+    Drop blank lines, indentation and whole-line // comments from JavaScript.
+
+    Only lines that begin with // are removed, so // inside string literals
+    and URLs survives. Lines within a multi-line template literal are kept
+    verbatim because their text is part of the string value.
 
-// Dump the decrypted section from memory
-function dumpDecryptedSection(encInfo) {
-    if (!encInfo || encInfo.cryptid === 0) {
-        return null;
-    }
+    Args:
+        source: JavaScript source.
 
-    var startAddr = mainModule.base.add(encInfo.cryptoff);
-    var data = Memory.readByteArray(startAddr, encInfo.cryptsize);
+    Returns:
+        Minified JavaScript source.
+    """
+    lines = []
+    in_template = False
+    for raw in source.splitlines():
+        # An odd number of unescaped backticks opens or closes a template
+        toggles = (raw.count("`") - raw.count("\\`")) % 2 == 1
+        if not in_template:
+            line = raw.strip()
+            if not line or line.startswith("//"):
+                continue
+            # Trailing whitespace after an opening backtick is string content
+            lines.append(raw.lstrip() if toggles else line)
+        else:
+            lines.append(raw)
+        in_template ^= toggles
+    return "\n".join(lines)
+
+
+def _load_script(name: str) -> str:
+    """
+    Load a bundled Frida script and strip comments and indentation.
 
-    return data;
-}
+    Args:
+        name: File name within the _scripts directory.
 
-// Main execution
-try {
-    result.encryptionInfo = findEncryptionInfo();
+    Returns:
+        Minified JavaScript source.
+    """
+    source = (
+        resources.files(__package__).joinpath("_scripts").joinpath(name)
+    ).read_text(encoding="utf-8")
+    return _minify_js(source)
 
-    if (result.encryptionInfo && result.encryptionInfo.cryptid !== 0) {
-        result.decryptedData = dumpDecryptedSection(result.encryptionInfo);
-    }
 
-    send(result);
-} catch (e) {
-    send({error: e.toString()});
-}
-"""
+# Frida script for dumping decrypted memory
+DUMP_SCRIPT = _load_script("dump.js").replace(
+    "__CHUNK_SIZE__", str(DEFAULT_CHUNK_SIZE)
+)
 
 # Script for enumerating all binaries (main + frameworks)
-ENUMERATE_BINARIES_SCRIPT = """
-'use strict';
-
-var binaries = [];
-var modules = Process.enumerateModules();
-
-// Filter to app-related modules
-var appPath = modules[0].path;
-var appDir = appPath.substring(0, appPath.lastIndexOf('/'));
-
-for (var i = 0; i < modules.length; i++) {
-    var mod = modules[i];
-
-    // Include main executable and app frameworks
-    if (mod.path.startsWith(appDir) || mod.path.indexOf('.app/') !== -1) {
-        binaries.push({
-            name: mod.name,
-            path: mod.path,
-            base: mod.base.toString(),
-            size: mod.size
-        });
-    }
-}
-
-send(binaries);
-"""
+ENUMERATE_BINARIES_SCRIPT = _load_script("enumerate.js")
+
+
+# Compiled bytecode for the scripts above, keyed by source
+_compiled_scripts: dict[str, bytes] = {}
+
+
+def _create_script(session: Any, source: str) -> Any:
+    """
+    Create a Frida script, reusing previously compiled bytecode.
 
+    Frida scripts are bound to a session, but the compiled bytecode is not,
+    so each script source is compiled once per process and later sessions
+    load it with create_script_from_bytes. Falls back to compiling from
+    source if the session does not support precompilation.
 
-@dataclass
+    Args:
+        session: Active Frida session.
+        source: JavaScript source code for the script.
+
+    Returns:
+        Frida script object (not yet loaded).
+    """
+    bytecode = _compiled_scripts.get(source)
+    try:
+        if bytecode is None:
+            bytecode = session.compile_script(source)
+            _compiled_scripts[source] = bytecode
+        return session.create_script_from_bytes(bytecode)
+    except Exception as e:
+        logger.debug(f"Script precompilation unavailable, using source: {e}")
+        return session.create_script(source)
+
+
+@dataclass(slots=True)
 class DumpProgress:
     """Progress information for dump operation."""
 
@@ -151,7 +139,42 @@ class DumpProgress:
     message: str
 
 
-@dataclass
+def _throttled_progress(
+    callback: Optional[Callable[[DumpProgress], None]],
+) -> Callable[[str, int, int, str], None]:
+    """
+    Wrap a dump progress callback so repeated ticks are coalesced.
+
+    A change of stage or message is always forwarded, as is the final event
+    (current == total). Only repeats of the same stage and message within
+    PROGRESS_MIN_INTERVAL seconds of the last forwarded event are dropped.
+
+    Args:
+        callback: User progress callback, or None.
+
+    Returns:
+        Function taking (stage, current, total, message).
+    """
+    last: list[Any] = [None, float("-inf")]  # (stage, message), monotonic time
+
+    def report(stage: str, current: int, total: int, message: str) -> None:
+        if not callback:
+            return
+        now = time.monotonic()
+        key = (stage, message)
+        if (
+            key == last[0]
+            and current != total
+            and now - last[1] < PROGRESS_MIN_INTERVAL
+        ):
+            return
+        last[0], last[1] = key, now
+        callback(DumpProgress(stage, current, total, message))
+
+    return report
+
+
+@dataclass(slots=True)
 class DumpResult:
     """Result of a successful dump operation."""
 
@@ -164,7 +187,7 @@ class DumpResult:
     elapsed_seconds: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class BinaryDumpInfo:
     """Information about a dumped binary."""
 
@@ -196,8 +219,7 @@ class AppDumper:
     6. Package as IPA
 
     Example:
-        with FridaClient(udid="...") as client:
-            dumper = AppDumper(client)
+        with FridaClient(udid="...") as client, AppDumper(client) as dumper:
             result = dumper.dump(
                 "com.netflix.Netflix",
                 Path("./Netflix-decrypted.ipa"),
@@ -229,6 +251,8 @@ class AppDumper:
         self.ssh_user = ssh_user
         self.ssh_password = ssh_password
         self._ssh_client: Optional[Any] = None
+        self._ssh_lock = threading.Lock()
+        self._app_info_cache: dict[str, Any] = {}
 
     def dump(
         self,
@@ -237,6 +261,7 @@ class AppDumper:
         include_extensions: bool = True,
         include_frameworks: bool = True,
         progress_callback: Optional[Callable[[DumpProgress], None]] = None,
+        list_frameworks: bool = False,
     ) -> DumpResult:
         """
         Dump a decrypted IPA for the specified app.
@@ -247,6 +272,11 @@ class AppDumper:
             include_extensions: Decrypt app extensions (default True).
             include_frameworks: Decrypt embedded frameworks (default True).
             progress_callback: Optional callback for progress updates.
+            list_frameworks: Enumerate the app's frameworks and report their
+                names in DumpResult.frameworks_dumped. Only applies when
+                include_frameworks is set. Defaults to False, in which case
+                frameworks_dumped is empty. Framework binaries are not
+                decrypted either way; this only lists them.
 
         Returns:
             DumpResult with details about the operation.
@@ -257,16 +287,15 @@ class AppDumper:
             DecryptionError: Failed to decrypt binary.
         """
         start_time = time.time()
-
-        def report_progress(stage: str, current: int, total: int, message: str):
-            if progress_callback:
-                progress_callback(DumpProgress(stage, current, total, message))
+        # App info is immutable for the duration of a dump; start fresh each call
+        self._app_info_cache.clear()
+        # A fresh throttle per call, so a previous dump cannot hold back
+        # this one's first update
+        report_progress = _throttled_progress(progress_callback)
 
         # Verify app exists
         report_progress("connecting", 0, 5, "Checking app installation...")
-        app_info = self.frida.get_app_info(bundle_id)
-        if not app_info:
-            raise AppNotFoundError(bundle_id)
+        app_info = self._get_app_info(bundle_id)
 
         logger.info(f"Found app: {app_info.name} ({bundle_id})")
 
@@ -280,27 +309,17 @@ class AppDumper:
             report_progress("dumping", 2, 5, "Dumping main executable...")
             main_dump = self._dump_binary(session, bundle_id)
 
-            # Enumerate and dump frameworks if requested
-            frameworks_dumped = []
-            if include_frameworks:
+            # Framework binaries are not decrypted yet, so enumerating them
+            # only produces names. Reason: that costs a Frida round trip, so
+            # only do it when the caller explicitly asks for the list.
+            frameworks_dumped: list[str] = []
+            if include_frameworks and list_frameworks:
                 report_progress("dumping", 2, 5, "Enumerating frameworks...")
-                binaries = self._enumerate_binaries(session)
-
-                for i, binary_info in enumerate(binaries[1:], 1):  # Skip main
-                    if "/Frameworks/" in binary_info.get("path", ""):
-                        framework_name = binary_info["name"]
-                        report_progress(
-                            "dumping",
-                            2,
-                            5,
-                            f"Dumping framework: {framework_name}",
-                        )
-                        try:
-                            # Framework dumping would require additional session attachment
-                            # For now, track which frameworks exist
-                            frameworks_dumped.append(framework_name)
-                        except Exception as e:
-                            logger.warning(f"Failed to dump {framework_name}: {e}")
+                frameworks_dumped = [
+                    binary_info["name"]
+                    for binary_info in self._enumerate_binaries(session)[1:]
+                    if "/Frameworks/" in binary_info.get("path", "")
+                ]
 
             # Download app bundle from device
             report_progress("downloading", 3, 5, "Downloading app bundle...")
@@ -337,6 +356,27 @@ class AppDumper:
             except Exception as e:
                 logger.debug(f"Error detaching: {e}")
 
+    def _get_app_info(self, bundle_id: str) -> Any:
+        """
+        Get app info, memoized for the lifetime of the current dump.
+
+        Args:
+            bundle_id: App bundle identifier.
+
+        Returns:
+            FridaAppInfo for the app.
+
+        Raises:
+            AppNotFoundError: App not installed on device.
+        """
+        app_info = self._app_info_cache.get(bundle_id)
+        if app_info is None:
+            app_info = self.frida.get_app_info(bundle_id)
+            if not app_info:
+                raise AppNotFoundError(bundle_id)
+            self._app_info_cache[bundle_id] = app_info
+        return app_info
+
     def _dump_binary(self, session: Any, bundle_id: str) -> BinaryDumpInfo:
         """
         Dump the decrypted main binary from a running app.
@@ -348,35 +388,58 @@ class AppDumper:
         Returns:
             BinaryDumpInfo with decrypted data.
         """
-        result_data = {"received": False, "data": None, "error": None}
+        result_data = {
+            "received": False,
+            "data": None,
+            "error": None,
+            "decrypted_bytes": None,
+            "bytes_received": 0,
+            "last_message": time.time(),
+        }
 
         def on_message(message: dict, data: Optional[bytes]):
-            if message["type"] == "send":
-                payload = message["payload"]
-                if "error" in payload:
-                    result_data["error"] = payload["error"]
-                else:
-                    result_data["data"] = payload
-                    # The decrypted data comes as binary attachment
-                    if data:
-                        result_data["decrypted_bytes"] = data
+            if message["type"] != "send":
+                return
+            payload = message["payload"]
+            result_data["last_message"] = time.time()
+
+            if "error" in payload:
+                result_data["error"] = payload["error"]
+                result_data["received"] = True
+            elif payload.get("type") == "info":
+                info = payload["info"]
+                result_data["data"] = info
+                enc = info.get("encryptionInfo")
+                if enc and enc["cryptid"] != 0:
+                    # Preallocate so chunks are copied into place
+                    result_data["decrypted_bytes"] = bytearray(enc["cryptsize"])
+            elif payload.get("type") == "chunk":
+                buf = result_data["decrypted_bytes"]
+                if buf is not None and data:
+                    offset = payload["offset"]
+                    buf[offset : offset + len(data)] = data
+                    result_data["bytes_received"] += len(data)
+            elif payload.get("type") == "done":
                 result_data["received"] = True
 
         # Create and load the dump script
-        script = session.create_script(DUMP_SCRIPT)
+        script = _create_script(session, DUMP_SCRIPT)
         script.on("message", on_message)
         script.load()
 
-        # Wait for result (with timeout)
+        # Wait for result; the timeout is measured from the last message so
+        # large sections streamed in many chunks are not cut off
         timeout = 30
-        start = time.time()
-        while not result_data["received"] and (time.time() - start) < timeout:
+        while (
+            not result_data["received"]
+            and (time.time() - result_data["last_message"]) < timeout
+        ):
             time.sleep(0.1)
 
         if result_data["error"]:
             raise DecryptionError(f"Frida script error: {result_data['error']}")
 
-        if not result_data["data"]:
+        if not result_data["data"] or not result_data["received"]:
             raise DecryptionError("No data received from dump script")
 
         data = result_data["data"]
@@ -391,13 +454,16 @@ class AppDumper:
                 cmd_offset=enc_info.get("cmdOffset", 0),
             )
 
-        # Get decrypted section from binary data
-        decrypted_section = None
-        if "decrypted_bytes" in result_data:
-            decrypted_section = result_data["decrypted_bytes"]
-        elif data.get("decryptedData"):
-            # Convert from Frida's ArrayBuffer format
-            decrypted_section = bytes(data["decryptedData"])
+        # Decrypted section arrives only as binary attachments
+        decrypted_section = result_data["decrypted_bytes"]
+        if (
+            decrypted_section is not None
+            and result_data["bytes_received"] != len(decrypted_section)
+        ):
+            raise DecryptionError(
+                f"Incomplete dump: received {result_data['bytes_received']} "
+                f"of {len(decrypted_section)} bytes"
+            )
 
         return BinaryDumpInfo(
             name=data.get("moduleName", bundle_id),
@@ -409,7 +475,7 @@ class AppDumper:
 
     def _enumerate_binaries(self, session: Any) -> list[dict]:
         """
-        Enumerate all binaries loaded by the app.
+        Enumerate all binaries loaded by the app via a synchronous RPC call.
 
         Args:
             session: Active Frida session.
@@ -417,29 +483,20 @@ class AppDumper:
         Returns:
             List of binary info dicts.
         """
-        result_data = {"received": False, "binaries": []}
-
-        def on_message(message: dict, data: Optional[bytes]):
-            if message["type"] == "send":
-                result_data["binaries"] = message["payload"]
-                result_data["received"] = True
-
-        script = session.create_script(ENUMERATE_BINARIES_SCRIPT)
-        script.on("message", on_message)
+        script = _create_script(session, ENUMERATE_BINARIES_SCRIPT)
         script.load()
-
-        timeout = 10
-        start = time.time()
-        while not result_data["received"] and (time.time() - start) < timeout:
-            time.sleep(0.1)
-
-        return result_data["binaries"]
+        try:
+            return script.exports_sync.enumerate()
+        finally:
+            script.unload()
 
     def _download_app_bundle(self, bundle_id: str) -> Path:
         """
         Download the app bundle from the device.
 
-        This uses SSH/SCP to copy the app bundle to a local temp directory.
+        This streams the bundle over SSH with tar (falling back to SCP) into
+        a local temp directory.
+        The SSH connection is shared across downloads (see _get_ssh_client).
 
         Args:
             bundle_id: App bundle identifier.
@@ -447,90 +504,183 @@ class AppDumper:
         Returns:
             Path to downloaded app bundle.
         """
-        # Get app info to find the bundle path
-        app_info = self.frida.get_app_info(bundle_id)
-        if not app_info:
-            raise AppNotFoundError(bundle_id)
+        # Fail fast if the app is not installed (memoized within a dump)
+        self._get_app_info(bundle_id)
 
         # Create temp directory for download
         temp_dir = Path(tempfile.mkdtemp(prefix="orange_decrypt_"))
         local_bundle_path = temp_dir / f"{bundle_id}.app"
 
-        # Use paramiko to download via SSH
         try:
-            import paramiko
-            from scp import SCPClient
+            ssh = self._get_ssh_client()
 
-            # Connect SSH
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-
-            # Determine SSH host
-            host = self.ssh_host
-            if not host:
-                # Try to get from Frida device
-                # For USB connections, typically use localhost with SSH tunnel
-                # or the device's IP address
-                host = "localhost"  # Assumes SSH tunnel is set up
-
-            logger.debug(f"Connecting via SSH to {host}:{self.ssh_port}")
-            ssh.connect(
-                host,
-                port=self.ssh_port,
-                username=self.ssh_user,
-                password=self.ssh_password,
-                look_for_keys=False,
-                allow_agent=False,
-            )
-
-            # Find the app bundle path on device
+            # Find the app bundle path on device in a single round trip.
             # Apps are typically in /var/containers/Bundle/Application/<UUID>/<name>.app
+            # Reason: try the cheap path match first and only fall back to
+            # reading each Info.plist if that fails, all within one shell so
+            # we pay one SSH round trip and at most one bounded tree walk.
+            apps_root = "/var/containers/Bundle/Application"
             stdin, stdout, stderr = ssh.exec_command(
-                f"find /var/containers/Bundle/Application -name '*.app' -path '*{bundle_id}*' 2>/dev/null | head -1"
+                f"P=$(find {apps_root} -maxdepth 3 -name '*.app' "
+                f"-path '*{bundle_id}*' 2>/dev/null | head -1); "
+                "if [ -z \"$P\" ]; then "
+                f"P=$(find {apps_root} -maxdepth 3 -name '*.app' 2>/dev/null | "
+                "while read d; do "
+                "plutil -p \"$d/Info.plist\" 2>/dev/null | "
+                f"grep -q \"{bundle_id}\" && echo \"$d\" && break; "
+                "done); "
+                "fi; "
+                "echo \"$P\""
             )
             remote_path = stdout.read().decode().strip()
 
-            if not remote_path:
-                # Try alternative: use installed app list
-                stdin, stdout, stderr = ssh.exec_command(
-                    f"find /var/containers/Bundle/Application -name '*.app' 2>/dev/null | "
-                    f"xargs -I{{}} sh -c 'plutil -p {{}}/Info.plist 2>/dev/null | "
-                    f"grep -q \"{bundle_id}\" && echo {{}}' | head -1"
-                )
-                remote_path = stdout.read().decode().strip()
-
             if not remote_path:
                 raise DecryptionError(f"Could not find app bundle for {bundle_id} on device")
 
             logger.debug(f"Found app bundle at: {remote_path}")
 
-            # Download using SCP
-            with SCPClient(ssh.get_transport()) as scp:
-                scp.get(remote_path, str(local_bundle_path), recursive=True)
+            # Stream the bundle as a single tar archive; fall back to SCP
+            # if tar is unavailable on the device
+            if not self._stream_bundle_tar(ssh, remote_path, local_bundle_path):
+                logger.debug("tar streaming failed, falling back to SCP")
+                # Reason: scp is only needed on this fallback path
+                try:
+                    from scp import SCPClient
+                except ImportError:
+                    raise DecryptionError(
+                        "tar streaming failed and scp is not installed. "
+                        "Install with: pip install scp"
+                    )
+                with SCPClient(ssh.get_transport()) as scp:
+                    scp.get(remote_path, str(local_bundle_path), recursive=True)
 
-            ssh.close()
             logger.debug(f"Downloaded app bundle to: {local_bundle_path}")
 
             return local_bundle_path
 
-        except ImportError:
-            raise DecryptionError(
-                "SSH/SCP not available. Install with: pip install paramiko scp"
-            )
+        except DecryptionError:
+            raise
         except Exception as e:
             raise DecryptionError(f"Failed to download app bundle: {e}")
 
+    def _stream_bundle_tar(
+        self, ssh: Any, remote_path: str, local_bundle_path: Path
+    ) -> bool:
+        """
+        Download a remote directory by streaming `tar` output over SSH.
+
+        Reason: recursive SCP does a stat/open/read round trip per file, and
+        app bundles contain thousands of small resources. A single tar stream
+        is limited by the channel window rather than per-file latency.
+
+        Args:
+            ssh: Connected paramiko.SSHClient.
+            remote_path: Bundle directory on the device.
+            local_bundle_path: Where the bundle should end up locally.
+
+        Returns:
+            True if the bundle was extracted, False if tar streaming failed.
+        """
+        remote = PurePosixPath(remote_path)
+        staging_dir = local_bundle_path.parent / ".tar_staging"
+        staging_dir.mkdir(parents=True, exist_ok=True)
+
+        channel = ssh.get_transport().open_session(
+            window_size=TAR_STREAM_WINDOW_SIZE
+        )
+        try:
+            channel.exec_command(
+                f"tar -C {shlex.quote(str(remote.parent))} "
+                f"-cf - {shlex.quote(remote.name)}"
+            )
+            with channel.makefile("rb") as stream:
+                with tarfile.open(fileobj=stream, mode="r|") as tar:
+                    if hasattr(tarfile, "data_filter"):
+                        tar.extractall(staging_dir, filter="data")
+                    else:
+                        tar.extractall(staging_dir)
+
+            if channel.recv_exit_status() != 0:
+                raise DecryptionError("tar exited with non-zero status")
+
+            (staging_dir / remote.name).rename(local_bundle_path)
+            return True
+
+        except (tarfile.TarError, OSError, DecryptionError) as e:
+            logger.debug(f"tar stream of {remote_path} failed: {e}")
+            shutil.rmtree(local_bundle_path, ignore_errors=True)
+            return False
+
+        finally:
+            channel.close()
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
     def _get_ssh_client(self) -> Any:
-        """Get or create SSH client."""
-        if self._ssh_client is None:
+        """
+        Get the shared SSH client, connecting on first use.
+
+        The connection is kept open for the lifetime of the dumper so
+        repeated downloads skip the SSH handshake. Call close() to release it.
+
+        Returns:
+            Connected paramiko.SSHClient.
+
+        Raises:
+            DecryptionError: If paramiko is not installed.
+        """
+        with self._ssh_lock:
+            if self._ssh_client is not None:
+                transport = self._ssh_client.get_transport()
+                if transport is not None and transport.is_active():
+                    return self._ssh_client
+                # Stale connection; drop it and reconnect below
+                self._ssh_client.close()
+                self._ssh_client = None
+
             try:
                 import paramiko
-
-                self._ssh_client = paramiko.SSHClient()
-                self._ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
             except ImportError:
                 raise DecryptionError(
                     "paramiko not installed. Install with: pip install paramiko"
                 )
 
-        return self._ssh_client
+            ssh = paramiko.SSHClient()
+            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+
+            # Determine SSH host
+            host = self.ssh_host
+            if not host:
+                # For USB connections, typically use localhost with SSH tunnel
+                # or the device's IP address
+                host = "localhost"  # Assumes SSH tunnel is set up
+
+            logger.debug(f"Connecting via SSH to {host}:{self.ssh_port}")
+            ssh.connect(
+                host,
+                port=self.ssh_port,
+                username=self.ssh_user,
+                password=self.ssh_password,
+                look_for_keys=False,
+                allow_agent=False,
+            )
+
+            self._ssh_client = ssh
+            return ssh
+
+    def close(self) -> None:
+        """Close the shared SSH connection, if open."""
+        with self._ssh_lock:
+            if self._ssh_client is not None:
+                try:
+                    self._ssh_client.close()
+                except Exception as e:
+                    logger.debug(f"Error closing SSH client: {e}")
+                self._ssh_client = None
+
+    def __enter__(self) -> "AppDumper":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - close SSH connection."""
+        self.close()
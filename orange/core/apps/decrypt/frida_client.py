@@ -8,6 +8,8 @@ and process attachment for decryption operations.
 from __future__ import annotations
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional, Any, Callable
 
@@ -20,6 +22,18 @@ from orange.core.apps.decrypt.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# How long an enumerate_applications() result is reused
+APPS_CACHE_TTL = 5.0  # seconds
+
+# Default time to wait for a device to show up when connecting
+DEFAULT_CONNECT_TIMEOUT = 5.0  # seconds
+
+# First delay between remote connection attempts (doubles each retry)
+REMOTE_RETRY_INITIAL_DELAY = 0.1  # seconds
+
+# Upper bound on concurrent spawn/attach/detach RPCs
+MAX_SPAWN_WORKERS = 8
+
 # Lazy import Frida to provide better error messages
 _frida = None
 
@@ -37,6 +51,22 @@ def _get_frida():
     return _frida
 
 
+def _safe_detach(session: Any) -> None:
+    """Detach a Frida session, logging instead of raising on failure."""
+    try:
+        session.detach()
+    except Exception as e:
+        logger.debug(f"Error detaching session: {e}")
+
+
+def _safe_kill(device: Any, pid: int) -> None:
+    """Kill a process, logging instead of raising on failure."""
+    try:
+        device.kill(pid)
+    except Exception as e:
+        logger.debug(f"Error killing PID {pid}: {e}")
+
+
 @dataclass
 class FridaDeviceInfo:
     """Information about a Frida-accessible device."""
@@ -104,6 +134,8 @@ class FridaClient:
         self,
         udid: Optional[str] = None,
         host: Optional[str] = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        snapshot_apps: bool = False,
     ):
         """
         Initialize Frida client.
@@ -113,11 +145,27 @@ class FridaClient:
                   If None, will auto-detect single USB device.
             host: Remote Frida host (e.g., "localhost:27042").
                   Used when connecting via SSH tunnel.
+            connect_timeout: Seconds to wait for the device to appear
+                  (default 5). Frida populates its USB device list
+                  asynchronously, so a lookup without a timeout can fail
+                  on a device that is actually connected.
+            snapshot_apps: If True, keep the installed app list until
+                  it is invalidated instead of expiring it after
+                  APPS_CACHE_TTL. refresh_apps() invalidates it, and so do
+                  spawn(), spawn_many() and close(), since the cached
+                  entries carry PIDs. Suits short-lived CLI runs where the
+                  app list cannot change underneath us.
         """
         self.udid = udid
         self.host = host
+        self.connect_timeout = connect_timeout
         self._device: Optional[Any] = None
         self._sessions: list[Any] = []
+        self._apps_cache: Optional[list[FridaAppInfo]] = None
+        self._apps_cache_ts = 0.0
+        self._apps_by_id: dict[str, FridaAppInfo] = {}
+        self.snapshot_apps = snapshot_apps
+        self._apps_ttl = float("inf") if snapshot_apps else APPS_CACHE_TTL
 
     @property
     def device(self) -> Any:
@@ -170,15 +218,15 @@ class FridaClient:
             if self.host:
                 # Connect to remote Frida server (SSH tunnel)
                 logger.debug(f"Connecting to remote Frida at {self.host}")
-                self._device = frida.get_device_manager().add_remote_device(self.host)
+                self._device = self._add_remote_device(frida)
             elif self.udid:
                 # Connect to specific USB device
                 logger.debug(f"Connecting to USB device {self.udid}")
-                self._device = frida.get_device(self.udid)
+                self._device = frida.get_device(self.udid, timeout=self.connect_timeout)
             else:
                 # Auto-detect USB device
                 logger.debug("Auto-detecting USB device")
-                self._device = frida.get_usb_device(timeout=5)
+                self._device = frida.get_usb_device(timeout=self.connect_timeout)
 
             logger.info(f"Connected to device: {self._device.name}")
             return self
@@ -197,22 +245,124 @@ class FridaClient:
         except Exception as e:
             raise FridaConnectionError(f"Failed to connect: {e}") from e
 
+    def _add_remote_device(self, frida: Any) -> Any:
+        """
+        Add the remote Frida device, retrying until connect_timeout.
+
+        Retries use exponential backoff and only cover transient errors
+        (server not up yet, timeouts); anything else is raised immediately.
+        """
+        deadline = time.monotonic() + self.connect_timeout
+        delay = REMOTE_RETRY_INITIAL_DELAY
+        while True:
+            try:
+                return frida.get_device_manager().add_remote_device(self.host)
+            except (frida.ServerNotRunningError, frida.TimedOutError):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise
+                logger.debug(f"Remote Frida not ready, retrying in {delay:.1f}s")
+                time.sleep(min(delay, remaining))
+                delay *= 2
+
     def get_installed_apps(self) -> list[FridaAppInfo]:
         """
         List installed applications on device.
 
+        Results are cached for a few seconds (see APPS_CACHE_TTL), or
+        until invalidated in snapshot mode, since enumerating apps is
+        a full device round trip.
+
         Returns:
             List of FridaAppInfo objects.
 
         Raises:
             FridaConnectionError: If not connected.
         """
+        if (
+            self._apps_cache is not None
+            and time.monotonic() - self._apps_cache_ts < self._apps_ttl
+        ):
+            return list(self._apps_cache)
+
         try:
             apps = self.device.enumerate_applications()
-            return [FridaAppInfo.from_frida_app(app) for app in apps]
+            app_infos = [FridaAppInfo.from_frida_app(app) for app in apps]
         except Exception as e:
             raise FridaConnectionError(f"Failed to enumerate apps: {e}") from e
 
+        self._apps_cache = app_infos
+        self._apps_by_id = {app.identifier: app for app in app_infos}
+        self._apps_cache_ts = time.monotonic()
+        return list(app_infos)
+
+    def get_app_pid_map(self) -> dict[str, int]:
+        """
+        Map installed app bundle IDs to their PIDs (0 if not running).
+
+        Derived from the same cached enumeration as get_installed_apps,
+        so the two never disagree and share one device round trip.
+
+        Returns:
+            Dict of bundle identifier to PID.
+
+        Raises:
+            FridaConnectionError: If not connected.
+        """
+        return {app.identifier: app.pid for app in self.get_installed_apps()}
+
+    def _lookup_pid(self, bundle_id: str) -> Optional[int]:
+        """
+        Find the PID of a single app without building app info objects.
+
+        Answers from a fresh cache when there is one; otherwise scans the
+        raw Frida application objects and stops at the first match.
+
+        Args:
+            bundle_id: App bundle identifier.
+
+        Returns:
+            PID (0 if not running), or None if the app is not installed.
+
+        Raises:
+            FridaConnectionError: If not connected or enumeration fails.
+        """
+        if (
+            self._apps_cache is not None
+            and time.monotonic() - self._apps_cache_ts < self._apps_ttl
+        ):
+            app_info = self._apps_by_id.get(bundle_id)
+            return app_info.pid if app_info else None
+
+        try:
+            for app in self.device.enumerate_applications():
+                if app.identifier == bundle_id:
+                    return getattr(app, "pid", 0)
+        except FridaConnectionError:
+            raise
+        except Exception as e:
+            raise FridaConnectionError(f"Failed to enumerate apps: {e}") from e
+        return None
+
+    def refresh_apps(self) -> list[FridaAppInfo]:
+        """
+        Re-query the device for installed apps, replacing any snapshot.
+
+        Returns:
+            List of FridaAppInfo objects.
+
+        Raises:
+            FridaConnectionError: If not connected.
+        """
+        self.invalidate_apps_cache()
+        return self.get_installed_apps()
+
+    def invalidate_apps_cache(self) -> None:
+        """Drop cached app info so the next lookup queries the device."""
+        self._apps_cache = None
+        self._apps_by_id = {}
+        self._apps_cache_ts = 0.0
+
     def get_running_processes(self) -> list[dict]:
         """
         List running processes on device.
@@ -239,11 +389,8 @@ class FridaClient:
         Returns:
             FridaAppInfo if found, None otherwise.
         """
-        apps = self.get_installed_apps()
-        for app in apps:
-            if app.identifier == bundle_id:
-                return app
-        return None
+        self.get_installed_apps()  # Refreshes the index if stale
+        return self._apps_by_id.get(bundle_id)
 
     def spawn(
         self,
@@ -269,8 +416,7 @@ class FridaClient:
             AppNotRunningError: If app fails to spawn.
         """
         # Verify app exists
-        app_info = self.get_app_info(bundle_id)
-        if not app_info:
+        if self._lookup_pid(bundle_id) is None:
             raise AppNotFoundError(bundle_id)
 
         try:
@@ -292,11 +438,94 @@ class FridaClient:
             self.device.resume(pid)
             logger.debug(f"Resumed PID: {pid}")
 
+            # The app's PID changed; don't serve it from the cache
+            self.invalidate_apps_cache()
+
             return session
 
         except Exception as e:
             raise AppNotRunningError(bundle_id, str(e)) from e
 
+    def spawn_many(self, bundle_ids: list[str]) -> list[Any]:
+        """
+        Spawn several apps and attach to each of them.
+
+        The same steps as spawn(), but each stage runs for all apps
+        before the next begins. Frida RPCs block, so the spawn, attach
+        and resume calls of a stage are overlapped on a thread pool.
+        Wall time is then about one round trip per stage, not one per app.
+
+        Args:
+            bundle_ids: App bundle identifiers to spawn.
+
+        Returns:
+            Frida session objects, in the same order as bundle_ids.
+
+        Raises:
+            AppNotFoundError: If any app is not installed (nothing is spawned).
+            AppNotRunningError: If an app fails to spawn, attach or resume.
+                Sessions already attached are detached and every spawned
+                PID is killed before raising.
+        """
+        if not bundle_ids:
+            return []
+
+        # Verify every app with a single enumeration
+        installed = self.get_app_pid_map()
+        for bundle_id in bundle_ids:
+            if bundle_id not in installed:
+                raise AppNotFoundError(bundle_id)
+
+        device = self.device
+        workers = min(MAX_SPAWN_WORKERS, len(bundle_ids))
+
+        def run_stage(
+            executor: ThreadPoolExecutor, func: Callable[[Any], Any], items: list[Any]
+        ) -> tuple[list[Any], list[AppNotRunningError]]:
+            # Reason: collect every result before returning so a failure in
+            # one app doesn't leave the others' futures unobserved, and so
+            # the caller knows which apps got through the stage.
+            futures = [executor.submit(func, item) for item in items]
+            results: list[Any] = []
+            errors: list[AppNotRunningError] = []
+            for bundle_id, future in zip(bundle_ids, futures, strict=True):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(None)
+                    errors.append(AppNotRunningError(bundle_id, str(e)))
+            return results, errors
+
+        sessions: list[Any] = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            logger.debug(f"Spawning {len(bundle_ids)} apps")
+            pids, errors = run_stage(
+                executor, lambda bid: device.spawn([bid]), bundle_ids
+            )
+
+            if not errors:
+                sessions, errors = run_stage(executor, device.attach, pids)
+
+            if not errors:
+                _, errors = run_stage(executor, device.resume, pids)
+
+            if errors:
+                # Roll back so no app is left suspended or half-attached
+                attached = [s for s in sessions if s is not None]
+                list(executor.map(_safe_detach, attached))
+                spawned = [pid for pid in pids if pid is not None]
+                list(executor.map(lambda pid: _safe_kill(device, pid), spawned))
+                self.invalidate_apps_cache()
+                raise errors[0]
+
+            self._sessions.extend(sessions)
+            logger.debug(f"Resumed PIDs: {pids}")
+
+        # The apps' PIDs changed; don't serve them from the cache
+        self.invalidate_apps_cache()
+
+        return sessions
+
     def attach(
         self,
         pid: Optional[int] = None,
@@ -323,12 +552,12 @@ class FridaClient:
 
         # Find PID from bundle_id if needed
         if pid is None and bundle_id:
-            app_info = self.get_app_info(bundle_id)
-            if not app_info:
+            app_pid = self._lookup_pid(bundle_id)
+            if app_pid is None:
                 raise AppNotFoundError(bundle_id)
-            if app_info.pid == 0:
+            if app_pid == 0:
                 raise AppNotRunningError(bundle_id, "App is not running")
-            pid = app_info.pid
+            pid = app_pid
 
         try:
             logger.debug(f"Attaching to PID: {pid}")
@@ -365,14 +594,17 @@ class FridaClient:
         This should be called when done with decryption operations
         to clean up resources.
         """
-        # Detach from all sessions
-        for session in self._sessions:
-            try:
-                session.detach()
-            except Exception as e:
-                logger.debug(f"Error detaching session: {e}")
+        # Detach from all sessions; each detach is a device round trip,
+        # so overlap them instead of paying for them one after another
+        if len(self._sessions) == 1:
+            _safe_detach(self._sessions[0])
+        elif self._sessions:
+            workers = min(MAX_SPAWN_WORKERS, len(self._sessions))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(_safe_detach, self._sessions))
 
         self._sessions.clear()
+        self.invalidate_apps_cache()
         self._device = None
         logger.debug("Frida client closed")
 
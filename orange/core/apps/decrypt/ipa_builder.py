@@ -7,21 +7,234 @@ from app bundles with decrypted binaries.
 
 from __future__ import annotations
 
+import functools
 import logging
+import mmap
+import os
+import plistlib
 import shutil
+import sys
 import tempfile
 import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Iterator, Optional, TYPE_CHECKING
 
+from orange.constants import DEFAULT_CHUNK_SIZE, INCOMPRESSIBLE_SUFFIXES
 from orange.core.apps.decrypt.macho import MachOParser
 from orange.core.apps.decrypt.exceptions import DecryptionError
 
+try:
+    # Optional drop-in zlib replacement with SIMD-accelerated deflate
+    from zlib_ng import zlib_ng as _zlib
+except ImportError:
+    import zlib as _zlib
+
 if TYPE_CHECKING:
     from orange.core.apps.decrypt.dumper import BinaryDumpInfo
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads used to patch framework binaries in parallel
+MAX_PATCH_WORKERS = 8
+
+# zlib level used for deflated entries unless the caller picks another;
+# level 1 is several times faster for roughly 10% larger output
+DEFAULT_COMPRESSLEVEL = 6
+
+# Files up to this size are deflated on worker threads ahead of the writer;
+# larger ones are compressed by zipfile itself to bound memory use
+PRECOMPRESS_MAX_SIZE = 16 * 1024 * 1024  # 16 MB
+COMPRESS_WORKERS = os.cpu_count() or 1
+
+# zipfile has no public API for appending pre-deflated data or, before
+# Python 3.13, for a per-entry compression level. The private members used
+# for both are unchanged on these versions; elsewhere entries take the
+# public ZipFile.open(zinfo, "w") path at zipfile's default level.
+_ZIPFILE_INTERNALS = (
+    (3, 10) <= sys.version_info[:2] <= (3, 14)
+    and hasattr(zipfile.ZipFile, "_writecheck")
+    and hasattr(zipfile.ZipInfo, "FileHeader")
+)
+
+
+def _compress_type_for(file_path: str | os.PathLike[str]) -> int:
+    """Pick the ZIP compression method for a file based on its suffix."""
+    if os.path.splitext(file_path)[1].lower() in INCOMPRESSIBLE_SUFFIXES:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _clone_bundle(src: Path, dst: Path) -> None:
+    """
+    Clone an app bundle using hard links instead of copying file data.
+
+    Only a handful of binaries in the clone are modified, so everything
+    else can share inodes with the source. Hard links are used when source
+    and destination are on the same filesystem; otherwise, or if linking
+    fails, the bundle is copied normally. Symlinks are recreated as
+    symlinks. Files that will be modified must be detached first with
+    _break_hardlink.
+
+    Args:
+        src: Source bundle directory.
+        dst: Destination bundle directory.
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+
+    if os.stat(src).st_dev == os.stat(dst.parent).st_dev:
+        try:
+            shutil.copytree(
+                src, dst, symlinks=True, copy_function=os.link, dirs_exist_ok=True
+            )
+            return
+        except (shutil.Error, OSError) as e:
+            # Reason: some filesystems refuse hard links (EPERM, EMLINK);
+            # start over with a plain copy rather than a half-linked tree.
+            logger.debug(f"Hard-link clone failed, copying instead: {e}")
+            shutil.rmtree(dst, ignore_errors=True)
+
+    shutil.copytree(src, dst, symlinks=True, dirs_exist_ok=True)
+
+
+def _break_hardlink(file_path: Path) -> None:
+    """Give a hard-linked file its own inode so edits don't touch the source."""
+    if file_path.stat().st_nlink <= 1:
+        return
+    tmp_path = file_path.with_name(file_path.name + ".orange-tmp")
+    shutil.copy2(file_path, tmp_path)
+    os.replace(tmp_path, file_path)
+
+
+@functools.lru_cache(maxsize=128)
+def _read_plist(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """
+    Parse a plist file, memoized on path and file metadata.
+
+    Args:
+        path_str: Path to the plist file.
+        mtime_ns: File modification time, so rewrites invalidate the entry.
+        size: File size, as a second invalidation key.
+
+    Returns:
+        Parsed plist dictionary. Callers must not mutate it.
+    """
+    with open(path_str, "rb") as f:
+        data = f.read()
+    # Reason: iOS bundles ship binary plists; naming the format skips the
+    # auto-detection pass plistlib otherwise does.
+    if data.startswith(b"bplist00"):
+        return plistlib.loads(data, fmt=plistlib.FMT_BINARY)
+    return plistlib.loads(data)
+
+
+def _walk(root: str, prefix: str = "") -> Iterator[tuple[str, str, bool, bool]]:
+    """
+    Recursively walk a directory with os.scandir.
+
+    DirEntry caches the file type from the directory listing, so checking
+    for files and symlinks costs no extra stat calls. Symlinked
+    directories are reported as symlinks and not descended into.
+
+    Args:
+        root: Directory to walk.
+        prefix: Relative path of root, prepended to yielded relative paths.
+
+    Yields:
+        Tuples of (full_path, rel_path, is_symlink, is_file), where rel_path
+        uses "/" separators as required for ZIP archive names.
+    """
+    with os.scandir(root) as it:
+        entries = list(it)
+    for entry in entries:
+        rel_path = prefix + entry.name
+        if entry.is_symlink():
+            yield entry.path, rel_path, True, False
+        elif entry.is_dir(follow_symlinks=False):
+            yield from _walk(entry.path, rel_path + "/")
+        else:
+            yield entry.path, rel_path, False, entry.is_file(follow_symlinks=False)
+
+
+def _deflate_file(
+    file_path: str, compresslevel: int = DEFAULT_COMPRESSLEVEL
+) -> tuple[bytes, int, int]:
+    """
+    Read and raw-deflate a file for a ZIP entry.
+
+    zlib releases the GIL while compressing, so this runs in parallel
+    on a thread pool.
+
+    Returns:
+        Tuple of (compressed bytes, CRC-32, uncompressed size).
+    """
+    with open(file_path, "rb") as f:
+        data = f.read()
+    compressor = _zlib.compressobj(compresslevel, _zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    return compressed, _zlib.crc32(data), len(data)
+
+
+def _copy_file_into_zip(
+    zf: zipfile.ZipFile,
+    file_path: str,
+    arcname: str,
+    compress_type: int,
+    compresslevel: Optional[int] = None,
+) -> None:
+    """
+    Stream a file into an open ZipFile in DEFAULT_CHUNK_SIZE pieces.
+
+    ZipFile.write copies in 8 KB reads; the larger chunk cuts the
+    read/write call count by over a hundred times on big binaries, and
+    memory stays bounded by the chunk size regardless of file size.
+    """
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+    zinfo.compress_type = compress_type
+    if hasattr(zipfile.ZipInfo, "compress_level"):
+        zinfo.compress_level = compresslevel
+    elif _ZIPFILE_INTERNALS:
+        zinfo._compresslevel = compresslevel
+    with open(file_path, "rb") as src, zf.open(zinfo, "w") as dst:
+        shutil.copyfileobj(src, dst, DEFAULT_CHUNK_SIZE)
+
+
+def _write_precompressed(
+    zf: zipfile.ZipFile,
+    zinfo: zipfile.ZipInfo,
+    compressed: bytes,
+    crc: int,
+    file_size: int,
+) -> None:
+    """
+    Append an already-deflated entry to an open ZipFile.
+
+    zipfile has no public API for raw writes, so this mirrors what
+    ZipFile.open(..., "w") does: write the local header and data at the
+    end of the archive and register the entry for the central directory.
+    This is the only place that touches ZipFile internals for writing, and
+    callers must only use it when _ZIPFILE_INTERNALS is true.
+    """
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.flag_bits = 0
+    zinfo.file_size = file_size
+    zinfo.compress_size = len(compressed)
+    zinfo.CRC = crc
+    zip64 = max(file_size, len(compressed)) > zipfile.ZIP64_LIMIT
+
+    zf.fp.seek(zf.start_dir)
+    zinfo.header_offset = zf.fp.tell()
+    zf._writecheck(zinfo)
+    zf._didModify = True
+
+    zf.fp.write(zinfo.FileHeader(zip64))
+    zf.fp.write(compressed)
+    zf.start_dir = zf.fp.tell()
+
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+
 
 class IPABuilder:
     """
@@ -41,17 +254,35 @@ class IPABuilder:
             output_path=Path("./Netflix-decrypted.ipa"),
             main_binary_dump=dump_info,
         )
+
+        # Faster rebuilds while iterating: no deflate, or zlib level 1
+        builder = IPABuilder(compression=zipfile.ZIP_STORED)
+        builder = IPABuilder(compresslevel=1)
     """
 
-    def __init__(self, work_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        work_dir: Optional[Path] = None,
+        compression: Optional[int] = None,
+        compresslevel: int = DEFAULT_COMPRESSLEVEL,
+    ):
         """
         Initialize IPA builder.
 
         Args:
             work_dir: Working directory for assembly.
                      If None, uses system temp directory.
+            compression: zipfile compression method for the IPA.
+                     None means ZIP_DEFLATED. ZIP_STORED skips compression
+                     entirely, which is the fastest option when rebuilding
+                     repeatedly during development.
+            compresslevel: zlib level (0-9) for deflated entries.
+                     Level 1 gives most of the speed of ZIP_STORED at a
+                     modest size cost.
         """
         self.work_dir = work_dir
+        self.compression = zipfile.ZIP_DEFLATED if compression is None else compression
+        self.compresslevel = compresslevel
 
     def build(
         self,
@@ -90,11 +321,11 @@ class IPABuilder:
             payload_dir = work_dir / "Payload"
             payload_dir.mkdir(exist_ok=True)
 
-            # Copy app bundle to Payload
+            # Clone app bundle into Payload
             app_name = app_bundle_path.name
             dest_app_path = payload_dir / app_name
-            logger.debug(f"Copying app bundle to {dest_app_path}")
-            shutil.copytree(app_bundle_path, dest_app_path, symlinks=True)
+            logger.debug(f"Cloning app bundle to {dest_app_path}")
+            _clone_bundle(app_bundle_path, dest_app_path)
 
             # Replace main binary with decrypted version
             if main_binary_dump.decrypted_section and main_binary_dump.encryption_info:
@@ -105,9 +336,7 @@ class IPABuilder:
 
             # Replace framework binaries if provided
             if framework_dumps:
-                for fw_dump in framework_dumps:
-                    if fw_dump.decrypted_section and fw_dump.encryption_info:
-                        self._replace_framework_binary(dest_app_path, fw_dump)
+                self._replace_framework_binaries(dest_app_path, framework_dumps)
 
             # Create IPA (ZIP file)
             output_path = Path(output_path)
@@ -160,63 +389,112 @@ class IPABuilder:
                     binary_path = candidate
                     break
             else:
-                raise DecryptionError(
-                    f"Could not find main executable in {app_path}"
-                )
+                raise DecryptionError(f"Could not find main executable in {app_path}")
 
         logger.debug(f"Replacing binary: {binary_path}")
+        self._patch_binary_file(binary_path, dump_info)
+        logger.debug(f"Wrote decrypted binary: {binary_path}")
 
-        # Read original binary
-        original_data = binary_path.read_bytes()
+    @staticmethod
+    def _patch_binary_file(binary_path: Path, dump_info: "BinaryDumpInfo") -> None:
+        """
+        Decrypt a binary file in place through a memory map.
 
-        # Create decrypted binary
-        decrypted_data = MachOParser.patch_binary_cryptid(
-            binary_data=original_data,
-            decrypted_section=dump_info.decrypted_section,
-            encryption_info=dump_info.encryption_info,
-        )
+        Reason: only the decrypted range and the cryptid field change, so
+        mapping the file avoids reading the whole binary into memory and
+        rewriting it; just the dirty pages are written back.
 
-        # Write decrypted binary
-        binary_path.write_bytes(decrypted_data)
-        logger.debug(f"Wrote decrypted binary: {len(decrypted_data)} bytes")
+        Args:
+            binary_path: Binary file to patch.
+            dump_info: Binary dump information.
+        """
+        # The bundle clone shares inodes with the source bundle
+        _break_hardlink(binary_path)
 
-    def _replace_framework_binary(
+        with open(binary_path, "r+b") as f:
+            with mmap.mmap(f.fileno(), 0) as mm:
+                MachOParser.patch_binary_cryptid_inplace(
+                    mm,
+                    decrypted_section=dump_info.decrypted_section,
+                    encryption_info=dump_info.encryption_info,
+                )
+                mm.flush()
+
+    def _replace_framework_binaries(
         self,
         app_path: Path,
+        framework_dumps: list["BinaryDumpInfo"],
+    ) -> None:
+        """
+        Replace framework binaries with decrypted versions in parallel.
+
+        Each framework is an independent read/patch/write, so they are
+        dispatched to a thread pool. The first failure is re-raised once
+        all workers have finished.
+
+        Args:
+            app_path: Path to the .app directory.
+            framework_dumps: Framework dump infos.
+        """
+        dumps = [
+            d for d in framework_dumps if d.decrypted_section and d.encryption_info
+        ]
+        if not dumps:
+            return
+
+        # Find the frameworks in the app bundle once, not per dump
+        frameworks_dir = app_path / "Frameworks"
+        if not frameworks_dir.exists():
+            logger.warning(f"Frameworks directory not found: {frameworks_dir}")
+            return
+        # Index by framework name (the binary inside is normally named
+        # the same) so each dump is an O(1) lookup
+        framework_map = {
+            entry.name.removesuffix(".framework"): Path(entry.path)
+            for entry in os.scandir(frameworks_dir)
+            if entry.name.endswith(".framework")
+        }
+
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_PATCH_WORKERS, len(dumps))
+        ) as executor:
+            futures = [
+                executor.submit(self._replace_framework_binary, d, framework_map)
+                for d in dumps
+            ]
+        for future in futures:
+            future.result()
+
+    def _replace_framework_binary(
+        self,
         dump_info: "BinaryDumpInfo",
+        framework_map: dict[str, Path],
     ) -> None:
         """
         Replace a framework binary with a decrypted version.
 
         Args:
-            app_path: Path to the .app directory.
             dump_info: Framework dump information.
+            framework_map: The bundle's *.framework directories, keyed by
+                framework name.
         """
         # Extract framework name from path
         # e.g., /path/to/App.app/Frameworks/SomeFramework.framework/SomeFramework
         framework_name = dump_info.name
 
-        # Find the framework in the app bundle
-        frameworks_dir = app_path / "Frameworks"
-        if not frameworks_dir.exists():
-            logger.warning(f"Frameworks directory not found: {frameworks_dir}")
-            return
+        framework_path = framework_map.get(framework_name)
+        if framework_path is not None:
+            candidates = [framework_path]
+        else:
+            # Reason: a framework's executable can be named differently
+            # from its directory; fall back to checking every framework.
+            candidates = list(framework_map.values())
 
-        # Look for matching framework
-        for framework_path in frameworks_dir.glob("*.framework"):
+        for framework_path in candidates:
             binary_path = framework_path / framework_name
             if binary_path.exists():
                 logger.debug(f"Replacing framework binary: {binary_path}")
-
-                original_data = binary_path.read_bytes()
-
-                decrypted_data = MachOParser.patch_binary_cryptid(
-                    binary_data=original_data,
-                    decrypted_section=dump_info.decrypted_section,
-                    encryption_info=dump_info.encryption_info,
-                )
-
-                binary_path.write_bytes(decrypted_data)
+                self._patch_binary_file(binary_path, dump_info)
                 return
 
         logger.warning(f"Framework binary not found: {framework_name}")
@@ -231,14 +509,13 @@ class IPABuilder:
         Returns:
             Executable name or None if not found.
         """
-        if not info_plist.exists():
+        try:
+            st = os.stat(info_plist)
+        except OSError:
             return None
 
         try:
-            import plistlib
-
-            with open(info_plist, "rb") as f:
-                plist = plistlib.load(f)
+            plist = _read_plist(str(info_plist), st.st_mtime_ns, st.st_size)
             return plist.get("CFBundleExecutable")
         except Exception as e:
             logger.debug(f"Failed to read Info.plist: {e}")
@@ -248,27 +525,77 @@ class IPABuilder:
         """
         Create IPA file from Payload directory.
 
+        Compressible files are deflated in parallel on a thread pool while
+        the ZIP is written sequentially in directory order. A bounded window
+        of in-flight files keeps memory use in check.
+
         Args:
             payload_dir: Path to Payload directory.
             output_path: Output IPA path.
         """
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            # Walk the Payload directory
-            for file_path in payload_dir.rglob("*"):
-                if file_path.is_file():
-                    # Calculate archive name (relative to parent of Payload)
-                    arcname = file_path.relative_to(payload_dir.parent)
-                    zf.write(file_path, arcname)
-                elif file_path.is_symlink():
-                    # Handle symlinks
-                    arcname = file_path.relative_to(payload_dir.parent)
+        window = COMPRESS_WORKERS * 4
+        pending: deque[tuple[str, str, int, Optional[Future]]] = deque()
+
+        with (
+            zipfile.ZipFile(
+                output_path, "w", self.compression, compresslevel=self.compresslevel
+            ) as zf,
+            ThreadPoolExecutor(max_workers=COMPRESS_WORKERS) as executor,
+        ):
+            # Walk the Payload directory; archive names are relative to
+            # the parent of Payload
+            arc_prefix = payload_dir.name + "/"
+            for full_path, rel_path, is_symlink, is_file in _walk(
+                str(payload_dir), arc_prefix
+            ):
+                if is_symlink:
                     # Create a ZipInfo for the symlink
-                    info = zipfile.ZipInfo(str(arcname))
+                    info = zipfile.ZipInfo(rel_path)
                     info.external_attr = 0xA1ED0000  # Symlink
-                    zf.writestr(info, str(file_path.readlink()))
+                    zf.writestr(info, os.readlink(full_path))
+                elif is_file:
+                    # Reason: paths stay plain strings from the walk to
+                    # the ZIP writer; no Path objects per file.
+                    compress_type = self.compression
+                    if compress_type == zipfile.ZIP_DEFLATED:
+                        compress_type = _compress_type_for(full_path)
+                    future = None
+                    if (
+                        _ZIPFILE_INTERNALS
+                        and compress_type == zipfile.ZIP_DEFLATED
+                        and os.stat(full_path).st_size <= PRECOMPRESS_MAX_SIZE
+                    ):
+                        future = executor.submit(
+                            _deflate_file, full_path, self.compresslevel
+                        )
+                    pending.append((full_path, rel_path, compress_type, future))
+                    if len(pending) >= window:
+                        self._write_entry(zf, *pending.popleft())
+
+            while pending:
+                self._write_entry(zf, *pending.popleft())
 
         logger.info(f"Created IPA: {output_path}")
 
+    def _write_entry(
+        self,
+        zf: zipfile.ZipFile,
+        file_path: str,
+        arcname: str,
+        compress_type: int,
+        future: Optional[Future],
+    ) -> None:
+        """Write one file to the IPA, using precompressed data if available."""
+        if future is None:
+            _copy_file_into_zip(
+                zf, file_path, arcname, compress_type, self.compresslevel
+            )
+            return
+
+        compressed, crc, file_size = future.result()
+        zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+        _write_precompressed(zf, zinfo, compressed, crc, file_size)
+
 
 def build_ipa_simple(
     app_bundle: Path,
@@ -298,12 +625,13 @@ def build_ipa_simple(
         payload_dir = work_dir / "Payload"
         payload_dir.mkdir()
 
-        # Copy app bundle
+        # Clone app bundle
         dest_app = payload_dir / app_bundle.name
-        shutil.copytree(app_bundle, dest_app, symlinks=True)
+        _clone_bundle(app_bundle, dest_app)
 
-        # Replace binary
+        # Replace binary (unlink first so the hard-linked source is untouched)
         binary_path = dest_app / executable_name
+        binary_path.unlink(missing_ok=True)
         binary_path.write_bytes(decrypted_binary)
 
         # Create ZIP
@@ -311,10 +639,11 @@ def build_ipa_simple(
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            for file_path in payload_dir.rglob("*"):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(payload_dir.parent)
-                    zf.write(file_path, arcname)
+            for full_path, rel_path, _, is_file in _walk(
+                str(payload_dir), payload_dir.name + "/"
+            ):
+                if is_file:
+                    _copy_file_into_zip(zf, full_path, rel_path, zipfile.ZIP_DEFLATED)
 
         return output_path
 
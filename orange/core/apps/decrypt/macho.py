@@ -12,14 +12,18 @@ References:
 
 from __future__ import annotations
 
+import mmap
+import os
 import struct
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Optional, BinaryIO
 
 from orange.core.apps.decrypt.exceptions import MachOParseError
 
+# Log calls here pass %-style arguments, so parsing many binaries does no
+# message formatting unless debug logging is enabled
 logger = logging.getLogger(__name__)
 
 
@@ -61,12 +65,44 @@ MACH_HEADER_64_SIZE = 32  # 64-bit
 FAT_HEADER_SIZE = 8
 FAT_ARCH_SIZE = 20
 
-
-@dataclass
+# Precompiled struct formats, keyed by byte order ("<" or ">") where the
+# order depends on the binary; avoids re-parsing format strings per field
+_U32_LE = struct.Struct("<I")
+_U32_BE = struct.Struct(">I")
+_U32 = {"<": _U32_LE, ">": _U32_BE}
+_HDR_64 = {"<": struct.Struct("<IIIIIIII"), ">": struct.Struct(">IIIIIIII")}
+_HDR_32 = {"<": struct.Struct("<IIIIIII"), ">": struct.Struct(">IIIIIII")}
+_LC = {"<": struct.Struct("<II"), ">": struct.Struct(">II")}
+_ENC = {"<": struct.Struct("<III"), ">": struct.Struct(">III")}
+_FAT_ARCH = {"<": struct.Struct("<IIIII"), ">": struct.Struct(">IIIII")}
+
+# Thin Mach-O magic (read little-endian) -> (is_64bit, byte order)
+_MH_LAYOUT = {
+    MachOMagic.MH_MAGIC_64: (True, "<"),
+    MachOMagic.MH_CIGAM_64: (True, ">"),
+    MachOMagic.MH_MAGIC: (False, "<"),
+    MachOMagic.MH_CIGAM: (False, ">"),
+}
+
+# Every valid first word of a Mach-O or FAT file, read little-endian
+_MACHO_MAGICS = frozenset(int(m) for m in MachOMagic)
+
+# LC_ENCRYPTION_INFO(_64) as plain ints, matched against unpacked cmd values
+_ENCRYPTION_CMDS = frozenset(
+    {int(LoadCommand.LC_ENCRYPTION_INFO), int(LoadCommand.LC_ENCRYPTION_INFO_64)}
+)
+
+# Raw cputype -> MachOCPUType; unknown values are kept as plain ints
+_CPUTYPE_BY_VALUE = {int(m): m for m in MachOCPUType}
+
+
+@dataclass(slots=True, frozen=True)
 class EncryptionInfo:
     """
     Encryption information from LC_ENCRYPTION_INFO(_64).
 
+    Immutable: it describes a load command as read from the file.
+
     Attributes:
         cryptoff: File offset to start of encrypted data.
         cryptsize: Size of encrypted data in bytes.
@@ -85,7 +121,7 @@ class EncryptionInfo:
         return self.cryptid != 0
 
 
-@dataclass
+@dataclass(slots=True)
 class MachOSlice:
     """
     Information about a single architecture slice in a Mach-O file.
@@ -102,11 +138,14 @@ class MachOSlice:
     encryption_info: Optional[EncryptionInfo] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MachOBinary:
     """
     Parsed Mach-O binary information.
 
+    The first (encrypted) encryption info is resolved once at construction,
+    so treat slices as read-only afterwards.
+
     Attributes:
         path: Original file path (if known).
         is_fat: Whether this is a FAT (universal) binary.
@@ -116,25 +155,35 @@ class MachOBinary:
     path: Optional[str]
     is_fat: bool
     slices: list[MachOSlice]
+    _first_enc: Optional[EncryptionInfo] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _first_encrypted: Optional[EncryptionInfo] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Record the first and first encrypted encryption info in one pass."""
+        for s in self.slices:
+            info = s.encryption_info
+            if info is None:
+                continue
+            if self._first_enc is None:
+                self._first_enc = info
+            if info.is_encrypted:
+                self._first_encrypted = info
+                break
 
     @property
     def encryption_info(self) -> Optional[EncryptionInfo]:
         """Get encryption info from the first encrypted slice."""
-        for s in self.slices:
-            if s.encryption_info and s.encryption_info.is_encrypted:
-                return s.encryption_info
-        # Return first slice's encryption info even if not encrypted
-        for s in self.slices:
-            if s.encryption_info:
-                return s.encryption_info
-        return None
+        # Fall back to the first slice's encryption info even if not encrypted
+        return self._first_encrypted or self._first_enc
 
     @property
     def is_encrypted(self) -> bool:
         """Check if any slice is encrypted."""
-        return any(
-            s.encryption_info and s.encryption_info.is_encrypted for s in self.slices
-        )
+        return self._first_encrypted is not None
 
 
 class MachOParser:
@@ -155,13 +204,24 @@ class MachOParser:
     """
 
     @staticmethod
-    def parse(data: bytes, path: Optional[str] = None) -> MachOBinary:
+    def parse(
+        data: bytes,
+        path: Optional[str] = None,
+        stop_on_encrypted: bool = False,
+    ) -> MachOBinary:
         """
         Parse a Mach-O binary from bytes.
 
+        The data is wrapped in a memoryview, so FAT slices are parsed
+        through views rather than copies. Any bytes-like object works,
+        including bytearray and mmap.
+
         Args:
             data: Binary data to parse.
             path: Optional path for reference.
+            stop_on_encrypted: For FAT binaries, stop at the first encrypted
+                slice instead of parsing every architecture. The result
+                then only lists the slices up to that one.
 
         Returns:
             MachOBinary with parsed information.
@@ -171,80 +231,113 @@ class MachOParser:
         """
         if len(data) < 4:
             raise MachOParseError("Data too small to be a Mach-O binary")
+        if not MachOParser._is_macho(data):
+            magic = _U32_LE.unpack_from(data, 0)[0]
+            raise MachOParseError(f"Invalid Mach-O magic: 0x{magic:08x}")
 
-        magic = struct.unpack("<I", data[:4])[0]
+        # Reason: release the view before returning so callers can still
+        # resize a bytearray or close an mmap they passed in.
+        with memoryview(data) as mv:
+            magic = _U32_LE.unpack_from(mv, 0)[0]
 
-        # Check for FAT binary
-        if magic in (MachOMagic.FAT_MAGIC, MachOMagic.FAT_CIGAM):
-            return MachOParser._parse_fat(data, path)
+            # Check for FAT binary
+            if magic in (MachOMagic.FAT_MAGIC, MachOMagic.FAT_CIGAM):
+                return MachOParser._parse_fat(mv, path, stop_on_encrypted)
 
-        # Single architecture
-        return MachOParser._parse_single(data, 0, len(data), path)
+            # Single architecture
+            return MachOParser._parse_single(mv, 0, len(mv), path)
+
+    @staticmethod
+    def parse_file(path: str | os.PathLike[str]) -> MachOBinary:
+        """
+        Parse a Mach-O binary file without reading it into memory.
+
+        The file is memory-mapped read-only, so only the pages holding
+        headers and load commands are actually read from disk.
+
+        Args:
+            path: Path to the binary.
+
+        Returns:
+            MachOBinary with parsed information.
+
+        Raises:
+            MachOParseError: If the binary cannot be parsed.
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < 4:
+                raise MachOParseError("Data too small to be a Mach-O binary")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return MachOParser.parse(mm, os.fspath(path))
 
     @staticmethod
-    def _parse_fat(data: bytes, path: Optional[str]) -> MachOBinary:
+    def _parse_fat(
+        data: memoryview, path: Optional[str], stop_on_encrypted: bool = False
+    ) -> MachOBinary:
         """Parse a FAT (universal) binary."""
-        magic = struct.unpack(">I", data[:4])[0]
+        magic = _U32_BE.unpack_from(data, 0)[0]
         is_swap = magic == MachOMagic.FAT_CIGAM
+        endian = "<" if is_swap else ">"
 
         # Read number of architectures
-        nfat_arch = struct.unpack(">I" if not is_swap else "<I", data[4:8])[0]
-        logger.debug(f"FAT binary with {nfat_arch} architectures")
+        nfat_arch = _U32[endian].unpack_from(data, 4)[0]
+        logger.debug("FAT binary with %d architectures", nfat_arch)
 
-        slices = []
+        # Preallocate, bounded by how many fat_arch entries the data can
+        # hold so a corrupt count cannot force a huge allocation
+        slices: list[Optional[MachOSlice]] = [None] * min(
+            nfat_arch, max(0, (len(data) - FAT_HEADER_SIZE) // FAT_ARCH_SIZE)
+        )
+        count = 0
         offset = FAT_HEADER_SIZE
+        fat_arch = _FAT_ARCH[endian]
 
         for i in range(nfat_arch):
             # Read fat_arch structure
-            fmt = ">IIIII" if not is_swap else "<IIIII"
-            cpu_type, cpu_subtype, arch_offset, arch_size, align = struct.unpack(
-                fmt, data[offset : offset + FAT_ARCH_SIZE]
+            cpu_type, cpu_subtype, arch_offset, arch_size, align = fat_arch.unpack_from(
+                data, offset
             )
             offset += FAT_ARCH_SIZE
 
-            # Parse this slice
-            slice_data = data[arch_offset : arch_offset + arch_size]
-            slice_info = MachOParser._parse_slice(
-                slice_data, arch_offset, arch_size, cpu_type, cpu_subtype
-            )
+            # Parse this slice through a view (no copy of the slice)
+            with data[arch_offset : arch_offset + arch_size] as slice_data:
+                slice_info = MachOParser._parse_slice(
+                    slice_data, arch_offset, arch_size, cpu_type, cpu_subtype
+                )
             if slice_info:
-                slices.append(slice_info)
-
+                slices[count] = slice_info
+                count += 1
+                if (
+                    stop_on_encrypted
+                    and slice_info.encryption_info
+                    and slice_info.encryption_info.is_encrypted
+                ):
+                    break
+
+        # Drop the tail left by unparseable slices or an early stop
+        del slices[count:]
         return MachOBinary(path=path, is_fat=True, slices=slices)
 
     @staticmethod
     def _parse_single(
-        data: bytes, offset: int, size: int, path: Optional[str]
+        data: memoryview, offset: int, size: int, path: Optional[str]
     ) -> MachOBinary:
         """Parse a single-architecture Mach-O binary."""
-        magic = struct.unpack("<I", data[:4])[0]
-
-        if magic == MachOMagic.MH_MAGIC_64:
-            is_64bit = True
-            is_swap = False
-        elif magic == MachOMagic.MH_CIGAM_64:
-            is_64bit = True
-            is_swap = True
-        elif magic == MachOMagic.MH_MAGIC:
-            is_64bit = False
-            is_swap = False
-        elif magic == MachOMagic.MH_CIGAM:
-            is_64bit = False
-            is_swap = True
-        else:
+        magic = _U32_LE.unpack_from(data, 0)[0]
+
+        layout = _MH_LAYOUT.get(magic)
+        if layout is None:
             raise MachOParseError(f"Invalid Mach-O magic: 0x{magic:08x}")
+        is_64bit, endian = layout
 
-        # Read header to get CPU type
-        fmt = "<IIIIIIII" if not is_swap else ">IIIIIIII"
-        if is_64bit:
-            # 64-bit header has reserved field
-            fmt = "<IIIIIIII" if not is_swap else ">IIIIIIII"
+        # Read header to get CPU type (64-bit header has a reserved field)
+        header_struct = _HDR_64[endian] if is_64bit else _HDR_32[endian]
 
         header_size = MACH_HEADER_64_SIZE if is_64bit else MACH_HEADER_SIZE
         if len(data) < header_size:
             raise MachOParseError("Data too small for Mach-O header")
 
-        header = struct.unpack(fmt, data[:header_size])
+        header = header_struct.unpack_from(data, 0)
         cpu_type = header[1]
         cpu_subtype = header[2]
 
@@ -256,7 +349,7 @@ class MachOParser:
 
     @staticmethod
     def _parse_slice(
-        data: bytes,
+        data: memoryview,
         file_offset: int,
         size: int,
         cpu_type: int,
@@ -266,51 +359,36 @@ class MachOParser:
         if len(data) < 4:
             return None
 
-        magic = struct.unpack("<I", data[:4])[0]
+        magic = _U32_LE.unpack_from(data, 0)[0]
 
         # Determine if 64-bit and byte order
-        if magic == MachOMagic.MH_MAGIC_64:
-            is_64bit = True
-            endian = "<"
-        elif magic == MachOMagic.MH_CIGAM_64:
-            is_64bit = True
-            endian = ">"
-        elif magic == MachOMagic.MH_MAGIC:
-            is_64bit = False
-            endian = "<"
-        elif magic == MachOMagic.MH_CIGAM:
-            is_64bit = False
-            endian = ">"
-        else:
-            logger.warning(f"Unknown magic in slice: 0x{magic:08x}")
+        layout = _MH_LAYOUT.get(magic)
+        if layout is None:
+            logger.warning("Unknown magic in slice: 0x%08x", magic)
             return None
+        is_64bit, endian = layout
 
         header_size = MACH_HEADER_64_SIZE if is_64bit else MACH_HEADER_SIZE
 
         # Parse header
-        if is_64bit:
-            fmt = f"{endian}IIIIIIII"
-        else:
-            fmt = f"{endian}IIIIIII"
+        header_struct = _HDR_64[endian] if is_64bit else _HDR_32[endian]
+        if len(data) < header_size:
+            logger.warning("Slice too small for Mach-O header")
+            return None
 
-        header = struct.unpack(fmt, data[:header_size])
+        header = header_struct.unpack_from(data, 0)
         ncmds = header[4]
         sizeofcmds = header[5]
 
         # Find encryption info in load commands
         encryption_info = MachOParser._find_encryption_info(
-            data, header_size, ncmds, endian, file_offset
+            data, header_size, ncmds, endian, file_offset, sizeofcmds
         )
 
-        try:
-            cpu_type_enum = MachOCPUType(cpu_type)
-        except ValueError:
-            cpu_type_enum = cpu_type  # type: ignore
-
         return MachOSlice(
             offset=file_offset,
             size=size,
-            cpu_type=cpu_type_enum,
+            cpu_type=_CPUTYPE_BY_VALUE.get(cpu_type, cpu_type),  # type: ignore[arg-type]
             cpu_subtype=cpu_subtype,
             is_64bit=is_64bit,
             encryption_info=encryption_info,
@@ -318,41 +396,50 @@ class MachOParser:
 
     @staticmethod
     def _find_encryption_info(
-        data: bytes,
+        data: memoryview,
         header_size: int,
         ncmds: int,
         endian: str,
         file_offset: int,
+        sizeofcmds: int = 0,
     ) -> Optional[EncryptionInfo]:
-        """Find LC_ENCRYPTION_INFO(_64) load command."""
+        """
+        Find LC_ENCRYPTION_INFO(_64) load command.
+
+        The walk stops at the end of the load-command region
+        (header_size + sizeofcmds) when the header's sizeofcmds fits in
+        the data, otherwise at the end of the data.
+        """
         offset = header_size
+        end = header_size + sizeofcmds
+        if sizeofcmds <= 0 or end > len(data):
+            end = len(data)
+        lc_struct = _LC[endian]
+        enc_struct = _ENC[endian]
 
         for _ in range(ncmds):
-            if offset + 8 > len(data):
+            if offset + 8 > end:
+                break
+
+            cmd, cmdsize = lc_struct.unpack_from(data, offset)
+            if cmdsize == 0:
+                # Malformed command; every real one is at least 8 bytes
                 break
 
-            cmd, cmdsize = struct.unpack(f"{endian}II", data[offset : offset + 8])
-
-            if cmd in (LoadCommand.LC_ENCRYPTION_INFO, LoadCommand.LC_ENCRYPTION_INFO_64):
-                # Parse encryption_info_command
-                if cmd == LoadCommand.LC_ENCRYPTION_INFO_64:
-                    # 64-bit: cmd, cmdsize, cryptoff, cryptsize, cryptid, pad
-                    if offset + 24 > len(data):
-                        break
-                    cryptoff, cryptsize, cryptid = struct.unpack(
-                        f"{endian}III", data[offset + 8 : offset + 20]
-                    )
-                else:
-                    # 32-bit: cmd, cmdsize, cryptoff, cryptsize, cryptid
-                    if offset + 20 > len(data):
-                        break
-                    cryptoff, cryptsize, cryptid = struct.unpack(
-                        f"{endian}III", data[offset + 8 : offset + 20]
-                    )
+            if cmd in _ENCRYPTION_CMDS:
+                # cmd, cmdsize, cryptoff, cryptsize, cryptid (+ pad on 64-bit);
+                # only the first 20 bytes are read, for either variant
+                if offset + 20 > end:
+                    break
+                cryptoff, cryptsize, cryptid = enc_struct.unpack_from(
+                    data, offset + 8
+                )
 
                 logger.debug(
-                    f"Found encryption info: cryptoff={cryptoff}, "
-                    f"cryptsize={cryptsize}, cryptid={cryptid}"
+                    "Found encryption info: cryptoff=%d, cryptsize=%d, cryptid=%d",
+                    cryptoff,
+                    cryptsize,
+                    cryptid,
                 )
 
                 return EncryptionInfo(
@@ -366,6 +453,11 @@ class MachOParser:
 
         return None
 
+    @staticmethod
+    def _is_macho(data: bytes) -> bool:
+        """Cheap check of the first four bytes against the Mach-O magics."""
+        return len(data) >= 4 and _U32_LE.unpack_from(data, 0)[0] in _MACHO_MAGICS
+
     @staticmethod
     def get_encryption_info(data: bytes) -> Optional[EncryptionInfo]:
         """
@@ -377,8 +469,13 @@ class MachOParser:
         Returns:
             EncryptionInfo if found, None otherwise.
         """
+        # Non-Mach-O input is common when scanning bundle files; reject it
+        # without the parser's setup and exception handling
+        if not MachOParser._is_macho(data):
+            return None
+
         try:
-            binary = MachOParser.parse(data)
+            binary = MachOParser.parse(data, stop_on_encrypted=True)
             return binary.encryption_info
         except MachOParseError:
             return None
@@ -394,9 +491,37 @@ class MachOParser:
         Returns:
             True if encrypted, False otherwise.
         """
+        if not MachOParser._is_macho(data):
+            return False
+
         info = MachOParser.get_encryption_info(data)
         return info is not None and info.is_encrypted
 
+    @staticmethod
+    def patch_cryptid_inplace(
+        buf: bytearray,
+        cmd_offset: int,
+        new_cryptid: int = 0,
+        slice_offset: int = 0,
+    ) -> None:
+        """
+        Write a cryptid value into a writable buffer without copying it.
+
+        Use this when the binary is already held in a bytearray (or
+        writable mmap) and the load command offset is known.
+
+        Args:
+            buf: Writable buffer holding the binary.
+            cmd_offset: File offset of the LC_ENCRYPTION_INFO(_64) command.
+            new_cryptid: New cryptid value (default 0).
+            slice_offset: Offset of the slice in a FAT binary when buf holds
+                only that slice (default 0).
+        """
+        # Structure: cmd (4), cmdsize (4), cryptoff (4), cryptsize (4), cryptid (4)
+        cryptid_offset = cmd_offset + 16 - slice_offset
+        logger.debug("Patching cryptid at offset %d to %d", cryptid_offset, new_cryptid)
+        struct.pack_into("<I", buf, cryptid_offset, new_cryptid)
+
     @staticmethod
     def patch_cryptid(
         data: bytes,
@@ -421,29 +546,43 @@ class MachOParser:
             MachOParseError: If encryption info not found.
         """
         # Parse to find the encryption info
-        binary = MachOParser.parse(data)
+        binary = MachOParser.parse(data, stop_on_encrypted=True)
 
         if not binary.encryption_info:
             raise MachOParseError("No encryption info found in binary")
 
-        encryption_info = binary.encryption_info
-
-        # Calculate the offset to the cryptid field
-        # Structure: cmd (4), cmdsize (4), cryptoff (4), cryptsize (4), cryptid (4)
-        cryptid_offset = encryption_info.cmd_offset + 16  # After cmd, cmdsize, cryptoff, cryptsize
-
-        # Adjust for slice offset if this is part of a FAT binary read
-        if slice_offset > 0:
-            cryptid_offset = cryptid_offset - slice_offset
-
-        logger.debug(f"Patching cryptid at offset {cryptid_offset} to {new_cryptid}")
-
         # Create mutable copy and patch
         result = bytearray(data)
-        struct.pack_into("<I", result, cryptid_offset, new_cryptid)
+        MachOParser.patch_cryptid_inplace(
+            result, binary.encryption_info.cmd_offset, new_cryptid, slice_offset
+        )
 
         return bytes(result)
 
+    @staticmethod
+    def patch_file_cryptid(
+        path: str | os.PathLike[str],
+        cmd_offset: int,
+        new_cryptid: int = 0,
+    ) -> None:
+        """
+        Patch the cryptid field of a binary file on disk.
+
+        Only the four cryptid bytes are written; the rest of the file is
+        neither read nor rewritten.
+
+        Args:
+            path: Path to the binary.
+            cmd_offset: File offset of the LC_ENCRYPTION_INFO(_64) command.
+            new_cryptid: New cryptid value (default 0).
+        """
+        # Structure: cmd (4), cmdsize (4), cryptoff (4), cryptsize (4), cryptid (4)
+        cryptid_offset = cmd_offset + 16
+        logger.debug("Patching cryptid in %s at offset %d", path, cryptid_offset)
+        with open(path, "r+b") as f:
+            f.seek(cryptid_offset)
+            f.write(_U32_LE.pack(new_cryptid))
+
     @staticmethod
     def patch_binary_cryptid(
         binary_data: bytes,
@@ -473,6 +612,7 @@ class MachOParser:
                 f"doesn't match cryptsize ({encryption_info.cryptsize})"
             )
 
+        # Single mutable copy; everything below patches it in place
         result = bytearray(binary_data)
 
         # Replace encrypted section with decrypted data
@@ -480,7 +620,43 @@ class MachOParser:
         end = start + encryption_info.cryptsize
         result[start:end] = decrypted_section
 
-        # Patch cryptid to 0
-        result = bytearray(MachOParser.patch_cryptid(bytes(result), 0))
+        # Patch cryptid to 0; the caller's encryption info already says
+        # where the load command is, so there is no need to re-parse
+        MachOParser.patch_cryptid_inplace(result, encryption_info.cmd_offset, 0)
 
         return bytes(result)
+
+    @staticmethod
+    def patch_binary_cryptid_inplace(
+        buffer: bytearray,
+        decrypted_section: bytes,
+        encryption_info: EncryptionInfo,
+    ) -> None:
+        """
+        Replace the encrypted section and patch cryptid in a writable buffer.
+
+        This is the in-place counterpart of patch_binary_cryptid. Pass an
+        mmap of the binary file so only the dirty pages are written back,
+        instead of holding the whole binary in memory twice.
+
+        Args:
+            buffer: Writable buffer holding the binary (bytearray or mmap).
+            decrypted_section: Decrypted bytes from memory.
+            encryption_info: Encryption info from the binary.
+
+        Raises:
+            ValueError: If decrypted section size doesn't match.
+        """
+        if len(decrypted_section) != encryption_info.cryptsize:
+            raise ValueError(
+                f"Decrypted section size ({len(decrypted_section)}) "
+                f"doesn't match cryptsize ({encryption_info.cryptsize})"
+            )
+
+        # Replace encrypted section with decrypted data
+        start = encryption_info.cryptoff
+        end = start + encryption_info.cryptsize
+        buffer[start:end] = decrypted_section
+
+        # Patch cryptid to 0 at the load command the caller located
+        MachOParser.patch_cryptid_inplace(buffer, encryption_info.cmd_offset, 0)
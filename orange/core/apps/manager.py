@@ -10,9 +10,15 @@ This module provides functionality for:
 from __future__ import annotations
 
 import logging
-import tempfile
+import os
+import queue
+import time
 import zipfile
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime
 from pathlib import Path
 from typing import Optional, Callable, Any
 
@@ -20,12 +26,29 @@ from pymobiledevice3.services.installation_proxy import InstallationProxyService
 from pymobiledevice3.services.afc import AfcService
 from pymobiledevice3.services.house_arrest import HouseArrestService
 
+from orange.constants import (
+    DEFAULT_CHUNK_SIZE,
+    INCOMPRESSIBLE_SUFFIXES,
+    MAX_CONCURRENT_TRANSFERS,
+)
 from orange.core.connection import create_lockdown_client
 from orange.core.apps.models import AppInfo, AppType
 from orange.exceptions import DeviceNotFoundError, OrangeError
+from orange.utils import set_zip_compresslevel
 
 logger = logging.getLogger(__name__)
 
+# zlib level for extracted IPAs: they are installed locally, so the fastest
+# deflate is worth its slightly larger output
+IPA_COMPRESSLEVEL = 1
+
+# How long a list_apps() result is reused
+APPS_CACHE_TTL = 5.0  # seconds
+
+# Files up to this size are fetched whole on worker connections ahead of
+# the ZIP writer; larger ones are streamed in chunks to bound memory use
+PREFETCH_MAX_SIZE = 8 * 1024 * 1024  # 8 MB
+
 
 class AppExtractionError(OrangeError):
     """Error during app extraction."""
@@ -65,6 +88,11 @@ class AppManager:
         self._udid = udid
         self._lockdown = None
         self._installation_proxy = None
+        self._apps_cache: dict[
+            tuple[AppType, bool, Optional[tuple[str, ...]]],
+            tuple[float, list[AppInfo]],
+        ] = {}
+        self._cache_ttl = APPS_CACHE_TTL
 
         logger.debug(f"AppManager initialized for {udid or 'first device'}")
 
@@ -91,6 +119,11 @@ class AppManager:
                 pass
             self._installation_proxy = None
             self._lockdown = None
+        self._apps_cache.clear()
+
+    def invalidate_apps_cache(self) -> None:
+        """Drop cached app lists so the next query hits the device."""
+        self._apps_cache.clear()
 
     def __enter__(self) -> "AppManager":
         """Context manager entry."""
@@ -106,6 +139,7 @@ class AppManager:
         app_type: AppType = AppType.USER,
         calculate_sizes: bool = True,
         bundle_ids: Optional[list[str]] = None,
+        sort: bool = True,
     ) -> list[AppInfo]:
         """
         List installed applications.
@@ -114,10 +148,19 @@ class AppManager:
             app_type: Type of apps to list (USER, SYSTEM, ANY)
             calculate_sizes: Whether to calculate app sizes (slower)
             bundle_ids: Optional list of specific bundle IDs to query
+            sort: Sort the result by app name (skip when order is irrelevant)
+
+        Results are cached per argument combination for a few seconds
+        (see APPS_CACHE_TTL), since each query is a lockdown round trip.
 
         Returns:
             List of AppInfo objects for installed apps.
         """
+        cache_key = (app_type, calculate_sizes, tuple(bundle_ids) if bundle_ids else None)
+        cached = self._apps_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return self._sorted_by_name(cached[1]) if sort else list(cached[1])
+
         proxy = self._ensure_connected()
 
         try:
@@ -132,16 +175,20 @@ class AppManager:
                 app_info = self._parse_app_info(bundle_id, info)
                 apps.append(app_info)
 
-            # Sort by name
-            apps.sort(key=lambda a: a.name.lower())
-
             logger.info(f"Found {len(apps)} {app_type.value.lower()} app(s)")
-            return apps
+            self._apps_cache[cache_key] = (time.monotonic(), apps)
+            return self._sorted_by_name(apps) if sort else list(apps)
 
         except Exception as e:
             logger.error(f"Failed to list apps: {e}")
             raise
 
+    @staticmethod
+    def _sorted_by_name(apps: list[AppInfo]) -> list[AppInfo]:
+        """Return a copy of apps sorted case-insensitively by name."""
+        # sorted() computes each key once, so lower() runs n times, not n log n
+        return sorted(apps, key=lambda a: a.name.lower())
+
     def get_app(self, bundle_id: str) -> Optional[AppInfo]:
         """
         Get information for a specific app.
@@ -152,12 +199,39 @@ class AppManager:
         Returns:
             AppInfo if found, None otherwise.
         """
-        apps = self.list_apps(
-            app_type=AppType.ANY,
-            calculate_sizes=True,
-            bundle_ids=[bundle_id],
-        )
-        return apps[0] if apps else None
+        return self.get_apps([bundle_id]).get(bundle_id)
+
+    def get_apps(self, bundle_ids: list[str]) -> dict[str, AppInfo]:
+        """
+        Get information for several apps in one device query.
+
+        Apps already present in a fresh cached full listing (with sizes)
+        are served from it; the rest are fetched in a single
+        installation_proxy call instead of one call per bundle ID.
+
+        Args:
+            bundle_ids: Bundle identifiers to look up.
+
+        Returns:
+            Dict of bundle ID to AppInfo; apps that are not installed are
+            absent.
+        """
+        found: dict[str, AppInfo] = {}
+        cached = self._apps_cache.get((AppType.ANY, True, None))
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            by_id = {app.bundle_id: app for app in cached[1]}
+            found = {bid: by_id[bid] for bid in bundle_ids if bid in by_id}
+
+        missing = [bid for bid in bundle_ids if bid not in found]
+        if missing:
+            apps = self.list_apps(
+                app_type=AppType.ANY,
+                calculate_sizes=True,
+                bundle_ids=missing,
+                sort=False,
+            )
+            found.update((app.bundle_id, app) for app in apps)
+        return found
 
     def search_apps(self, query: str) -> list[AppInfo]:
         """
@@ -167,17 +241,41 @@ class AppManager:
             query: Search query (case-insensitive)
 
         Returns:
-            List of matching AppInfo objects.
+            List of matching AppInfo objects, sorted by name.
         """
-        all_apps = self.list_apps(app_type=AppType.USER, calculate_sizes=False)
         query_lower = query.lower()
 
-        return [
-            app
-            for app in all_apps
-            if query_lower in app.name.lower()
-            or query_lower in app.bundle_id.lower()
+        cached = self._apps_cache.get((AppType.USER, False, None))
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            matches = [
+                app
+                for app in cached[1]
+                if query_lower in app.name.lower()
+                or query_lower in app.bundle_id.lower()
+            ]
+            return self._sorted_by_name(matches)
+
+        proxy = self._ensure_connected()
+
+        try:
+            apps_dict = proxy.get_apps(
+                application_type=AppType.USER.value,
+                calculate_sizes=False,
+            )
+        except Exception as e:
+            logger.error(f"Failed to search apps: {e}")
+            raise
+
+        # Reason: Match on the raw plist strings so only hits pay for
+        # _parse_app_info, not every installed app
+        matches = [
+            self._parse_app_info(bundle_id, info)
+            for bundle_id, info in apps_dict.items()
+            if query_lower in self._display_name(bundle_id, info).lower()
+            or query_lower in bundle_id.lower()
         ]
+        logger.debug(f"Search '{query}' matched {len(matches)} of {len(apps_dict)} app(s)")
+        return self._sorted_by_name(matches)
 
     def extract_ipa(
         self,
@@ -225,43 +323,44 @@ class AppManager:
             lockdown = create_lockdown_client(self._udid)
 
             # Use HouseArrest to access app container
-            with HouseArrestService(lockdown=lockdown, bundle_id=bundle_id) as ha:
+            with ExitStack() as stack, HouseArrestService(
+                lockdown=lockdown, bundle_id=bundle_id
+            ) as ha:
                 afc = ha.send_command("VendContainer")
 
-                # Create temporary directory for extraction
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    temp_path = Path(temp_dir)
-                    app_dir = temp_path / "Payload"
-                    app_dir.mkdir()
-
-                    # Extract app bundle
-                    bundle_name = Path(app_info.path).name
-                    local_app_path = app_dir / bundle_name
-
-                    logger.debug(f"Downloading app bundle to {local_app_path}")
-                    self._download_directory(
+                def open_afc() -> Any:
+                    # Extra container connections for parallel downloads;
+                    # closed together with the primary one
+                    extra = stack.enter_context(
+                        HouseArrestService(lockdown=lockdown, bundle_id=bundle_id)
+                    )
+                    return extra.send_command("VendContainer")
+
+                # Create IPA (zip file), streaming each file from the device
+                # straight into the archive
+                output_path = Path(output_path)
+                if output_path.suffix.lower() != ".ipa":
+                    output_path = output_path.with_suffix(".ipa")
+
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+
+                bundle_name = Path(app_info.path).name
+                logger.debug(f"Creating IPA at {output_path}")
+                with zipfile.ZipFile(
+                    output_path,
+                    "w",
+                    zipfile.ZIP_DEFLATED,
+                    compresslevel=IPA_COMPRESSLEVEL,
+                ) as zf:
+                    self._zip_directory(
                         afc,
                         "/",
-                        local_app_path,
+                        f"Payload/{bundle_name}/",
+                        zf,
                         progress_callback,
+                        afc_factory=open_afc,
                     )
 
-                    # Create IPA (zip file)
-                    output_path = Path(output_path)
-                    if output_path.suffix.lower() != ".ipa":
-                        output_path = output_path.with_suffix(".ipa")
-
-                    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-                    logger.debug(f"Creating IPA at {output_path}")
-                    with zipfile.ZipFile(
-                        output_path, "w", zipfile.ZIP_DEFLATED
-                    ) as zf:
-                        for file_path in temp_path.rglob("*"):
-                            if file_path.is_file():
-                                arc_name = file_path.relative_to(temp_path)
-                                zf.write(file_path, arc_name)
-
             logger.info(f"Extracted IPA to {output_path}")
 
             # Warn about encryption
@@ -277,46 +376,216 @@ class AppManager:
             logger.error(f"Failed to extract IPA: {e}")
             raise AppExtractionError(f"Extraction failed: {e}") from e
 
-    def _download_directory(
+    def _zip_directory(
         self,
         afc: Any,
         remote_path: str,
-        local_path: Path,
+        arc_prefix: str,
+        zf: zipfile.ZipFile,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        afc_factory: Optional[Callable[[], Any]] = None,
     ) -> None:
-        """Recursively download a directory from device."""
-        local_path.mkdir(parents=True, exist_ok=True)
+        """
+        Recursively add a device directory to an open ZIP archive.
+
+        File data goes from AFC straight into the archive with no local
+        staging copy. Each fetch is a latency-bound round trip, so when
+        afc_factory is given, files up to PREFETCH_MAX_SIZE are read ahead
+        on up to MAX_CONCURRENT_TRANSFERS extra AFC connections. One AFC
+        client cannot carry concurrent requests. Entries are still written
+        in listing order. Larger files are streamed in chunks on the
+        primary connection.
 
+        Args:
+            afc: AFC client rooted at the app container.
+            remote_path: Directory on the device to archive.
+            arc_prefix: Archive name prefix for its contents, ending in "/".
+            zf: ZipFile open for writing.
+            progress_callback: Optional callback(bytes_done, total_bytes),
+                called once per archived file.
+            afc_factory: Optional callable returning an additional AFC
+                client for the same container.
+        """
+        files = self._list_remote_files(afc, remote_path, arc_prefix)
+        if not files:
+            return
+
+        workers = []
+        if afc_factory is not None:
+            for _ in range(min(MAX_CONCURRENT_TRANSFERS, len(files))):
+                try:
+                    workers.append(afc_factory())
+                except Exception as e:
+                    logger.debug(f"Could not open extra AFC connection: {e}")
+                    break
+
+        def write(
+            remote_item: str, arcname: str, size: int, mtime: Any, future: Any
+        ) -> None:
+            zinfo = self._zip_info(arcname, size, mtime, zf.compresslevel)
+            if future is None:
+                ok = self._stream_file(afc, remote_item, zinfo, zf)
+            else:
+                data = future.result()
+                ok = data is not None
+                if ok:
+                    zf.writestr(zinfo, data)
+            if ok and progress_callback:
+                progress_callback(size, size)
+
+        if not workers:
+            for remote_item, arcname, size, mtime in files:
+                write(remote_item, arcname, size, mtime, None)
+            return
+
+        # Reason: a client is checked out for the duration of one fetch so
+        # no two threads ever share an AFC connection.
+        idle: queue.Queue[Any] = queue.Queue()
+        for client in workers:
+            idle.put(client)
+
+        def fetch(remote_item: str) -> Optional[bytes]:
+            client = idle.get()
+            try:
+                return client.get_file_contents(remote_item)
+            except Exception as e:
+                logger.debug(f"Could not download {remote_item}: {e}")
+                return None
+            finally:
+                idle.put(client)
+
+        logger.debug(f"Archiving {len(files)} files over {len(workers)} extra connections")
+        window = len(workers) * 4
+        pending: deque[tuple[str, str, int, Any, Any]] = deque()
+        with ThreadPoolExecutor(max_workers=len(workers)) as executor:
+            for remote_item, arcname, size, mtime in files:
+                future = None
+                if size <= PREFETCH_MAX_SIZE:
+                    future = executor.submit(fetch, remote_item)
+                pending.append((remote_item, arcname, size, mtime, future))
+                if len(pending) >= window:
+                    write(*pending.popleft())
+            while pending:
+                write(*pending.popleft())
+
+    def _list_remote_files(
+        self, afc: Any, remote_path: str, arc_prefix: str
+    ) -> list[tuple[str, str, int, Any]]:
+        """
+        List files under a device directory.
+
+        Returns:
+            List of (remote_path, archive_name, size, st_mtime) for every file.
+        """
         try:
             items = afc.listdir(remote_path)
         except Exception:
-            return
+            return []
 
+        files = []
         for item in items:
             if item in (".", ".."):
                 continue
 
             remote_item = f"{remote_path.rstrip('/')}/{item}"
-            local_item = local_path / item
+            arcname = arc_prefix + item
 
             try:
-                # Check if directory
-                if afc.isdir(remote_item):
-                    self._download_directory(
-                        afc, remote_item, local_item, progress_callback
+                # One stat gives both the type and the size
+                info = afc.stat(remote_item)
+                if info.get("st_ifmt") == "S_IFDIR":
+                    files.extend(
+                        self._list_remote_files(afc, remote_item, arcname + "/")
                     )
                 else:
-                    # Download file
-                    afc.pull(remote_item, str(local_item))
-                    if progress_callback:
-                        try:
-                            stat = afc.stat(remote_item)
-                            size = int(stat.get("st_size", 0))
-                            progress_callback(size, size)
-                        except Exception:
-                            pass
+                    files.append(
+                        (
+                            remote_item,
+                            arcname,
+                            int(info.get("st_size", 0)),
+                            info.get("st_mtime"),
+                        )
+                    )
             except Exception as e:
-                logger.debug(f"Could not download {remote_item}: {e}")
+                logger.debug(f"Could not stat {remote_item}: {e}")
+
+        return files
+
+    @staticmethod
+    def _zip_info(
+        arcname: str, size: int, mtime: Any, compresslevel: Optional[int]
+    ) -> zipfile.ZipInfo:
+        """
+        Build the ZipInfo for an archived device file.
+
+        Args:
+            arcname: Name inside the archive.
+            size: File size from the AFC stat.
+            mtime: AFC st_mtime, as a datetime or in nanoseconds since the
+                epoch. The current time is used when it is missing.
+            compresslevel: Deflate level for the entry; zipfile only applies
+                the archive's own level to entries it builds itself.
+        """
+        if isinstance(mtime, datetime):
+            timestamp = mtime.timestamp()
+        elif mtime:
+            timestamp = int(mtime) / 1e9
+        else:
+            timestamp = time.time()
+        # ZIP timestamps cannot go earlier than 1980
+        date_time = max(time.localtime(timestamp)[:6], (1980, 1, 1, 0, 0, 0))
+
+        zinfo = zipfile.ZipInfo(arcname, date_time=date_time)
+        zinfo.external_attr = 0o100644 << 16  # Regular file, rw-r--r--
+        zinfo.file_size = size  # Lets zipfile decide on ZIP64 up front
+        # Store already-compressed assets as-is
+        if os.path.splitext(arcname)[1].lower() in INCOMPRESSIBLE_SUFFIXES:
+            zinfo.compress_type = zipfile.ZIP_STORED
+        else:
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            set_zip_compresslevel(zinfo, compresslevel)
+        return zinfo
+
+    def _stream_file(
+        self,
+        afc: Any,
+        remote_item: str,
+        zinfo: zipfile.ZipInfo,
+        zf: zipfile.ZipFile,
+    ) -> bool:
+        """
+        Copy one device file into the archive in DEFAULT_CHUNK_SIZE reads.
+
+        AFC may return fewer bytes than requested before the end of a file,
+        so reading stops only once zinfo.file_size bytes have arrived or a
+        read comes back empty.
+
+        Returns:
+            False (after logging) if the file could not be opened.
+        """
+        try:
+            handle = afc.fopen(remote_item)
+        except Exception as e:
+            logger.debug(f"Could not download {remote_item}: {e}")
+            return False
+
+        try:
+            remaining = zinfo.file_size
+            with zf.open(zinfo, "w") as dst:
+                while remaining > 0:
+                    chunk = afc.fread(handle, min(DEFAULT_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    remaining -= len(chunk)
+        finally:
+            afc.fclose(handle)
+        return True
+
+    @staticmethod
+    def _display_name(bundle_id: str, info: dict) -> str:
+        """Return the user-visible app name from a raw app info dict."""
+        return info.get("CFBundleDisplayName") or info.get("CFBundleName", bundle_id)
 
     def _parse_app_info(self, bundle_id: str, info: dict) -> AppInfo:
         """Parse app info dictionary into AppInfo object."""
@@ -331,15 +600,15 @@ class AppManager:
         is_sideloaded = not info.get("iTunesMetadata")
 
         # Get icon files
-        icon_files = []
-        icons = info.get("CFBundleIcons", {})
-        primary = icons.get("CFBundlePrimaryIcon", {})
-        icon_files = primary.get("CFBundleIconFiles", [])
+        icon_files = (
+            info.get("CFBundleIcons", {})
+            .get("CFBundlePrimaryIcon", {})
+            .get("CFBundleIconFiles", [])
+        )
 
         return AppInfo(
             bundle_id=bundle_id,
-            name=info.get("CFBundleDisplayName")
-            or info.get("CFBundleName", bundle_id),
+            name=self._display_name(bundle_id, info),
             version=info.get("CFBundleVersion", "Unknown"),
             short_version=info.get("CFBundleShortVersionString", "Unknown"),
             app_type=app_type,
@@ -12,6 +12,8 @@ from enum import Enum
 from typing import Any, Optional
 from datetime import datetime
 
+from orange.utils import format_size
+
 
 class AppType(Enum):
     """Type of iOS application."""
@@ -22,7 +24,11 @@ class AppType(Enum):
     ANY = "Any"  # All types
 
 
-@dataclass
+# AppType -> value string; a dict lookup skips Enum.value's descriptor
+_APP_TYPE_VALUE = {t: t.value for t in AppType}
+
+
+@dataclass(slots=True)
 class AppInfo:
     """
     Information about an installed iOS application.
@@ -64,12 +70,12 @@ class AppInfo:
     @property
     def size_human(self) -> str:
         """Get human-readable size of app bundle."""
-        return _format_size(self.size)
+        return format_size(self.size)
 
     @property
     def data_size_human(self) -> str:
         """Get human-readable size of app data."""
-        return _format_size(self.data_size)
+        return format_size(self.data_size)
 
     @property
     def total_size(self) -> int:
@@ -79,45 +85,43 @@ class AppInfo:
     @property
     def total_size_human(self) -> str:
         """Get human-readable total size."""
-        return _format_size(self.total_size)
+        return format_size(self.size + self.data_size)
 
     @property
     def is_extractable(self) -> bool:
         """Check if app can be extracted as IPA."""
         # System apps cannot be extracted
-        return self.app_type == AppType.USER
+        return self.app_type is AppType.USER
+
+    def to_dict(self, include_human: bool = True) -> dict[str, Any]:
+        """
+        Convert to dictionary for serialization.
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
+        Args:
+            include_human: Include the formatted *_size_human strings.
+                Bulk callers that only need byte counts can skip them.
+        """
+        data = {
             "bundle_id": self.bundle_id,
             "name": self.name,
             "version": self.version,
             "short_version": self.short_version,
-            "app_type": self.app_type.value,
+            "app_type": _APP_TYPE_VALUE[self.app_type],
             "path": self.path,
             "container_path": self.container_path,
             "size": self.size,
-            "size_human": self.size_human,
-            "data_size": self.data_size,
-            "data_size_human": self.data_size_human,
-            "total_size": self.total_size,
-            "total_size_human": self.total_size_human,
-            "is_sideloaded": self.is_sideloaded,
-            "is_extractable": self.is_extractable,
-            "min_os_version": self.min_os_version,
-            "executable_name": self.executable_name,
         }
+        if include_human:
+            data["size_human"] = self.size_human
+        data["data_size"] = self.data_size
+        if include_human:
+            data["data_size_human"] = self.data_size_human
+        data["total_size"] = self.size + self.data_size
+        if include_human:
+            data["total_size_human"] = self.total_size_human
+        data["is_sideloaded"] = self.is_sideloaded
+        data["is_extractable"] = self.app_type is AppType.USER
+        data["min_os_version"] = self.min_os_version
+        data["executable_name"] = self.executable_name
+        return data
 
-
-def _format_size(size_bytes: int) -> str:
-    """Format byte size to human-readable string."""
-    if size_bytes == 0:
-        return "0 B"
-
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if abs(size_bytes) < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-
-    return f"{size_bytes:.1f} PB"
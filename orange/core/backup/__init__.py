@@ -18,13 +18,19 @@ Example:
     manager.restore_backup(udid, backup.path)
 """
 
-from orange.core.backup.models import BackupInfo, BackupFile, BackupStatus
+from orange.core.backup.models import (
+    BackupInfo,
+    BackupFile,
+    BackupFileTuple,
+    BackupStatus,
+)
 from orange.core.backup.manager import BackupManager
 from orange.core.backup.reader import BackupReader
 
 __all__ = [
     "BackupInfo",
     "BackupFile",
+    "BackupFileTuple",
     "BackupManager",
     "BackupReader",
     "BackupStatus",
@@ -0,0 +1,74 @@
+"""
+File copy helpers for extracting backup blobs.
+
+Backup blobs are copied with the cheapest mechanism the platform offers:
+an in-kernel copy_file_range, the sendfile/fcopyfile path behind
+shutil.copyfile, or a large-buffer copy as the last resort.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import BinaryIO
+
+# os.copy_file_range is Linux-only (Python 3.8+)
+_HAS_COPY_FILE_RANGE = sys.platform == "linux" and hasattr(os, "copy_file_range")
+
+# Platforms where shutil.copyfile has a zero-copy path (sendfile/fcopyfile)
+_NATIVE_FASTCOPY = sys.platform in ("linux", "darwin")
+
+# Chunk size for the buffered fallback copy; shutil's default is 64 KiB,
+# which takes 16x the read/write calls on typical multi-MB blobs
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def copy_blob(source: Path, dest: Path) -> Path:
+    """
+    Copy a backup blob to dest, reflinking where the filesystem allows.
+
+    On Linux, os.copy_file_range copies inside the kernel, and on
+    filesystems such as Btrfs and XFS it shares extents instead of moving
+    data. Otherwise shutil.copyfile's sendfile/fcopyfile path is used, or
+    a buffered copy with COPY_BUFFER_SIZE chunks where neither exists.
+
+    Args:
+        source: Blob inside the backup directory.
+        dest: Destination file path.
+
+    Returns:
+        dest.
+    """
+    with open(source, "rb") as src, open(dest, "wb") as dst:
+        size = os.fstat(src.fileno()).st_size
+        if size == 0:
+            return dest
+
+        if _HAS_COPY_FILE_RANGE and _copy_file_range(src, dst, size):
+            return dest
+
+        if not _NATIVE_FASTCOPY:
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+            return dest
+
+    shutil.copyfile(source, dest)
+    return dest
+
+
+def _copy_file_range(src: BinaryIO, dst: BinaryIO, size: int) -> bool:
+    """Copy size bytes with os.copy_file_range; False if it falls short."""
+    remaining = size
+    try:
+        while remaining > 0:
+            copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+    except OSError:
+        return False
+    return remaining <= 0
@@ -0,0 +1,176 @@
+"""
+Binary plist decoding for Manifest.db file blobs.
+
+Each row of the backup manifest stores its file metadata as an
+NSKeyedArchiver binary plist. This module reads the few scalars the
+backup reader needs straight from the bplist00 object table.
+"""
+
+from __future__ import annotations
+
+import plistlib
+import struct
+from typing import Any, Optional
+
+# Manifest metadata keys read from each file blob, mapped to their
+# position in the tuple returned by extract_manifest_metadata
+_METADATA_KEYS = {b"Size": 0, b"Mode": 1, b"Flags": 2, b"LastModified": 3}
+
+
+class BPlist:
+    """Minimal random-access view over a bplist00 object table."""
+
+    __slots__ = ("data", "offset_size", "ref_size", "num_objects", "table")
+
+    def __init__(self, data: bytes):
+        if len(data) < 40 or not data.startswith(b"bplist00"):
+            raise ValueError("not a binary plist")
+        (
+            self.offset_size,
+            self.ref_size,
+            self.num_objects,
+            _,
+            self.table,
+        ) = struct.unpack_from(">6xBBQQQ", data, len(data) - 32)
+        self.data = data
+
+    def top(self) -> int:
+        """Return the index of the top-level object."""
+        return struct.unpack_from(">Q", self.data, len(self.data) - 16)[0]
+
+    def _pos(self, index: int) -> int:
+        if index >= self.num_objects:
+            raise ValueError("object index out of range")
+        start = self.table + index * self.offset_size
+        return int.from_bytes(self.data[start : start + self.offset_size], "big")
+
+    def _ref(self, pos: int) -> int:
+        return int.from_bytes(self.data[pos : pos + self.ref_size], "big")
+
+    def _header(self, index: int) -> tuple[int, int, int]:
+        """Return (type nibble, element count, payload offset) for an object."""
+        pos = self._pos(index)
+        marker = self.data[pos]
+        count = marker & 0xF
+        pos += 1
+        # Reason: only collections, strings and data use the 0xF nibble to
+        # mean "count follows as an int object"
+        if count == 0xF and marker >> 4 in (0x4, 0x5, 0x6, 0xA, 0xC, 0xD):
+            width = 1 << (self.data[pos] & 0xF)
+            count = int.from_bytes(self.data[pos + 1 : pos + 1 + width], "big")
+            pos += 1 + width
+        return marker >> 4, count, pos
+
+    def dict_refs(self, index: int) -> Optional[dict[bytes, int]]:
+        """Map a dict's ASCII keys to value object indexes, or None if not a dict."""
+        kind, count, pos = self._header(index)
+        if kind != 0xD:
+            return None
+        ref_size = self.ref_size
+        refs: dict[bytes, int] = {}
+        for i in range(count):
+            key_kind, length, key_pos = self._header(self._ref(pos + i * ref_size))
+            if key_kind == 0x5:
+                value = self._ref(pos + (count + i) * ref_size)
+                refs[self.data[key_pos : key_pos + length]] = value
+        return refs
+
+    def array_ref(self, index: int, item: int) -> Optional[int]:
+        """Return the object index of array[item], or None if out of range."""
+        kind, count, pos = self._header(index)
+        if kind != 0xA:
+            raise ValueError("object is not an array")
+        if item >= count:
+            return None
+        return self._ref(pos + item * self.ref_size)
+
+    def scalar(self, index: int) -> Any:
+        """Decode an int or real object; anything else raises ValueError."""
+        pos = self._pos(index)
+        marker = self.data[pos]
+        kind = marker >> 4
+        width = 1 << (marker & 0xF)
+        raw = self.data[pos + 1 : pos + 1 + width]
+        if kind == 0x1:
+            return int.from_bytes(raw, "big", signed=width >= 8)
+        if kind == 0x2 and width in (4, 8):
+            return struct.unpack(">f" if width == 4 else ">d", raw)[0]
+        raise ValueError(f"unsupported plist object 0x{marker:02x}")
+
+
+def extract_manifest_metadata(blob: bytes) -> tuple[int, int, int, Any]:
+    """
+    Read Size, Mode, Flags and LastModified from a manifest file blob.
+
+    The blob is an NSKeyedArchiver binary plist of which only four scalars
+    are needed, so this walks the bplist00 object table directly instead
+    of letting plistlib build the whole archive graph.
+
+    Args:
+        blob: Contents of the Files.file column.
+
+    Returns:
+        (size, mode, flags, last_modified) with missing values as 0/None.
+
+    Raises:
+        ValueError: If the blob is not a layout this parser understands.
+        struct.error: If the blob is truncated.
+    """
+    plist = BPlist(blob)
+    root = plist.dict_refs(plist.top())
+    if root is None:
+        raise ValueError("top-level object is not a dict")
+
+    # Handle NSKeyedArchiver format where data is in $objects[1]
+    index = plist.array_ref(root[b"$objects"], 1) if b"$objects" in root else None
+    if index is not None:
+        metadata = plist.dict_refs(index)
+        if metadata is None:
+            return 0, 0, 0, None
+    else:
+        # Older backup formats store the keys on the root dict
+        metadata = root
+
+    values: list[Any] = [0, 0, 0, None]
+    for key, slot in _METADATA_KEYS.items():
+        ref = metadata.get(key)
+        if ref is not None:
+            values[slot] = plist.scalar(ref)
+    return values[0], values[1], values[2], values[3]
+
+
+def load_manifest_metadata(blob: bytes) -> tuple[int, int, int, Any]:
+    """
+    Decode a manifest file blob, falling back to plistlib when needed.
+
+    Args:
+        blob: Contents of the Files.file column.
+
+    Returns:
+        (size, mode, flags, last_modified) with missing values as 0/None.
+
+    Raises:
+        Exception: If the blob cannot be decoded at all.
+    """
+    try:
+        return extract_manifest_metadata(blob)
+    except (ValueError, IndexError, struct.error):
+        pass
+
+    file_data = plistlib.loads(blob)
+
+    # Handle NSKeyedArchiver format where data is in $objects[1]
+    if "$objects" in file_data and len(file_data["$objects"]) > 1:
+        metadata = file_data["$objects"][1]
+        if not isinstance(metadata, dict):
+            return 0, 0, 0, None
+    else:
+        # Fallback for older backup formats
+        metadata = file_data
+
+    return (
+        metadata.get("Size", 0),
+        metadata.get("Mode", 0),
+        metadata.get("Flags", 0),
+        metadata.get("LastModified"),
+    )
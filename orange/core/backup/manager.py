@@ -7,11 +7,19 @@ Mobilebackup2Service.
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
 import plistlib
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Any, Callable, Iterator, NamedTuple, Optional
 
 from pymobiledevice3.lockdown import LockdownClient
 from pymobiledevice3.services.mobilebackup2 import Mobilebackup2Service
@@ -24,11 +32,392 @@ from orange.exceptions import (
     DeviceNotPairedError,
 )
 
+try:
+    # Optional faster XML parser for the backup metadata plists
+    from lxml import etree as _etree
+except ImportError:
+    _etree = None
+
 logger = logging.getLogger(__name__)
 
 # Default backup directory
 DEFAULT_BACKUP_DIR = Path.home() / ".orange" / "backups"
 
+# Progress is forwarded at most every PROGRESS_MIN_STEP percent or
+# PROGRESS_MIN_INTERVAL seconds, whichever comes first
+PROGRESS_MIN_STEP = 0.5  # percent
+PROGRESS_MIN_INTERVAL = 0.25  # seconds
+
+# How long an idle lockdown connection is kept for reuse
+LOCKDOWN_CACHE_TTL = 30.0  # seconds
+
+# How long a list_backups() result is reused while its directory's
+# mtime is unchanged
+LIST_CACHE_TTL = 5.0  # seconds
+
+# Upper bound on backups parsed concurrently by list_backups
+MAX_PARSE_WORKERS = 8
+
+# Upper bound on backup subdirectories deleted concurrently
+MAX_DELETE_WORKERS = 8
+
+# Header of binary property lists; these always go through plistlib
+_BPLIST_MAGIC = b"bplist"
+
+# The Info.plist keys _parse_backup_info_cached reads
+_INFO_PLIST_KEYS = frozenset(
+    {
+        "Target Identifier",
+        "Device Name",
+        "Product Version",
+        "Build Version",
+        "Last Backup Date",
+        "Product Type",
+        "Serial Number",
+    }
+)
+
+
+def _close_quietly(lockdown: LockdownClient) -> None:
+    """Close a lockdown client, ignoring errors from dead connections."""
+    with suppress(Exception):
+        lockdown.close()
+
+
+def _parallel_rmtree(path: str | os.PathLike[str]) -> None:
+    """
+    Delete a backup directory, removing its subdirectories in parallel.
+
+    iOS backups spread 100k+ files over up to 256 hash-prefix
+    subdirectories; each one is removed by its own shutil.rmtree on a
+    thread pool, since unlink calls release the GIL.
+
+    Args:
+        path: Directory to delete.
+
+    Raises:
+        OSError: If any part of the tree cannot be removed.
+    """
+    if os.path.islink(path):
+        # Let rmtree raise its usual error rather than following the link
+        shutil.rmtree(path)
+        return
+
+    subdirs = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            else:
+                os.unlink(entry.path)
+
+    if subdirs:
+        workers = min(MAX_DELETE_WORKERS, len(subdirs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Reason: list() waits for every subtree and re-raises the
+            # first failure instead of silently leaving files behind
+            list(executor.map(shutil.rmtree, subdirs))
+
+    os.rmdir(path)
+
+
+def _throttled_progress(
+    callback: Optional[Callable[[float], None]], label: str
+) -> Callable[[float], None]:
+    """
+    Wrap a progress callback so it only fires on meaningful changes.
+
+    pymobiledevice3 reports every tick; the wrapper forwards a value only
+    after PROGRESS_MIN_STEP percent or PROGRESS_MIN_INTERVAL seconds have
+    passed since the last forwarded one, and always forwards 100%. The
+    debug line uses deferred %-formatting, so it costs nothing when debug
+    logging is off.
+
+    Args:
+        callback: User progress callback, or None to only log.
+        label: Operation name for debug logging.
+
+    Returns:
+        Callback to hand to Mobilebackup2Service.
+    """
+    last = [float("-inf"), float("-inf")]  # percentage, monotonic time
+
+    def wrapper(percentage: float) -> None:
+        now = time.monotonic()
+        if (
+            percentage < 100.0
+            and percentage - last[0] < PROGRESS_MIN_STEP
+            and now - last[1] < PROGRESS_MIN_INTERVAL
+        ):
+            return
+        last[0], last[1] = percentage, now
+
+        if callback:
+            callback(percentage)
+        logger.debug("%s progress: %.1f%%", label, percentage)
+
+    return wrapper
+
+
+def _load_plist(path: Path) -> dict:
+    """
+    Load the top-level keys of a property list file.
+
+    XML plists are read with lxml when it is installed, keeping only
+    scalar values (strings, numbers, booleans, dates); nested dicts,
+    arrays and data blobs are skipped since backup metadata lookups
+    never need them. Binary plists, or any XML lxml cannot handle, are
+    loaded in full with plistlib.
+
+    Args:
+        path: Path to the plist file.
+
+    Returns:
+        Dict of the plist's top-level keys.
+    """
+    with open(path, "rb") as f:
+        if _etree is not None and f.read(len(_BPLIST_MAGIC)) != _BPLIST_MAGIC:
+            f.seek(0)
+            try:
+                return _load_plist_lxml(f)
+            except (_etree.LXMLError, ValueError, TypeError) as e:
+                logger.debug("lxml could not read %s, using plistlib: %s", path, e)
+        f.seek(0)
+        return plistlib.load(f)
+
+
+def _load_plist_lxml(f) -> dict:
+    """Read the top-level scalar keys of an XML plist with lxml."""
+    # Reason: a fresh parser per call, as lxml parsers must not be shared
+    # between threads; entities are never expanded from untrusted files
+    parser = _etree.XMLParser(resolve_entities=False, huge_tree=False)
+    root = _etree.parse(f, parser).getroot()
+    top = root[0] if root.tag == "plist" and len(root) else root
+    if top.tag != "dict":
+        raise ValueError(f"Top-level plist element is <{top.tag}>, not <dict>")
+
+    result: dict = {}
+    key = None
+    for el in top.iterchildren(tag=_etree.Element):
+        if el.tag == "key":
+            key = el.text or ""
+            continue
+        if key is None:
+            raise ValueError(f"<{el.tag}> without a preceding <key>")
+
+        value = _plist_scalar(el.tag, el.text)
+        if value is not _SKIP:
+            result[key] = value
+        key = None
+
+    return result
+
+
+# Returned by _plist_scalar for container and data values
+_SKIP = object()
+
+
+def _plist_scalar(tag: str, text: Optional[str]) -> Any:
+    """Convert a scalar XML plist element, or return _SKIP for others."""
+    if tag == "string":
+        return text or ""
+    if tag == "true":
+        return True
+    if tag == "false":
+        return False
+    if tag == "integer":
+        return int(text)
+    if tag == "real":
+        return float(text)
+    if tag == "date":
+        # Same naive-UTC datetime plistlib returns
+        return datetime.strptime(text, "%Y-%m-%dT%H:%M:%SZ")
+    return _SKIP
+
+
+def _load_info_plist_keys(path: Path, keys: frozenset[str]) -> dict:
+    """
+    Read selected top-level scalar keys from a plist, stopping early.
+
+    iOS writes a large Applications dict and iTunes blobs into a backup's
+    Info.plist. XML plists are stream-parsed with ElementTree.iterparse,
+    clearing elements as they complete, and parsing stops as soon as every
+    requested key has been seen. Binary plists, or XML the streaming
+    reader rejects, are loaded with plistlib instead.
+
+    Args:
+        path: Path to the plist file.
+        keys: Top-level keys to return.
+
+    Returns:
+        Dict of the requested keys that are present with scalar values.
+    """
+    from xml.etree import ElementTree
+
+    with open(path, "rb") as f:
+        if f.read(len(_BPLIST_MAGIC)) != _BPLIST_MAGIC:
+            f.seek(0)
+            try:
+                return _iterparse_plist_keys(f, keys)
+            except (ElementTree.ParseError, ValueError, TypeError) as e:
+                logger.debug("Streaming read of %s failed, using plistlib: %s", path, e)
+        f.seek(0)
+        plist = plistlib.load(f)
+    return {k: plist[k] for k in keys if k in plist}
+
+
+def _iterparse_plist_keys(f, keys: frozenset[str]) -> dict:
+    """Collect the requested top-level scalar keys from an XML plist stream."""
+    from xml.etree.ElementTree import iterparse
+
+    result: dict = {}
+    key = None
+    depth = 0  # Nesting of dict/array containers; 1 is the top-level dict
+
+    for event, el in iterparse(f, events=("start", "end")):
+        tag = el.tag
+        if event == "start":
+            if tag == "dict" or tag == "array":
+                depth += 1
+            continue
+
+        if tag == "dict" or tag == "array":
+            depth -= 1
+            if depth == 1:
+                # A nested value of a top-level key; never needed
+                key = None
+            if depth >= 1:
+                el.clear()
+            continue
+
+        if depth != 1:
+            # Inside a nested container; drop it to bound memory
+            el.clear()
+            continue
+
+        if tag == "key":
+            key = el.text or ""
+        elif key is not None:
+            if key in keys:
+                value = _plist_scalar(tag, el.text)
+                if value is not _SKIP:
+                    result[key] = value
+                    if len(result) == len(keys):
+                        break
+            key = None
+        el.clear()
+
+    return result
+
+
+def _scan_backup_dir(path: str) -> tuple[int, bool]:
+    """
+    Measure a backup directory and check for its Manifest.plist in one walk.
+
+    Uses an explicit stack of os.scandir iterators and DirEntry's cached
+    type and stat data, so a backup with 100k+ files costs one stat per
+    file and no Path objects. Symlinks are neither followed nor counted.
+
+    Args:
+        path: Backup directory.
+
+    Returns:
+        Tuple of (total size of regular files in bytes, whether a
+        top-level Manifest.plist exists).
+    """
+    total = 0
+    has_manifest = False
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+                    if current is path and entry.name == "Manifest.plist":
+                        has_manifest = True
+    return total, has_manifest
+
+
+@dataclass(slots=True)
+class _CachedLockdown:
+    """A cached lockdown client and the number of operations using it."""
+
+    client: LockdownClient
+    last_used: float
+    users: int = 0
+
+
+class _BackupMeta(NamedTuple):
+    """Immutable backup fields, as cached by _parse_backup_info_cached."""
+
+    backup_id: str
+    device_name: str
+    device_udid: str
+    ios_version: str
+    build_version: str
+    backup_date: datetime
+    is_encrypted: bool
+    size_bytes: int
+    product_type: Optional[str]
+    serial_number: Optional[str]
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_backup_info_cached(
+    path_str: str, info_mtime_ns: int, manifest_mtime_ns: int, tree_mtime_ns: int
+) -> _BackupMeta:
+    """
+    Parse backup metadata, memoized on path and modification times.
+
+    Args:
+        path_str: Path to the backup directory.
+        info_mtime_ns: Info.plist modification time.
+        manifest_mtime_ns: Manifest.plist modification time (-1 if absent).
+        tree_mtime_ns: Backup directory modification time. Together with
+            the Manifest.plist time, which every backup run rewrites,
+            this invalidates the cached size.
+
+    Returns:
+        Parsed backup fields.
+    """
+    backup_path = Path(path_str)
+    info = _load_info_plist_keys(backup_path / "Info.plist", _INFO_PLIST_KEYS)
+
+    # Calculate backup size; the same walk reports Manifest.plist
+    size_bytes, has_manifest = _scan_backup_dir(path_str)
+
+    # Check for encryption in Manifest.plist
+    is_encrypted = False
+    if has_manifest:
+        manifest = _load_plist(backup_path / "Manifest.plist")
+        is_encrypted = manifest.get("IsEncrypted", False)
+
+    # Parse date
+    backup_date = info.get("Last Backup Date")
+    # Plists almost always hold a real <date>; check that type first
+    if backup_date.__class__ is datetime:
+        pass
+    elif isinstance(backup_date, str):
+        backup_date = datetime.fromisoformat(backup_date)
+    elif not isinstance(backup_date, datetime):
+        backup_date = datetime.now()
+
+    return _BackupMeta(
+        backup_id=info.get("Target Identifier", backup_path.name),
+        device_name=info.get("Device Name", "Unknown"),
+        device_udid=info.get("Target Identifier", backup_path.name),
+        ios_version=info.get("Product Version", "Unknown"),
+        build_version=info.get("Build Version", "Unknown"),
+        backup_date=backup_date,
+        is_encrypted=is_encrypted,
+        size_bytes=size_bytes,
+        product_type=info.get("Product Type"),
+        serial_number=info.get("Serial Number"),
+    )
+
 
 class BackupManager:
     """
@@ -65,6 +454,9 @@ class BackupManager:
         """
         self._backup_dir = Path(backup_dir) if backup_dir else DEFAULT_BACKUP_DIR
         self._backup_dir.mkdir(parents=True, exist_ok=True)
+        self._lockdown_cache: dict[str, _CachedLockdown] = {}
+        self._lockdown_lock = threading.Lock()
+        self._list_cache: dict[Path, tuple[int, float, list[BackupInfo]]] = {}
         logger.debug(f"BackupManager initialized (backup_dir={self._backup_dir})")
 
     @property
@@ -72,6 +464,99 @@ class BackupManager:
         """Get the default backup directory."""
         return self._backup_dir
 
+    def close(self) -> None:
+        """Close cached lockdown connections once no operation is using them."""
+        with self._lockdown_lock:
+            idle = [e.client for e in self._lockdown_cache.values() if not e.users]
+            self._lockdown_cache.clear()
+        for client in idle:
+            _close_quietly(client)
+
+    def __enter__(self) -> "BackupManager":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+    @contextmanager
+    def _lockdown(self, udid: Optional[str]) -> Iterator[LockdownClient]:
+        """
+        Lease a lockdown client for udid, reusing a recent connection.
+
+        Clients are reused until they sit idle for LOCKDOWN_CACHE_TTL seconds,
+        so back-to-back operations on one device skip the pairing handshake.
+        A client is never closed while a lease on it is open. If the body
+        raises, the client is dropped so the next lease reconnects.
+
+        Args:
+            udid: Device UDID, or None for the first connected device. Clients
+                leased without a UDID are not cached, since the first
+                connected device can change between calls.
+
+        Yields:
+            Connected LockdownClient.
+        """
+        entry = self._acquire_lockdown(udid)
+        failed = True
+        try:
+            yield entry.client
+            failed = False
+        finally:
+            self._release_lockdown(udid, entry, failed)
+
+    def _acquire_lockdown(self, udid: Optional[str]) -> _CachedLockdown:
+        """Return a cached or new lockdown entry with its user count taken."""
+        if udid is None:
+            # Never cached, so _release_lockdown closes it after this lease
+            return _CachedLockdown(create_lockdown_client(None), time.monotonic(), 1)
+
+        stale = None
+        with self._lockdown_lock:
+            entry = self._lockdown_cache.get(udid)
+            if entry is not None:
+                if (
+                    entry.users
+                    or time.monotonic() - entry.last_used < LOCKDOWN_CACHE_TTL
+                ):
+                    entry.users += 1
+                    return entry
+                del self._lockdown_cache[udid]
+                stale = entry.client
+        if stale is not None:
+            _close_quietly(stale)
+
+        # Reason: the handshake can take seconds; connect outside the lock
+        # so operations on other devices are not held up behind it.
+        client = create_lockdown_client(udid)
+        with self._lockdown_lock:
+            entry = self._lockdown_cache.get(udid)
+            if entry is None:
+                entry = _CachedLockdown(client, time.monotonic())
+                self._lockdown_cache[udid] = entry
+                client = None
+            entry.users += 1
+        if client is not None:
+            # Another thread connected first; use its client instead
+            _close_quietly(client)
+        return entry
+
+    def _release_lockdown(
+        self, udid: Optional[str], entry: _CachedLockdown, failed: bool
+    ) -> None:
+        """Return a leased entry, closing it if it is no longer cached or used."""
+        with self._lockdown_lock:
+            entry.users -= 1
+            entry.last_used = time.monotonic()
+            cached = self._lockdown_cache.get(udid) is entry
+            if failed and cached:
+                del self._lockdown_cache[udid]
+                cached = False
+            close = not cached and not entry.users
+        if close:
+            _close_quietly(entry.client)
+
     def create_backup(
         self,
         udid: Optional[str] = None,
@@ -99,37 +584,38 @@ class BackupManager:
         dest = Path(destination) if destination else self._backup_dir
         dest.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"Creating {'full' if full else 'incremental'} backup to {dest}")
+        logger.info(
+            "Creating %s backup to %s", "full" if full else "incremental", dest
+        )
 
         try:
             # Connect to device (USB or Wi-Fi)
-            lockdown = create_lockdown_client(udid)
-            device_udid = lockdown.udid
-            device_name = lockdown.all_values.get("DeviceName", "Unknown")
-
-            logger.info(f"Backing up {device_name} ({device_udid})")
-
-            # Create backup service
-            backup_service = Mobilebackup2Service(lockdown)
-
-            # Wrapper for progress callback
-            def progress_wrapper(percentage: float) -> None:
-                if progress_callback:
-                    progress_callback(percentage)
-                logger.debug(f"Backup progress: {percentage:.1f}%")
-
-            # Perform backup
-            backup_service.backup(
-                full=full,
-                backup_directory=str(dest),
-                progress_callback=progress_wrapper,
-            )
+            with self._lockdown(udid) as lockdown:
+                device_udid = lockdown.udid
+                device_name = lockdown.all_values.get("DeviceName", "Unknown")
+
+                logger.info("Backing up %s (%s)", device_name, device_udid)
+
+                # Create backup service
+                backup_service = Mobilebackup2Service(lockdown)
+
+                # Wrapper for progress callback, throttled to coarse updates
+                progress_wrapper = _throttled_progress(progress_callback, "Backup")
+
+                # Perform backup
+                backup_service.backup(
+                    full=full,
+                    backup_directory=str(dest),
+                    progress_callback=progress_wrapper,
+                )
+
+            self._list_cache.clear()
 
             # Get backup info
             backup_path = dest / device_udid
             backup_info = self._parse_backup_info(backup_path)
 
-            logger.info(f"Backup completed: {backup_info.display_name}")
+            logger.info("Backup completed: %s", backup_info.display_name)
             return backup_info
 
         except FileNotFoundError as e:
@@ -138,7 +624,7 @@ class BackupManager:
             error_msg = str(e)
             if "not paired" in error_msg.lower():
                 raise DeviceNotPairedError(udid or "unknown") from e
-            logger.error(f"Backup failed: {e}")
+            logger.error("Backup failed: %s", e)
             raise BackupError(f"Backup failed: {e}") from e
 
     def restore_backup(
@@ -174,34 +660,31 @@ class BackupManager:
         """
         backup_dir = Path(backup_path) if backup_path else self._backup_dir
 
-        logger.info(f"Restoring backup from {backup_dir}")
+        logger.info("Restoring backup from %s", backup_dir)
 
         try:
             # Connect to device (USB or Wi-Fi)
-            lockdown = create_lockdown_client(udid)
-            device_name = lockdown.all_values.get("DeviceName", "Unknown")
-
-            logger.info(f"Restoring to {device_name}")
-
-            # Create backup service
-            backup_service = Mobilebackup2Service(lockdown)
-
-            # Wrapper for progress callback
-            def progress_wrapper(percentage: float) -> None:
-                if progress_callback:
-                    progress_callback(percentage)
-                logger.debug(f"Restore progress: {percentage:.1f}%")
-
-            # Perform restore
-            backup_service.restore(
-                backup_directory=str(backup_dir),
-                system=system,
-                settings=settings,
-                reboot=reboot,
-                password=password or "",
-                source=source_udid or "",
-                progress_callback=progress_wrapper,
-            )
+            with self._lockdown(udid) as lockdown:
+                device_name = lockdown.all_values.get("DeviceName", "Unknown")
+
+                logger.info("Restoring to %s", device_name)
+
+                # Create backup service
+                backup_service = Mobilebackup2Service(lockdown)
+
+                # Wrapper for progress callback, throttled to coarse updates
+                progress_wrapper = _throttled_progress(progress_callback, "Restore")
+
+                # Perform restore
+                backup_service.restore(
+                    backup_directory=str(backup_dir),
+                    system=system,
+                    settings=settings,
+                    reboot=reboot,
+                    password=password or "",
+                    source=source_udid or "",
+                    progress_callback=progress_wrapper,
+                )
 
             logger.info("Restore completed")
             return True
@@ -209,7 +692,7 @@ class BackupManager:
         except FileNotFoundError as e:
             raise DeviceNotFoundError(udid or "unknown") from e
         except Exception as e:
-            logger.error(f"Restore failed: {e}")
+            logger.error("Restore failed: %s", e)
             raise BackupError(f"Restore failed: {e}") from e
 
     def list_backups(
@@ -227,27 +710,57 @@ class BackupManager:
         """
         search_dir = Path(backup_dir) if backup_dir else self._backup_dir
 
-        if not search_dir.exists():
+        try:
+            dir_mtime = os.stat(search_dir).st_mtime_ns
+        except FileNotFoundError:
             return []
 
-        backups: list[BackupInfo] = []
+        # Reason: the directory mtime changes whenever a backup folder is
+        # added or removed, but not when an existing backup is updated in
+        # place, so the listing is also only trusted for LIST_CACHE_TTL
+        cached = self._list_cache.get(search_dir)
+        if (
+            cached is not None
+            and cached[0] == dir_mtime
+            and time.monotonic() - cached[1] < LIST_CACHE_TTL
+        ):
+            return list(cached[2])
+
+        # Check for Info.plist (indicates a backup); DirEntry's cached type
+        # avoids a stat per entry, and Path objects are only built for hits
+        with os.scandir(search_dir) as it:
+            candidates = [
+                Path(entry.path)
+                for entry in it
+                if entry.is_dir()
+                and os.path.lexists(os.path.join(entry.path, "Info.plist"))
+            ]
 
-        for item in search_dir.iterdir():
-            if not item.is_dir():
-                continue
+        backups: list[BackupInfo] = []
+        if not candidates:
+            self._list_cache[search_dir] = (dir_mtime, time.monotonic(), backups)
+            return []
 
-            # Check for Info.plist (indicates a backup)
-            info_plist = item / "Info.plist"
-            if info_plist.exists():
+        # Reason: each parse is blocking plist reads and stat calls, which
+        # release the GIL, so backups are parsed concurrently
+        workers = min(MAX_PARSE_WORKERS, (os.cpu_count() or 1) * 2, len(candidates))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._parse_backup_info, item): item
+                for item in candidates
+            }
+            for future in as_completed(futures):
                 try:
-                    backup_info = self._parse_backup_info(item)
-                    backups.append(backup_info)
+                    backups.append(future.result())
                 except Exception as e:
-                    logger.warning(f"Failed to parse backup at {item}: {e}")
+                    logger.warning(
+                        "Failed to parse backup at %s: %s", futures[future], e
+                    )
 
         # Sort by date, newest first
         backups.sort(key=lambda b: b.backup_date, reverse=True)
-        return backups
+        self._list_cache[search_dir] = (dir_mtime, time.monotonic(), backups)
+        return list(backups)
 
     def get_backup_info(
         self,
@@ -280,13 +793,13 @@ class BackupManager:
         Returns:
             True if deleted successfully.
         """
-        import shutil
-
         if not backup_path.exists():
             return False
 
         try:
-            shutil.rmtree(backup_path)
+            _parallel_rmtree(backup_path)
+            _parse_backup_info_cached.cache_clear()
+            self._list_cache.clear()
             logger.info(f"Deleted backup at {backup_path}")
             return True
         except Exception as e:
@@ -315,14 +828,14 @@ class BackupManager:
         backup_directory = Path(backup_dir) if backup_dir else self._backup_dir
 
         try:
-            lockdown = create_using_usbmux(serial=udid)
-            backup_service = Mobilebackup2Service(lockdown)
+            with self._lockdown(udid) as lockdown:
+                backup_service = Mobilebackup2Service(lockdown)
 
-            backup_service.change_password(
-                backup_directory=str(backup_directory),
-                old=old_password,
-                new=new_password,
-            )
+                backup_service.change_password(
+                    backup_directory=str(backup_directory),
+                    old=old_password,
+                    new=new_password,
+                )
 
             action = "enabled" if new_password else "disabled"
             logger.info(f"Backup encryption {action}")
@@ -337,46 +850,22 @@ class BackupManager:
         info_plist = backup_path / "Info.plist"
         manifest_plist = backup_path / "Manifest.plist"
 
-        if not info_plist.exists():
-            raise BackupError(f"No Info.plist found at {backup_path}")
-
         try:
-            with open(info_plist, "rb") as f:
-                info = plistlib.load(f)
-
-            # Check for encryption in Manifest.plist
-            is_encrypted = False
-            if manifest_plist.exists():
-                with open(manifest_plist, "rb") as f:
-                    manifest = plistlib.load(f)
-                    is_encrypted = manifest.get("IsEncrypted", False)
-
-            # Calculate backup size
-            size_bytes = sum(
-                f.stat().st_size for f in backup_path.rglob("*") if f.is_file()
-            )
+            info_mtime = info_plist.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise BackupError(f"No Info.plist found at {backup_path}") from None
 
-            # Parse date
-            backup_date = info.get("Last Backup Date")
-            if isinstance(backup_date, str):
-                backup_date = datetime.fromisoformat(backup_date)
-            elif not isinstance(backup_date, datetime):
-                backup_date = datetime.now()
-
-            return BackupInfo(
-                backup_id=info.get("Target Identifier", backup_path.name),
-                device_name=info.get("Device Name", "Unknown"),
-                device_udid=info.get("Target Identifier", backup_path.name),
-                ios_version=info.get("Product Version", "Unknown"),
-                build_version=info.get("Build Version", "Unknown"),
-                backup_date=backup_date,
-                is_encrypted=is_encrypted,
-                is_full=True,  # Can't easily determine from plist
-                size_bytes=size_bytes,
-                path=backup_path,
-                product_type=info.get("Product Type"),
-                serial_number=info.get("Serial Number"),
+        try:
+            try:
+                manifest_mtime = manifest_plist.stat().st_mtime_ns
+            except FileNotFoundError:
+                manifest_mtime = -1
+            tree_mtime = backup_path.stat().st_mtime_ns
+
+            meta = _parse_backup_info_cached(
+                str(backup_path), info_mtime, manifest_mtime, tree_mtime
             )
-
         except Exception as e:
             raise BackupError(f"Failed to parse backup info: {e}") from e
+
+        return BackupInfo(**meta._asdict(), is_full=True, path=backup_path)
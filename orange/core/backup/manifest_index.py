@@ -0,0 +1,104 @@
+"""
+Indexed copies of large Manifest.db files.
+
+The backup's own Manifest.db has no index on Files.domain. For readers that
+opt in, large manifests are copied into the cache directory and indexed
+there, leaving the backup itself untouched.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+from pathlib import Path
+
+from orange import constants
+
+logger = logging.getLogger(__name__)
+
+# With BackupReader(index_manifest=True), Manifest.db files at least this large without
+# an index on Files.domain are queried through an indexed copy kept under
+# the cache directory; smaller manifests scan quickly enough that the copy
+# would not pay off
+MANIFEST_INDEX_MIN_BYTES = 8 * 1024 * 1024
+
+# Indexed manifest copies kept in the cache directory; the least recently
+# built are deleted once a new copy pushes the count past this
+MANIFEST_INDEX_CACHE_LIMIT = 4
+
+# Index added to those copies; it also serves domain-only lookups
+_MANIFEST_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_files_domain_path "
+    "ON Files(domain, relativePath)"
+)
+
+
+def has_domain_index(conn: sqlite3.Connection) -> bool:
+    """Check whether any index on Files starts with the domain column."""
+    indexes = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'Files'"
+    ).fetchall()
+    for (name,) in indexes:
+        first = conn.execute(
+            "SELECT name FROM pragma_index_info(?) WHERE seqno = 0", (name,)
+        ).fetchone()
+        if first is not None and first[0] == "domain":
+            return True
+    return False
+
+
+def indexed_manifest_copy(manifest_db: Path) -> Path:
+    """
+    Return a copy of manifest_db with a (domain, relativePath) index.
+
+    The backup's own Manifest.db is never modified. Copies are keyed on
+    the source's path, size and mtime, so each backup is indexed once and
+    rebuilt only after the backup changes. At most
+    MANIFEST_INDEX_CACHE_LIMIT copies are kept; older ones are deleted
+    when a new copy is written.
+
+    Args:
+        manifest_db: Path to the backup's Manifest.db.
+
+    Returns:
+        Path to the indexed copy.
+
+    Raises:
+        OSError: If the copy cannot be written.
+        sqlite3.Error: If the index cannot be built.
+    """
+    source = manifest_db.resolve()
+    st = os.stat(source)
+    prefix = hashlib.sha1(str(source).encode()).hexdigest()[:16]
+    cache_dir = constants.DEFAULT_CACHE_DIR / "manifests"
+    target = cache_dir / f"{prefix}-{st.st_size}-{st.st_mtime_ns}.db"
+    if target.exists():
+        return target
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for stale in cache_dir.glob(f"{prefix}-*.db"):
+        stale.unlink(missing_ok=True)
+
+    tmp = target.with_suffix(".tmp")
+    shutil.copyfile(source, tmp)
+    try:
+        conn = sqlite3.connect(str(tmp))
+        try:
+            conn.execute(_MANIFEST_INDEX_SQL)
+            conn.execute("ANALYZE")
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(tmp, target)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+    copies = sorted(cache_dir.glob("*.db"), key=lambda p: p.stat().st_mtime_ns)
+    for old in copies[:-MANIFEST_INDEX_CACHE_LIMIT]:
+        old.unlink(missing_ok=True)
+
+    logger.debug(f"Indexed manifest copy for {source} at {target}")
+    return target
@@ -7,11 +7,13 @@ file information, and status.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
+
+from orange.utils import format_size
 
 
 class BackupStatus(Enum):
@@ -24,7 +26,7 @@ class BackupStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupInfo:
     """
     Metadata about an iOS backup.
@@ -66,33 +68,70 @@ class BackupInfo:
     @property
     def size_human(self) -> str:
         """Get human-readable size string."""
-        size = self.size_bytes
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if abs(size) < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} PB"
-
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
+        return format_size(self.size_bytes)
+
+    def to_dict(self, include_human: bool = True) -> dict[str, Any]:
+        """
+        Convert to dictionary for serialization.
+
+        Args:
+            include_human: Include the formatted size_human string.
+        """
+        data = self.to_json_dict(include_human)
+        data["backup_date"] = self.backup_date.isoformat()
+        return data
+
+    def to_json_dict(self, include_human: bool = True) -> dict[str, Any]:
+        """
+        Convert to a dictionary for a native JSON encoder.
+
+        Same as to_dict, but backup_date stays a datetime so an encoder
+        such as orjson can format it in C, e.g.
+        orjson.dumps(info.to_json_dict(), option=orjson.OPT_NAIVE_UTC).
+        The stdlib json module cannot encode it; use to_dict there.
+
+        Args:
+            include_human: Include the formatted size_human string.
+        """
+        data = {
             "backup_id": self.backup_id,
             "device_name": self.device_name,
             "device_udid": self.device_udid,
             "ios_version": self.ios_version,
             "build_version": self.build_version,
-            "backup_date": self.backup_date.isoformat(),
+            "backup_date": self.backup_date,
             "is_encrypted": self.is_encrypted,
             "is_full": self.is_full,
             "size_bytes": self.size_bytes,
-            "size_human": self.size_human,
-            "path": str(self.path),
-            "product_type": self.product_type,
-            "serial_number": self.serial_number,
         }
+        if include_human:
+            data["size_human"] = self.size_human
+        data["path"] = str(self.path)
+        data["product_type"] = self.product_type
+        data["serial_number"] = self.serial_number
+        return data
+
+
+class BackupFileTuple(NamedTuple):
+    """
+    Compact, immutable form of BackupFile for bulk manifest enumeration.
+
+    A Manifest.db can list hundreds of thousands of files; tuples cost
+    less memory than dataclass instances. Fields match BackupFile.
+    """
+
+    file_id: str
+    domain: str
+    relative_path: str
+    flags: int
+    size: int
+    mode: int
+    modified_time: Optional[datetime] = None
+    is_directory: bool = False
+    is_encrypted: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupFile:
     """
     Information about a file within a backup.
@@ -104,7 +143,8 @@ class BackupFile:
         flags: File flags
         size: File size in bytes
         mode: File mode/permissions
-        modified_time: Last modification time
+        modified_time: Last modification time, as a timezone-aware UTC
+            datetime (use .astimezone() for local time)
         is_directory: Whether this is a directory
         is_encrypted: Whether the file content is encrypted
     """
@@ -119,6 +159,25 @@ class BackupFile:
     is_directory: bool = False
     is_encrypted: bool = False
 
+    @classmethod
+    def from_tuple(cls, t: BackupFileTuple) -> "BackupFile":
+        """Build a BackupFile from its compact tuple form."""
+        return cls(*t)
+
+    def to_tuple(self) -> BackupFileTuple:
+        """Convert to the compact tuple form."""
+        return BackupFileTuple(
+            self.file_id,
+            self.domain,
+            self.relative_path,
+            self.flags,
+            self.size,
+            self.mode,
+            self.modified_time,
+            self.is_directory,
+            self.is_encrypted,
+        )
+
     @property
     def full_path(self) -> str:
         """Get the full path including domain."""
@@ -131,6 +190,18 @@ class BackupFile:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
+        data = self.to_json_dict()
+        if self.modified_time:
+            data["modified_time"] = self.modified_time.isoformat()
+        return data
+
+    def to_json_dict(self) -> dict[str, Any]:
+        """
+        Convert to a dictionary for a native JSON encoder.
+
+        Same as to_dict, but modified_time stays a datetime (see
+        BackupInfo.to_json_dict).
+        """
         return {
             "file_id": self.file_id,
             "domain": self.domain,
@@ -139,13 +210,13 @@ class BackupFile:
             "flags": self.flags,
             "size": self.size,
             "mode": self.mode,
-            "modified_time": self.modified_time.isoformat() if self.modified_time else None,
+            "modified_time": self.modified_time,
             "is_directory": self.is_directory,
             "is_encrypted": self.is_encrypted,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupProgress:
     """Progress information for a backup/restore operation."""
 
@@ -8,19 +8,82 @@ extracting files, and querying backup databases.
 from __future__ import annotations
 
 import logging
+import os
 import plistlib
-import shutil
 import sqlite3
 import tempfile
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import suppress
+from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Any, Iterator, Optional
-
-from orange.core.backup.models import BackupFile, BackupInfo
+from typing import Any, Iterable, Iterator, Optional
+
+from orange.core.backup.blobs import copy_blob
+from orange.core.backup.bplist import load_manifest_metadata
+from orange.core.backup.manager import BackupManager
+from orange.core.backup.manifest_index import (
+    MANIFEST_INDEX_MIN_BYTES,
+    has_domain_index,
+    indexed_manifest_copy,
+)
+from orange.core.backup.models import BackupFile, BackupFileTuple, BackupInfo
 from orange.exceptions import BackupError
 
 logger = logging.getLogger(__name__)
 
+# Read-side tuning applied once per Manifest.db connection. Write-side
+# pragmas (journal_mode, synchronous) are deliberately omitted: the
+# manifest is opened read-only and must not be converted to WAL.
+_MANIFEST_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+# Manifest columns read by the queries below; the "file" blob is only
+# selected when per-file metadata is wanted
+_FILE_COLUMNS = "fileID, domain, relativePath, file"
+_FILE_COLUMNS_NO_METADATA = "fileID, domain, relativePath"
+
+# Single-file lookup; prepared once per connection (see _get_conn)
+_GET_FILE_SQL = f"SELECT {_FILE_COLUMNS} FROM Files WHERE fileID = ?"
+
+# Prepared statements kept per manifest connection; list_files builds a
+# handful of variants, so the sqlite3 default of 128 is raised for headroom
+MANIFEST_STATEMENT_CACHE = 256
+
+
+# Parsed manifest rows kept per reader, keyed by fileID, so lookups that
+# revisit a file (list_files followed by extract_file) skip the decode
+ROW_CACHE_SIZE = 8192
+
+# Upper bound on concurrent copies in extract_files
+MAX_EXTRACT_WORKERS = 8
+
+# File IDs looked up per IN (...) query; stays well under SQLite's
+# default limit on bound parameters
+EXTRACT_QUERY_CHUNK = 500
+
+# Manifest timestamps are converted as UTC-aware datetimes; local time
+# conversion would consult the libc timezone state for every row
+_UTC = timezone.utc
+
+
+def _disambiguate(dest_path: Path, file_id: str, taken: set[Path]) -> Path:
+    """Return dest_path renamed with a file ID suffix not already in taken."""
+    for tag in (file_id[:8], file_id):
+        candidate = dest_path.with_name(f"{dest_path.stem}-{tag}{dest_path.suffix}")
+        if candidate not in taken:
+            return candidate
+    return candidate
+
+
+def _escape_like(text: str) -> str:
+    """Escape LIKE wildcards so text matches literally (ESCAPE '\\')."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
 
 class BackupReader:
     """
@@ -47,6 +110,7 @@ class BackupReader:
         self,
         backup_path: Path,
         password: Optional[str] = None,
+        index_manifest: bool = False,
     ):
         """
         Initialize backup reader.
@@ -54,15 +118,25 @@ class BackupReader:
         Args:
             backup_path: Path to the backup directory.
             password: Password for encrypted backups.
+            index_manifest: Query large manifests that lack a domain index
+                through an indexed copy under the cache directory (see
+                indexed_manifest_copy). The first open pays for copying
+                the whole Manifest.db, so this only helps readers that run
+                many domain or exact-path lookups; substring path filters
+                (LIKE '%...%') cannot use the index either way.
 
         Raises:
             BackupError: If backup path is invalid.
         """
         self._path = Path(backup_path)
         self._password = password
+        self._index_manifest = index_manifest
         self._manifest_db: Optional[Path] = None
         self._info: Optional[BackupInfo] = None
         self._is_encrypted: bool = False
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.Lock()
+        self._row_cache: dict[str, BackupFileTuple] = {}
 
         if not self._path.exists():
             raise BackupError(f"Backup path does not exist: {backup_path}")
@@ -80,6 +154,77 @@ class BackupReader:
         """Check if backup is encrypted."""
         return self._is_encrypted
 
+    def close(self) -> None:
+        """Close the cached Manifest.db connection and drop parsed rows."""
+        self._row_cache.clear()
+        with self._conn_lock:
+            conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.close()
+
+    def __enter__(self) -> "BackupReader":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def __del__(self) -> None:
+        """Close the connection if the reader is garbage collected."""
+        with suppress(Exception):
+            self.close()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """
+        Return the shared Manifest.db connection, opening it on first use.
+
+        Reusing one connection keeps SQLite's parsed schema and page cache
+        warm across queries instead of rebuilding them on every call. With
+        index_manifest, large manifests lacking a domain index are opened
+        through an indexed copy (see indexed_manifest_copy).
+
+        Returns:
+            Read-only connection with sqlite3.Row as its row factory.
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened.
+        """
+        with self._conn_lock:
+            if self._conn is None:
+                conn = self._open_manifest(self._manifest_db)
+                if (
+                    self._index_manifest
+                    and os.stat(self._manifest_db).st_size >= MANIFEST_INDEX_MIN_BYTES
+                    and not has_domain_index(conn)
+                ):
+                    try:
+                        indexed = indexed_manifest_copy(self._manifest_db)
+                    except (OSError, sqlite3.Error) as e:
+                        logger.debug(f"Could not index manifest copy: {e}")
+                    else:
+                        conn.close()
+                        conn = self._open_manifest(indexed)
+                conn.row_factory = sqlite3.Row
+                for pragma in _MANIFEST_PRAGMAS:
+                    conn.execute(pragma)
+                # Reason: prepares the get_file statement up front so the
+                # first real lookup already hits the statement cache
+                conn.execute(_GET_FILE_SQL, ("",)).fetchone()
+                self._conn = conn
+            return self._conn
+
+    @staticmethod
+    def _open_manifest(path: Path) -> sqlite3.Connection:
+        """Open a manifest database read-only."""
+        uri = path.resolve().as_uri() + "?mode=ro"
+        return sqlite3.connect(
+            uri,
+            uri=True,
+            check_same_thread=False,
+            cached_statements=MANIFEST_STATEMENT_CACHE,
+        )
+
     def _load_manifest(self) -> None:
         """Load and validate the manifest files."""
         manifest_plist = self._path / "Manifest.plist"
@@ -119,8 +264,6 @@ class BackupReader:
         if self._info is not None:
             return self._info
 
-        from orange.core.backup.manager import BackupManager
-
         manager = BackupManager()
         self._info = manager.get_backup_info(self._path)
         return self._info
@@ -129,13 +272,19 @@ class BackupReader:
         self,
         domain: Optional[str] = None,
         path_filter: Optional[str] = None,
+        load_metadata: bool = True,
+        exact_path: bool = False,
     ) -> list[BackupFile]:
         """
         List files in the backup.
 
         Args:
             domain: Filter by domain (e.g., "HomeDomain", "CameraRollDomain").
-            path_filter: Filter by path substring.
+            path_filter: Filter by path substring. "%" and "_" match literally.
+            load_metadata: Whether to decode each file's metadata blob. When
+                False, size, mode, flags and modified_time are left empty.
+            exact_path: Match path_filter against the whole relative path
+                instead of as a substring, which lets SQLite use an index.
 
         Returns:
             List of BackupFile objects.
@@ -146,12 +295,11 @@ class BackupReader:
         files: list[BackupFile] = []
 
         try:
-            conn = sqlite3.connect(str(self._manifest_db))
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            cursor = self._get_conn().cursor()
 
             # Build query
-            query = "SELECT * FROM Files"
+            columns = _FILE_COLUMNS if load_metadata else _FILE_COLUMNS_NO_METADATA
+            query = f"SELECT {columns} FROM Files"
             params: list[Any] = []
             conditions: list[str] = []
 
@@ -159,9 +307,12 @@ class BackupReader:
                 conditions.append("domain = ?")
                 params.append(domain)
 
-            if path_filter:
-                conditions.append("relativePath LIKE ?")
-                params.append(f"%{path_filter}%")
+            if path_filter and exact_path:
+                conditions.append("relativePath = ?")
+                params.append(path_filter)
+            elif path_filter:
+                conditions.append("relativePath LIKE ? ESCAPE '\\'")
+                params.append(f"%{_escape_like(path_filter)}%")
 
             if conditions:
                 query += " WHERE " + " AND ".join(conditions)
@@ -169,12 +320,10 @@ class BackupReader:
             cursor.execute(query, params)
 
             for row in cursor.fetchall():
-                file_info = self._parse_file_row(row)
+                file_info = self._parse_file_row(row, load_metadata)
                 if file_info:
                     files.append(file_info)
 
-            conn.close()
-
         except sqlite3.Error as e:
             raise BackupError(f"Failed to read manifest: {e}") from e
 
@@ -191,12 +340,17 @@ class BackupReader:
             raise BackupError("Manifest.db not found")
 
         try:
-            conn = sqlite3.connect(str(self._manifest_db))
-            cursor = conn.cursor()
-            cursor.execute("SELECT DISTINCT domain FROM Files ORDER BY domain")
-            domains = [row[0] for row in cursor.fetchall()]
-            conn.close()
-            return domains
+            # Reason: one newline-joined string crosses into Python instead
+            # of a Row object per domain; sorting the split list matches
+            # ORDER BY's binary collation and is linear on presorted input
+            cursor = self._get_conn().cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                "SELECT group_concat(domain, char(10)) "
+                "FROM (SELECT DISTINCT domain FROM Files ORDER BY domain)"
+            )
+            joined = cursor.fetchone()[0]
+            return sorted(joined.split("\n")) if joined else []
 
         except sqlite3.Error as e:
             raise BackupError(f"Failed to list domains: {e}") from e
@@ -215,12 +369,9 @@ class BackupReader:
             return None
 
         try:
-            conn = sqlite3.connect(str(self._manifest_db))
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM Files WHERE fileID = ?", (file_id,))
+            cursor = self._get_conn().cursor()
+            cursor.execute(_GET_FILE_SQL, (file_id,))
             row = cursor.fetchone()
-            conn.close()
 
             if row:
                 return self._parse_file_row(row)
@@ -229,11 +380,24 @@ class BackupReader:
         except sqlite3.Error:
             return None
 
+    def _check_decryptable(self) -> None:
+        """
+        Refuse extraction from encrypted backups.
+
+        Raises:
+            BackupError: If a password was given for an encrypted backup,
+                since decryption is not yet implemented.
+        """
+        # TODO: Implement decryption
+        if self._is_encrypted and self._password:
+            raise BackupError("Encrypted file extraction not yet implemented")
+
     def extract_file(
         self,
         file_id: str,
         destination: Path,
         preserve_path: bool = False,
+        preserve_mtime: bool = False,
     ) -> Optional[Path]:
         """
         Extract a file from the backup.
@@ -242,46 +406,171 @@ class BackupReader:
             file_id: The file's identifier.
             destination: Directory to extract to.
             preserve_path: Whether to preserve the domain/relative path structure.
+            preserve_mtime: Whether to set the extracted file's modification
+                time to the one recorded in the manifest.
 
         Returns:
             Path to extracted file, or None if not found.
+
+        Raises:
+            BackupError: If the backup is encrypted (decryption is not yet
+                supported).
         """
+        self._check_decryptable()
+
         file_info = self.get_file(file_id)
         if not file_info:
             logger.warning(f"File not found: {file_id}")
             return None
 
-        # Find the actual file in backup
-        # Files are stored as: backup_path / file_id[:2] / file_id
-        source = self._path / file_id[:2] / file_id
+        dest_path = self._dest_path(file_info, Path(destination), preserve_path)
 
-        if not source.exists():
-            # Try without subdirectory (older format)
-            source = self._path / file_id
-            if not source.exists():
-                logger.warning(f"Backup file not found: {file_id}")
-                return None
+        # Directory rows have no blob in the backup; recreate them directly
+        if file_info.is_directory:
+            dest_path.mkdir(parents=True, exist_ok=True)
+            return dest_path
 
-        # Determine destination path
-        dest_dir = Path(destination)
-        if preserve_path:
-            dest_path = dest_dir / file_info.domain / file_info.relative_path
-        else:
-            dest_path = dest_dir / file_info.filename
+        source = self._find_source(file_id)
+        if source is None:
+            logger.warning(f"Backup file not found: {file_id}")
+            return None
 
         dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Copy file
-        if self._is_encrypted and self._password:
-            # TODO: Implement decryption
-            logger.warning("Encrypted file extraction not yet implemented")
-            return None
-        else:
-            shutil.copy2(source, dest_path)
+        # Reason: no copystat round-trip as with copy2; the blob's own
+        # timestamps are the backup time, not the original file's
+        copy_blob(source, dest_path)
+        if preserve_mtime and file_info.modified_time is not None:
+            mtime = file_info.modified_time.timestamp()
+            os.utime(dest_path, (mtime, mtime))
 
         logger.debug(f"Extracted {file_info.filename} to {dest_path}")
         return dest_path
 
+    def extract_files(
+        self,
+        file_ids: Iterable[str],
+        destination: Path,
+        preserve_path: bool = False,
+        max_workers: int = MAX_EXTRACT_WORKERS,
+    ) -> dict[str, Path]:
+        """
+        Extract many files from the backup in one pass.
+
+        Looks up all requested files with batched IN (...) queries and
+        copies them concurrently, instead of one query and one serial copy
+        per file as repeated extract_file calls would do.
+
+        Args:
+            file_ids: Identifiers of the files to extract.
+            destination: Directory to extract to.
+            preserve_path: Whether to preserve the domain/relative path structure.
+            max_workers: Maximum number of concurrent copies.
+
+        Returns:
+            Mapping of file ID to extracted path. Files missing from the
+            manifest or the backup directory are left out. When several
+            files would land on the same path, all but the one with the
+            lowest ID get "-<file ID prefix>" appended to their name.
+
+        Raises:
+            BackupError: If the manifest cannot be read, or the backup is
+                encrypted (decryption is not yet supported).
+        """
+        if self._manifest_db is None:
+            raise BackupError("Manifest.db not found")
+
+        self._check_decryptable()
+
+        dest_dir = Path(destination)
+        copies: dict[str, tuple[Path, Path]] = {}
+        directories: dict[str, Path] = {}
+        ids = iter(dict.fromkeys(file_ids))
+
+        try:
+            cursor = self._get_conn().cursor()
+            while chunk := list(islice(ids, EXTRACT_QUERY_CHUNK)):
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT {_FILE_COLUMNS} FROM Files "
+                    f"WHERE fileID IN ({placeholders})",
+                    chunk,
+                )
+                for row in cursor.fetchall():
+                    file_info = self._parse_file_row(row)
+                    if file_info is None:
+                        continue
+                    dest_path = self._dest_path(file_info, dest_dir, preserve_path)
+                    if file_info.is_directory:
+                        directories[file_info.file_id] = dest_path
+                        continue
+                    source = self._find_source(file_info.file_id)
+                    if source is None:
+                        logger.warning(f"Backup file not found: {file_info.file_id}")
+                        continue
+                    copies[file_info.file_id] = (source, dest_path)
+        except sqlite3.Error as e:
+            raise BackupError(f"Failed to read manifest: {e}") from e
+
+        # Reason: without preserve_path, files from different domains can
+        # share a basename (Info.plist, *.sqlite); copying them concurrently
+        # to one path would interleave their writes, so later ones get the
+        # file ID appended to their name
+        taken = set(directories.values())
+        for file_id in sorted(copies):
+            source, dest_path = copies[file_id]
+            if dest_path in taken:
+                dest_path = _disambiguate(dest_path, file_id, taken)
+                copies[file_id] = (source, dest_path)
+            taken.add(dest_path)
+
+        # Directory rows have no blob in the backup; recreate them directly
+        for dest_path in directories.values():
+            dest_path.mkdir(parents=True, exist_ok=True)
+
+        extracted: dict[str, Path] = dict(directories)
+        if not copies:
+            return extracted
+
+        for parent in {dest.parent for _, dest in copies.values()}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        # Reason: copies spend their time in copy_file_range/sendfile calls,
+        # which release the GIL, so copies overlap across threads
+        workers = max(1, min(max_workers, len(copies)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(copy_blob, source, dest): file_id
+                for file_id, (source, dest) in copies.items()
+            }
+            for future in as_completed(futures):
+                file_id = futures[future]
+                try:
+                    extracted[file_id] = future.result()
+                except OSError as e:
+                    logger.warning(f"Failed to extract {file_id}: {e}")
+
+        logger.debug(f"Extracted {len(extracted)} files to {dest_dir}")
+        return extracted
+
+    def _find_source(self, file_id: str) -> Optional[Path]:
+        """Locate a file's blob inside the backup directory."""
+        # Files are stored as: backup_path / file_id[:2] / file_id
+        source = self._path / file_id[:2] / file_id
+        if source.exists():
+            return source
+
+        # Try without subdirectory (older format)
+        source = self._path / file_id
+        return source if source.exists() else None
+
+    @staticmethod
+    def _dest_path(file_info: BackupFile, dest_dir: Path, preserve_path: bool) -> Path:
+        """Return where a file should be extracted to under dest_dir."""
+        if preserve_path:
+            return dest_dir / file_info.domain / file_info.relative_path
+        return dest_dir / file_info.filename
+
     def extract_database(
         self,
         domain: str,
@@ -299,23 +588,27 @@ class BackupReader:
         Returns:
             Path to the extracted database, or None if not found.
         """
-        # Find the file
-        files = self.list_files(domain=domain, path_filter=relative_path)
+        # Find the file, preferring an exact match
+        # Reason: only file IDs and paths are needed to pick the match;
+        # extract_file looks up its metadata again by ID
+        files = self.list_files(
+            domain=domain,
+            path_filter=relative_path,
+            load_metadata=False,
+            exact_path=True,
+        )
+
+        if not files:
+            # Use first substring match
+            files = self.list_files(
+                domain=domain, path_filter=relative_path, load_metadata=False
+            )
 
         if not files:
             logger.warning(f"Database not found: {domain}/{relative_path}")
             return None
 
-        # Find exact match
-        target = None
-        for f in files:
-            if f.relative_path == relative_path:
-                target = f
-                break
-
-        if not target:
-            # Use first match
-            target = files[0]
+        target = files[0]
 
         # Extract to temp or specified location
         if destination is None:
@@ -327,54 +620,99 @@ class BackupReader:
         self,
         domain: Optional[str] = None,
         batch_size: int = 1000,
+        load_metadata: bool = True,
     ) -> Iterator[BackupFile]:
         """
         Iterate over files in the backup (memory-efficient).
 
         Args:
             domain: Filter by domain.
-            batch_size: Number of rows to fetch at a time.
+            batch_size: Cursor arraysize; see iter_file_tuples.
+            load_metadata: Whether to decode each file's metadata blob.
 
         Yields:
             BackupFile objects.
         """
+        for t in self.iter_file_tuples(domain, batch_size, load_metadata):
+            yield BackupFile.from_tuple(t)
+
+    def iter_file_tuples(
+        self,
+        domain: Optional[str] = None,
+        batch_size: int = 1000,
+        load_metadata: bool = True,
+    ) -> Iterator[BackupFileTuple]:
+        """
+        Iterate over files in the backup as compact tuples.
+
+        Use this instead of iter_files when enumerating a whole manifest;
+        convert individual entries with BackupFile.from_tuple as needed.
+
+        Args:
+            domain: Filter by domain.
+            batch_size: Cursor arraysize. Rows are streamed one at a time,
+                so this no longer bounds how many are held in memory.
+            load_metadata: Whether to decode each file's metadata blob.
+
+        Yields:
+            BackupFileTuple objects.
+        """
         if self._manifest_db is None:
             return
 
         try:
-            conn = sqlite3.connect(str(self._manifest_db))
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            cursor = self._get_conn().cursor()
 
-            query = "SELECT * FROM Files"
+            columns = _FILE_COLUMNS if load_metadata else _FILE_COLUMNS_NO_METADATA
+            query = f"SELECT {columns} FROM Files"
             params: list[Any] = []
 
             if domain:
                 query += " WHERE domain = ?"
                 params.append(domain)
 
+            cursor.arraysize = batch_size
             cursor.execute(query, params)
 
-            while True:
-                rows = cursor.fetchmany(batch_size)
-                if not rows:
-                    break
-
-                for row in rows:
-                    file_info = self._parse_file_row(row)
-                    if file_info:
-                        yield file_info
-
-            conn.close()
+            # Reason: iterating the cursor steps SQLite one row at a time
+            # instead of materializing a list of batch_size rows per fetch
+            for row in cursor:
+                file_info = self._parse_file_tuple(row, load_metadata)
+                if file_info:
+                    yield file_info
 
         except sqlite3.Error as e:
             logger.error(f"Error iterating files: {e}")
 
-    def _parse_file_row(self, row: sqlite3.Row) -> Optional[BackupFile]:
+    def _parse_file_row(
+        self, row: sqlite3.Row, load_metadata: bool = True
+    ) -> Optional[BackupFile]:
         """Parse a database row into a BackupFile object."""
+        t = self._parse_file_tuple(row, load_metadata)
+        return BackupFile.from_tuple(t) if t else None
+
+    def _parse_file_tuple(
+        self, row: sqlite3.Row, load_metadata: bool = True
+    ) -> Optional[BackupFileTuple]:
+        """
+        Parse a database row into a BackupFileTuple.
+
+        Args:
+            row: Manifest row with fileID, domain and relativePath columns,
+                plus file when load_metadata is True.
+            load_metadata: Whether to decode the row's metadata blob.
+
+        Returns:
+            BackupFileTuple, or None if the row could not be parsed.
+        """
         try:
+            if load_metadata:
+                cached = self._row_cache.get(row["fileID"])
+                if cached is not None:
+                    return cached
+
             # Parse the file blob if present
-            file_blob = row["file"]
+            file_blob = row["file"] if load_metadata else None
             flags = 0
             size = 0
             mode = 0
@@ -383,34 +721,16 @@ class BackupReader:
             if file_blob:
                 # The file column contains a binary plist (NSKeyedArchiver format)
                 try:
-                    file_data = plistlib.loads(file_blob)
-
-                    # Handle NSKeyedArchiver format where data is in $objects[1]
-                    if "$objects" in file_data and len(file_data["$objects"]) > 1:
-                        metadata = file_data["$objects"][1]
-                        if isinstance(metadata, dict):
-                            size = metadata.get("Size", 0)
-                            mode = metadata.get("Mode", 0)
-                            flags = metadata.get("Flags", 0)
-
-                            # Parse modification time
-                            mtime = metadata.get("LastModified")
-                            if mtime:
-                                modified_time = datetime.fromtimestamp(mtime)
-                    else:
-                        # Fallback for older backup formats
-                        size = file_data.get("Size", 0)
-                        mode = file_data.get("Mode", 0)
-                        flags = file_data.get("Flags", 0)
+                    size, mode, flags, mtime = load_manifest_metadata(file_blob)
 
-                        mtime = file_data.get("LastModified")
-                        if mtime:
-                            modified_time = datetime.fromtimestamp(mtime)
+                    # Parse modification time
+                    if mtime:
+                        modified_time = datetime.fromtimestamp(mtime, _UTC)
 
                 except Exception:
                     pass
 
-            return BackupFile(
+            parsed = BackupFileTuple(
                 file_id=row["fileID"],
                 domain=row["domain"],
                 relative_path=row["relativePath"],
@@ -422,6 +742,14 @@ class BackupReader:
                 is_encrypted=self._is_encrypted,
             )
 
+            if load_metadata:
+                cache = self._row_cache
+                if len(cache) >= ROW_CACHE_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    del cache[next(iter(cache))]
+                cache[parsed.file_id] = parsed
+            return parsed
+
         except Exception as e:
             logger.debug(f"Failed to parse file row: {e}")
             return None
@@ -26,7 +26,12 @@ Example:
     lockdown = create_lockdown_client(udid)  # Auto-detects USB or Wi-Fi
 """
 
+import functools
+import os
+import plistlib
+from pathlib import Path
 from typing import Optional
+
 from pymobiledevice3.lockdown import create_using_usbmux, create_using_tcp, LockdownClient
 
 from orange.core.connection.device import (
@@ -47,6 +52,7 @@ from orange.core.connection.wireless import (
     is_device_reachable,
     LOCKDOWN_PORT,
 )
+from orange.exceptions import DeviceNotFoundError
 
 
 def create_lockdown_client(udid: Optional[str] = None) -> LockdownClient:
@@ -65,8 +71,6 @@ def create_lockdown_client(udid: Optional[str] = None) -> LockdownClient:
     Raises:
         DeviceNotFoundError: If device cannot be found via USB or Wi-Fi.
     """
-    from orange.exceptions import DeviceNotFoundError
-
     # First, try USB connection via usbmuxd
     try:
         return create_using_usbmux(serial=udid)
@@ -112,9 +116,6 @@ def create_lockdown_client(udid: Optional[str] = None) -> LockdownClient:
 
 def _load_pairing_record(udid: str) -> Optional[dict]:
     """Load pairing record for a device from the system lockdown directory."""
-    import plistlib
-    from pathlib import Path
-
     # Standard pairing record locations
     pairing_paths = [
         Path(f"/var/lib/lockdown/{udid}.plist"),  # Linux
@@ -122,15 +123,38 @@ def _load_pairing_record(udid: str) -> Optional[dict]:
     ]
 
     for path in pairing_paths:
-        if path.exists():
-            try:
-                with open(path, "rb") as f:
-                    return plistlib.load(f)
-            except Exception:
-                pass
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+        record = _read_pairing_record(str(path), mtime_ns)
+        if record is not None:
+            # Reason: callers get their own copy so the cached record
+            # cannot be mutated through them
+            return dict(record)
 
     return None
 
+
+@functools.lru_cache(maxsize=32)
+def _read_pairing_record(path: str, mtime_ns: int) -> Optional[dict]:
+    """
+    Parse a pairing record, cached until the file's mtime changes.
+
+    Args:
+        path: Path to the pairing record plist.
+        mtime_ns: Modification time of path; part of the cache key only.
+
+    Returns:
+        The parsed record, or None if it could not be read.
+    """
+    try:
+        with open(path, "rb") as f:
+            return plistlib.load(f)
+    except Exception:
+        return None
+
+
 __all__ = [
     "ConnectionManager",
     "ConnectionType",
@@ -14,8 +14,13 @@ Example:
 from __future__ import annotations
 
 import logging
+import plistlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import Any, Optional
 
 from pymobiledevice3.lockdown import create_using_usbmux, create_using_tcp, LockdownClient
@@ -30,6 +35,13 @@ from orange.exceptions import DeviceNotFoundError, ConnectionError
 # Standard Wi-Fi sync port
 LOCKDOWN_PORT = 62078
 
+# How long lockdown values read for a device are reused by later
+# refreshes before the device is queried again
+DEVICE_VALUES_TTL = 5.0  # seconds
+
+# Upper bound on devices probed concurrently during a refresh
+MAX_PROBE_WORKERS = 8
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,7 +63,7 @@ class DeviceState(Enum):
     LOCKED = "locked"
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceInfo:
     """
     Container for iOS device information.
@@ -155,6 +167,10 @@ class DeviceDetector:
         """
         self._include_wifi = include_wifi
         self._device_cache: dict[str, DeviceInfo] = {}
+        self._values_cache: dict[
+            tuple[str, ConnectionType], tuple[float, dict[str, Any]]
+        ] = {}
+        self._cache_lock = threading.Lock()
         logger.debug(
             f"DeviceDetector initialized (include_wifi={include_wifi})"
         )
@@ -217,21 +233,34 @@ class DeviceDetector:
 
     def _refresh_device_list(self) -> None:
         """Internal method to refresh the device cache."""
-        self._device_cache.clear()
+        with self._cache_lock:
+            self._device_cache.clear()
 
         # First, try USB devices via usbmuxd
+        mux_devices: list[Any] = []
         try:
-            mux_devices = usbmux_list_devices()
-
-            for mux_device in mux_devices:
-                try:
-                    device_info = self._get_device_info(mux_device)
-                    if device_info:
-                        self._device_cache[device_info.udid] = device_info
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to get info for device: {e}"
-                    )
+            mux_devices = list(usbmux_list_devices())
+
+            if mux_devices:
+                # Reason: each probe waits on lockdown socket round-trips,
+                # which release the GIL, so devices are queried concurrently
+                workers = min(MAX_PROBE_WORKERS, len(mux_devices))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(self._get_device_info, mux_device)
+                        for mux_device in mux_devices
+                    ]
+                    # Collected in submission order to keep the usbmux ordering
+                    for future in futures:
+                        try:
+                            device_info = future.result()
+                            if device_info:
+                                with self._cache_lock:
+                                    self._device_cache[device_info.udid] = device_info
+                        except Exception as e:
+                            logger.warning(
+                                f"Failed to get info for device: {e}"
+                            )
 
         except (FileNotFoundError, OSError) as e:
             # Reason: usbmuxd socket not found - daemon not running or no device
@@ -240,6 +269,10 @@ class DeviceDetector:
         except MuxException as e:
             logger.debug(f"usbmuxd error (may be normal if no USB devices): {e}")
 
+        # Reason: UDIDs that have left the usbmux list would otherwise keep
+        # their lockdown values in memory for the life of the detector
+        self._evict_stale_values(mux_devices)
+
         # Then, try Wi-Fi devices via Bonjour if enabled
         if self._include_wifi:
             self._discover_wifi_devices()
@@ -267,7 +300,8 @@ class DeviceDetector:
 
                     device_info = self._get_wifi_device_info(address, port)
                     if device_info and device_info.udid not in self._device_cache:
-                        self._device_cache[device_info.udid] = device_info
+                        with self._cache_lock:
+                            self._device_cache[device_info.udid] = device_info
                         logger.debug(f"Found Wi-Fi device: {device_info.name} at {address}")
 
                 except Exception as e:
@@ -359,9 +393,6 @@ class DeviceDetector:
 
     def _get_available_pairing_records(self) -> dict[str, dict]:
         """Load all available pairing records from the system."""
-        import plistlib
-        from pathlib import Path
-
         records: dict[str, dict] = {}
 
         # Standard pairing record locations
@@ -409,9 +440,7 @@ class DeviceDetector:
                     return None
 
         try:
-            # Create lockdown client to get device info
-            lockdown = create_using_usbmux(serial=udid)
-            all_values = lockdown.all_values
+            all_values = self._get_all_values(udid, conn_type)
 
             # Extract device information
             device_info = DeviceInfo(
@@ -459,6 +488,44 @@ class DeviceDetector:
             logger.warning(f"Failed to get device info for {udid}: {e}")
             return None
 
+    def _get_all_values(self, udid: str, conn_type: ConnectionType) -> dict[str, Any]:
+        """
+        Return a device's lockdown values, reusing a recent read.
+
+        Repeated refreshes (e.g. a UI polling list_devices) would otherwise
+        open a new lockdown session per device every time.
+
+        Args:
+            udid: Device UDID.
+            conn_type: How the device is attached.
+
+        Returns:
+            The lockdown all_values dictionary.
+        """
+        key = (udid, conn_type)
+        cached = self._values_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < DEVICE_VALUES_TTL:
+            return cached[1]
+
+        # Create lockdown client to get device info; only the values are
+        # kept, so release the session straight away
+        lockdown = create_using_usbmux(serial=udid)
+        try:
+            all_values = lockdown.all_values
+        finally:
+            lockdown.close()
+        with self._cache_lock:
+            self._values_cache[key] = (now, all_values)
+        return all_values
+
+    def _evict_stale_values(self, mux_devices: list[Any]) -> None:
+        """Forget cached lockdown values for devices no longer attached."""
+        present = {mux_device.serial for mux_device in mux_devices}
+        with self._cache_lock:
+            for key in [k for k in self._values_cache if k[0] not in present]:
+                del self._values_cache[key]
+
     def _get_battery_level(self, all_values: dict[str, Any]) -> Optional[int]:
         """Extract battery level from device values."""
         battery = all_values.get("BatteryCurrentCapacity")
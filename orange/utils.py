@@ -0,0 +1,38 @@
+"""
+Shared helpers used across the Orange package.
+
+Small, dependency-free utilities that more than one subpackage needs.
+"""
+
+from __future__ import annotations
+
+import zipfile
+
+# Size units and their divisors; each unit step is 10 more bits
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_SIZE_DIVISORS = tuple(1 << (10 * i) for i in range(len(_SIZE_UNITS)))
+
+
+def format_size(size_bytes: int) -> str:
+    """Format byte size to human-readable string."""
+    if size_bytes == 0:
+        return "0 B"
+
+    # Reason: bit_length picks the unit directly instead of dividing by
+    # 1024 once per unit until the value fits
+    i = min((abs(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / _SIZE_DIVISORS[i]:.1f} {_SIZE_UNITS[i]}"
+
+
+def set_zip_compresslevel(zinfo: zipfile.ZipInfo, level: int | None) -> None:
+    """
+    Set the deflate level zipfile uses when writing zinfo.
+
+    ZipFile applies its own compresslevel only to entries it creates, so a
+    caller-built ZipInfo has to carry the level itself. The attribute is
+    public from Python 3.13 and private before that.
+    """
+    if hasattr(zipfile.ZipInfo, "compress_level"):
+        zinfo.compress_level = level
+    else:
+        zinfo._compresslevel = level
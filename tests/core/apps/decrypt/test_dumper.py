@@ -0,0 +1,401 @@
+"""Tests for the app dumper."""
+
+import io
+import sys
+import tarfile
+import types
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from orange.core.apps.decrypt import dumper
+from orange.core.apps.decrypt.dumper import (
+    AppDumper,
+    BinaryDumpInfo,
+    DUMP_SCRIPT,
+    _minify_js,
+    _throttled_progress,
+)
+from orange.core.apps.decrypt.exceptions import AppNotFoundError, DecryptionError
+
+REMOTE_BUNDLE = "/var/containers/Bundle/Application/UUID/Test.app"
+
+
+@pytest.fixture
+def frida_client():
+    """Create a mock FridaClient."""
+    client = MagicMock()
+    client.get_app_info.return_value = Mock(name="app_info")
+    return client
+
+
+@pytest.fixture
+def app_dumper(frida_client):
+    """Create an AppDumper around the mock client."""
+    return AppDumper(frida_client)
+
+
+def _session_with_script(script):
+    """Create a mock session whose scripts all resolve to script."""
+    session = MagicMock()
+    session.compile_script.return_value = b"bytecode"
+    session.create_script_from_bytes.return_value = script
+    return session
+
+
+def _scripted_messages(script, messages):
+    """Deliver (message, data) pairs to the handler when the script loads."""
+    handlers = {}
+    script.on.side_effect = lambda event, cb: handlers.__setitem__(event, cb)
+
+    def load():
+        for message, data in messages:
+            handlers["message"](message, data)
+
+    script.load.side_effect = load
+
+
+def _info(cryptsize):
+    """Build the info message the dump script sends first."""
+    return {
+        "type": "send",
+        "payload": {
+            "type": "info",
+            "info": {
+                "moduleName": "Test",
+                "modulePath": "/path/Test",
+                "encryptionInfo": {
+                    "cryptoff": 0x4000,
+                    "cryptsize": cryptsize,
+                    "cryptid": 1,
+                },
+            },
+        },
+    }
+
+
+def _chunk(offset):
+    """Build a chunk message for the given section offset."""
+    return {"type": "send", "payload": {"type": "chunk", "offset": offset}}
+
+
+DONE = {"type": "send", "payload": {"type": "done"}}
+
+
+def _tar_bytes(files):
+    """Build an in-memory tar archive from {name: bytes}."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+def _ssh_streaming(payload, exit_status=0):
+    """Create a mock SSH client whose tar channel yields payload."""
+    channel = MagicMock()
+    channel.makefile.return_value = io.BytesIO(payload)
+    channel.recv_exit_status.return_value = exit_status
+    ssh = MagicMock()
+    ssh.get_transport.return_value.open_session.return_value = channel
+    return ssh, channel
+
+
+class TestMinifyJs:
+    """Test Frida script minification."""
+
+    def test_strips_comments_and_indentation(self):
+        """Whole-line comments, blank lines and indentation should go."""
+        source = "// header\n\nfunction f() {\n    // note\n    return 1;\n}\n"
+        assert _minify_js(source) == "function f() {\nreturn 1;\n}"
+
+    def test_keeps_slashes_in_strings_and_urls(self):
+        """// inside string literals and URLs must survive."""
+        source = "    var url = \"https://example.com//path\";\n    var s = '//';\n"
+        assert _minify_js(source) == (
+            "var url = \"https://example.com//path\";\nvar s = '//';"
+        )
+
+    def test_keeps_template_literal_verbatim(self):
+        """Lines inside a multi-line template literal are string content."""
+        source = "var t = `first\n  // not a comment\n    indented`;\n// gone\n"
+        assert _minify_js(source) == (
+            "var t = `first\n  // not a comment\n    indented`;"
+        )
+
+    def test_bundled_script_is_minified(self):
+        """The bundled dump script should carry no comment lines."""
+        assert "__CHUNK_SIZE__" not in DUMP_SCRIPT
+        for line in DUMP_SCRIPT.splitlines():
+            assert line == line.strip()
+            assert not line.startswith("//")
+
+
+class TestGetAppInfo:
+    """Test app info memoization."""
+
+    def test_memoized(self, app_dumper, frida_client):
+        """Repeated lookups should hit Frida once."""
+        first = app_dumper._get_app_info("com.example.app")
+        second = app_dumper._get_app_info("com.example.app")
+
+        assert first is second
+        frida_client.get_app_info.assert_called_once_with("com.example.app")
+
+    def test_not_found(self, app_dumper, frida_client):
+        """A missing app should raise and not be cached."""
+        frida_client.get_app_info.return_value = None
+
+        with pytest.raises(AppNotFoundError):
+            app_dumper._get_app_info("com.missing.app")
+        with pytest.raises(AppNotFoundError):
+            app_dumper._get_app_info("com.missing.app")
+
+        assert frida_client.get_app_info.call_count == 2
+
+
+class TestDumpBinary:
+    """Test reassembly of streamed dump chunks."""
+
+    def test_reassembles_out_of_order_chunks(self, app_dumper):
+        """Chunks should be copied into place by offset."""
+        script = MagicMock()
+        _scripted_messages(
+            script,
+            [
+                (_info(8), None),
+                (_chunk(4), b"5678"),
+                (_chunk(0), b"1234"),
+                (DONE, None),
+            ],
+        )
+
+        result = app_dumper._dump_binary(_session_with_script(script), "com.x")
+
+        assert result.decrypted_section == b"12345678"
+        assert result.name == "Test"
+        assert result.encryption_info.cryptoff == 0x4000
+        assert result.is_encrypted
+
+    def test_incomplete_dump(self, app_dumper):
+        """Missing chunks should raise rather than return a partial section."""
+        script = MagicMock()
+        _scripted_messages(
+            script, [(_info(8), None), (_chunk(0), b"1234"), (DONE, None)]
+        )
+
+        with pytest.raises(DecryptionError, match="Incomplete dump"):
+            app_dumper._dump_binary(_session_with_script(script), "com.x")
+
+    def test_script_error(self, app_dumper):
+        """An error payload from the script should raise."""
+        script = MagicMock()
+        _scripted_messages(
+            script, [({"type": "send", "payload": {"error": "boom"}}, None)]
+        )
+
+        with pytest.raises(DecryptionError, match="boom"):
+            app_dumper._dump_binary(_session_with_script(script), "com.x")
+
+
+class TestEnumerateBinaries:
+    """Test binary enumeration over RPC."""
+
+    def test_uses_exports_sync(self, app_dumper):
+        """Enumeration should call the RPC export and unload the script."""
+        binaries = [{"name": "Test", "path": "/path/Test"}]
+        script = MagicMock()
+        script.exports_sync.enumerate.return_value = binaries
+
+        result = app_dumper._enumerate_binaries(_session_with_script(script))
+
+        assert result == binaries
+        script.load.assert_called_once()
+        script.unload.assert_called_once()
+
+
+class TestStreamBundleTar:
+    """Test downloading a bundle as a tar stream."""
+
+    def test_extracts_bundle(self, app_dumper, tmp_path):
+        """The streamed archive should land at the local bundle path."""
+        ssh, channel = _ssh_streaming(
+            _tar_bytes({"Test.app/Info.plist": b"<plist/>", "Test.app/Test": b"bin"})
+        )
+        local = tmp_path / "com.x.app"
+
+        assert app_dumper._stream_bundle_tar(ssh, REMOTE_BUNDLE, local)
+
+        assert (local / "Info.plist").read_bytes() == b"<plist/>"
+        assert (local / "Test").read_bytes() == b"bin"
+        assert not (tmp_path / ".tar_staging").exists()
+        command = channel.exec_command.call_args[0][0]
+        assert "-C /var/containers/Bundle/Application/UUID" in command
+        channel.close.assert_called_once()
+
+    def test_nonzero_exit_fails(self, app_dumper, tmp_path):
+        """A failing tar should report failure and leave nothing behind."""
+        ssh, channel = _ssh_streaming(
+            _tar_bytes({"Test.app/Info.plist": b"<plist/>"}), exit_status=1
+        )
+        local = tmp_path / "com.x.app"
+
+        assert not app_dumper._stream_bundle_tar(ssh, REMOTE_BUNDLE, local)
+        assert not local.exists()
+        channel.close.assert_called_once()
+
+    def test_falls_back_to_scp(self, app_dumper, tmp_path, monkeypatch):
+        """A failed tar stream should fall back to SCP."""
+        ssh = MagicMock()
+        stdout = MagicMock()
+        stdout.read.return_value = f"{REMOTE_BUNDLE}\n".encode()
+        ssh.exec_command.return_value = (MagicMock(), stdout, MagicMock())
+        scp_client = MagicMock()
+        scp_module = types.ModuleType("scp")
+        scp_module.SCPClient = MagicMock(return_value=scp_client)
+        monkeypatch.setitem(sys.modules, "scp", scp_module)
+        monkeypatch.setattr(dumper.tempfile, "mkdtemp", lambda prefix: str(tmp_path))
+
+        with (
+            patch.object(app_dumper, "_get_ssh_client", return_value=ssh),
+            patch.object(app_dumper, "_stream_bundle_tar", return_value=False),
+        ):
+            result = app_dumper._download_app_bundle("com.x")
+
+        assert result == tmp_path / "com.x.app"
+        scp_module.SCPClient.assert_called_once_with(ssh.get_transport())
+        scp_client.__enter__.return_value.get.assert_called_once_with(
+            REMOTE_BUNDLE, str(result), recursive=True
+        )
+
+
+class TestGetSSHClient:
+    """Test the shared SSH connection."""
+
+    @pytest.fixture
+    def paramiko(self, monkeypatch):
+        """Install a fake paramiko module that hands out mock clients."""
+        module = types.ModuleType("paramiko")
+        module.SSHClient = MagicMock(side_effect=lambda: MagicMock())
+        module.AutoAddPolicy = MagicMock()
+        monkeypatch.setitem(sys.modules, "paramiko", module)
+        return module
+
+    def test_reuses_active_connection(self, app_dumper, paramiko):
+        """An active transport should be reused without reconnecting."""
+        first = app_dumper._get_ssh_client()
+        first.get_transport.return_value.is_active.return_value = True
+
+        assert app_dumper._get_ssh_client() is first
+        assert paramiko.SSHClient.call_count == 1
+        first.connect.assert_called_once()
+
+    def test_reconnects_stale_connection(self, app_dumper, paramiko):
+        """A dead transport should be closed and replaced."""
+        first = app_dumper._get_ssh_client()
+        first.get_transport.return_value.is_active.return_value = False
+
+        second = app_dumper._get_ssh_client()
+
+        assert second is not first
+        first.close.assert_called_once()
+        second.connect.assert_called_once()
+        assert paramiko.SSHClient.call_count == 2
+
+    def test_close_releases_connection(self, app_dumper, paramiko):
+        """close() should drop the shared client."""
+        client = app_dumper._get_ssh_client()
+
+        app_dumper.close()
+
+        client.close.assert_called_once()
+        assert app_dumper._ssh_client is None
+
+
+class TestReportProgress:
+    """Test progress callback throttling."""
+
+    def test_repeated_ticks_coalesced(self):
+        """Same-stage repeats are dropped; changes and completion always fire."""
+        events = []
+        report = _throttled_progress(events.append)
+
+        with patch.object(dumper.time, "monotonic", return_value=100.0):
+            report("dumping", 1, 4, "Dumping...")
+            report("dumping", 2, 4, "Dumping...")
+            report("dumping", 2, 4, "Dumping frameworks...")
+            report("building", 3, 4, "Building...")
+            report("building", 4, 4, "Building...")
+
+        assert [e.current for e in events] == [1, 2, 3, 4]
+
+    def test_stage_changes_reach_callback(self, app_dumper, frida_client, tmp_path):
+        """Every stage transition of a dump is reported, on every call."""
+        main_dump = BinaryDumpInfo(
+            name="Test",
+            path="/path/Test",
+            original_data=b"",
+            decrypted_section=None,
+            encryption_info=None,
+        )
+
+        with (
+            patch.object(app_dumper, "_dump_binary", return_value=main_dump),
+            patch.object(app_dumper, "_download_app_bundle", return_value=tmp_path),
+            patch("orange.core.apps.decrypt.ipa_builder.IPABuilder"),
+            patch.object(dumper.time, "monotonic", return_value=100.0),
+        ):
+            for _ in range(2):
+                events = []
+                app_dumper.dump(
+                    "com.x", tmp_path / "out.ipa", progress_callback=events.append
+                )
+                assert [(e.stage, e.current) for e in events] == [
+                    ("connecting", 0),
+                    ("spawning", 1),
+                    ("dumping", 2),
+                    ("downloading", 3),
+                    ("building", 4),
+                    ("building", 5),
+                ]
+
+        assert frida_client.spawn.return_value.detach.call_count == 2
+
+
+class TestDumpFrameworks:
+    """Test the optional framework listing."""
+
+    @pytest.mark.parametrize("list_frameworks", [False, True])
+    def test_frameworks_listed_only_on_request(
+        self, app_dumper, tmp_path, list_frameworks
+    ):
+        """frameworks_dumped is empty unless list_frameworks is set."""
+        main_dump = BinaryDumpInfo(
+            name="Test",
+            path="/path/Test",
+            original_data=b"",
+            decrypted_section=None,
+            encryption_info=None,
+        )
+        binaries = [
+            {"name": "Test", "path": "/App/Test"},
+            {"name": "Kit", "path": "/App/Frameworks/Kit.framework/Kit"},
+            {"name": "libc", "path": "/usr/lib/libc.dylib"},
+        ]
+
+        with (
+            patch.object(app_dumper, "_dump_binary", return_value=main_dump),
+            patch.object(app_dumper, "_download_app_bundle", return_value=tmp_path),
+            patch.object(
+                app_dumper, "_enumerate_binaries", return_value=binaries
+            ) as enumerate_binaries,
+            patch("orange.core.apps.decrypt.ipa_builder.IPABuilder"),
+        ):
+            result = app_dumper.dump(
+                "com.x", tmp_path / "out.ipa", list_frameworks=list_frameworks
+            )
+
+        assert result.frameworks_dumped == (["Kit"] if list_frameworks else [])
+        assert enumerate_binaries.called is list_frameworks
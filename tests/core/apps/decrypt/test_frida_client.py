@@ -113,7 +113,7 @@ class TestFridaClientConnect:
 
         assert result is client  # Returns self
         assert client.is_connected
-        mock_frida.get_device.assert_called_once_with("00008030-12345678")
+        mock_frida.get_device.assert_called_once_with("00008030-12345678", timeout=5.0)
 
     @patch("orange.core.apps.decrypt.frida_client._get_frida")
     def test_connect_auto_detect(self, mock_get_frida):
@@ -147,6 +147,42 @@ class TestFridaClientConnect:
         assert client.is_connected
         mock_device_manager.add_remote_device.assert_called_once_with("localhost:27042")
 
+    @patch("orange.core.apps.decrypt.frida_client._get_frida")
+    def test_connect_uses_custom_timeout(self, mock_get_frida):
+        """Should pass connect_timeout through to Frida."""
+        mock_frida = Mock()
+        mock_get_frida.return_value = mock_frida
+
+        FridaClient(connect_timeout=2.5).connect()
+
+        mock_frida.get_usb_device.assert_called_once_with(timeout=2.5)
+
+    @patch("orange.core.apps.decrypt.frida_client.time.sleep")
+    @patch("orange.core.apps.decrypt.frida_client._get_frida")
+    def test_connect_remote_retries_until_ready(self, mock_get_frida, mock_sleep):
+        """Should retry a remote device that is not ready yet."""
+        class MockServerNotRunningError(Exception):
+            pass
+
+        class MockTimedOutError(Exception):
+            pass
+
+        mock_frida = Mock()
+        mock_frida.ServerNotRunningError = MockServerNotRunningError
+        mock_frida.TimedOutError = MockTimedOutError
+        mock_device = Mock()
+        mock_frida.get_device_manager.return_value.add_remote_device.side_effect = [
+            MockServerNotRunningError(),
+            mock_device,
+        ]
+        mock_get_frida.return_value = mock_frida
+
+        client = FridaClient(host="localhost:27042")
+        client.connect()
+
+        assert client.device is mock_device
+        mock_sleep.assert_called_once()
+
     @patch("orange.core.apps.decrypt.frida_client._get_frida")
     def test_connect_timeout_raises(self, mock_get_frida):
         """Should raise FridaConnectionError on timeout."""
@@ -507,3 +543,222 @@ class TestFridaClientClose:
 
         # Should not raise
         client.close()
+
+
+class TestFridaClientAppsCache:
+    """Test caching of the installed apps list."""
+
+    def _connected_client(self, mock_get_frida, apps):
+        mock_frida = Mock()
+        mock_device = Mock()
+        mock_device.enumerate_applications.return_value = apps
+        mock_frida.get_usb_device.return_value = mock_device
+        mock_get_frida.return_value = mock_frida
+
+        client = FridaClient()
+        client.connect()
+        return client, mock_device
+
+    def _mock_app(self, identifier, pid=0):
+        app = Mock()
+        app.identifier = identifier
+        app.name = identifier
+        app.pid = pid
+        return app
+
+    @patch("orange.core.apps.decrypt.frida_client._get_frida")
+    def test_repeated_lookups_enumerate_once(self, mock_get_frida):
+        """Should reuse the cached app list within the TTL."""
+        client, device = self._connected_client(
+            mock_get_frida,
+            [self._mock_app("com.a"), self._mock_app("com.b")],
+        )
+
+        assert client.get_app_info("com.a").identifier == "com.a"
+        assert client.get_app_info("com.b").identifier == "com.b"
+        assert client.get_app_info("com.missing") is None
+        device.enumerate_applications.assert_called_once()
+
+    @patch("orange.core.apps.decrypt.frida_client._get_frida")
+    def test_expired_cache_refetches(self, mock_get_frida):
+        """Should query the device again once the TTL has passed."""
+        client, device = self._connected_client(
+            mock_get_frida, [self._mock_app("com.a")]
+        )
+        client._apps_ttl = 0.0
+
+        client.get_app_info("com.a")
+        client.get_app_info("com.a")
+
+        assert device.enumerate_applications.call_count == 2
+
+    @patch("orange.core.apps.decrypt.frida_client._get_frida")
+    def test_spawn_invalidates_cache(self, mock_get_frida):
+        """Should refetch after spawn so the new PID is visible."""
+        client, device = self._connected_client(
+            mock_get_frida, [self._mock_app("com.a")]
+        )
+        device.spawn.return_value = 1234
+
+        client.spawn("com.a")
+        client.get_app_info("com.a")
+
+        assert device.enumerate_applications.call_count == 2
+
+    @patch("orange.core.apps.decrypt.frida_client._get_frida")
+    def test_get_app_pid_map(self, mock_get_frida):
+        """Should map bundle IDs to PIDs from the cached app list."""
+        client, device = self._connected_client(
+            mock_get_frida,
+            [self._mock_app("com.a", pid=42), self._mock_app("com.b")],
+        )
+        client.get_installed_apps()
+
+        pids = client.get_app_pid_map()
+        assert pids == {"com.a": 42, "com.b": 0}
+        pids["com.a"] = 1
+        assert client.get_app_pid_map()["com.a"] == 42
+        assert client.get_app_info("com.a").pid == 42
+        device.enumerate_applications.assert_called_once()
+
+    @patch("orange.core.apps.decrypt.frida_client._get_frida")
+    def test_attach_unknown_bundle_id_raises(self, mock_get_frida):
+        """Should raise AppNotFoundError for an uninstalled bundle ID."""
+        client, _ = self._connected_client(mock_get_frida, [])
+
+        with pytest.raises(AppNotFoundError):
+            client.attach(bundle_id="com.missing")
+
+    @patch("orange.core.apps.decrypt.frida_client._get_frida")
+    def test_lookup_pid_scans_raw_apps(self, mock_get_frida):
+        """Should find the PID without populating the app info cache."""
+        client, device = self._connected_client(
+            mock_get_frida,
+            [self._mock_app("com.a", pid=42), self._mock_app("com.b")],
+        )
+
+        assert client._lookup_pid("com.a") == 42
+        assert client._lookup_pid("com.b") == 0
+        assert client._lookup_pid("com.missing") is None
+        assert client._apps_cache is None
+
+    @patch("orange.core.apps.decrypt.frida_client._get_frida")
+    def test_lookup_pid_uses_fresh_cache(self, mock_get_frida):
+        """Should answer from a fresh app list without another RPC."""
+        client, device = self._connected_client(
+            mock_get_frida, [self._mock_app("com.a", pid=7)]
+        )
+        client.get_installed_apps()
+
+        assert client._lookup_pid("com.a") == 7
+        device.enumerate_applications.assert_called_once()
+
+    @patch("orange.core.apps.decrypt.frida_client._get_frida")
+    def test_spawn_many(self, mock_get_frida):
+        """Should spawn, attach and resume every app after one enumeration."""
+        client, device = self._connected_client(
+            mock_get_frida, [self._mock_app("com.a"), self._mock_app("com.b")]
+        )
+        device.spawn.side_effect = lambda ids: {"com.a": 10, "com.b": 20}[ids[0]]
+        device.attach.side_effect = lambda pid: f"session-{pid}"
+
+        sessions = client.spawn_many(["com.a", "com.b"])
+
+        assert sessions == ["session-10", "session-20"]
+        assert sorted(c.args[0] for c in device.resume.call_args_list) == [10, 20]
+        device.enumerate_applications.assert_called_once()
+
+    @patch("orange.core.apps.decrypt.frida_client._get_frida")
+    def test_spawn_many_rolls_back_on_attach_failure(self, mock_get_frida):
+        """A failed attach should detach the others and kill every spawned PID."""
+        client, device = self._connected_client(
+            mock_get_frida, [self._mock_app("com.a"), self._mock_app("com.b")]
+        )
+        device.spawn.side_effect = lambda ids: {"com.a": 10, "com.b": 20}[ids[0]]
+        session_a = Mock()
+
+        def attach(pid):
+            if pid == 20:
+                raise RuntimeError("attach failed")
+            return session_a
+
+        device.attach.side_effect = attach
+
+        with pytest.raises(AppNotRunningError):
+            client.spawn_many(["com.a", "com.b"])
+
+        session_a.detach.assert_called_once()
+        assert sorted(c.args[0] for c in device.kill.call_args_list) == [10, 20]
+        device.resume.assert_not_called()
+        assert client._sessions == []
+
+    @patch("orange.core.apps.decrypt.frida_client._get_frida")
+    def test_spawn_many_kills_spawned_on_spawn_failure(self, mock_get_frida):
+        """A failed spawn should kill the apps that did spawn."""
+        client, device = self._connected_client(
+            mock_get_frida, [self._mock_app("com.a"), self._mock_app("com.b")]
+        )
+
+        def spawn(ids):
+            if ids[0] == "com.b":
+                raise RuntimeError("spawn failed")
+            return 10
+
+        device.spawn.side_effect = spawn
+
+        with pytest.raises(AppNotRunningError):
+            client.spawn_many(["com.a", "com.b"])
+
+        device.kill.assert_called_once_with(10)
+        device.attach.assert_not_called()
+
+    @patch("orange.core.apps.decrypt.frida_client._get_frida")
+    def test_spawn_many_unknown_app_spawns_nothing(self, mock_get_frida):
+        """Should fail before spawning if any bundle ID is not installed."""
+        client, device = self._connected_client(
+            mock_get_frida, [self._mock_app("com.a")]
+        )
+
+        with pytest.raises(AppNotFoundError):
+            client.spawn_many(["com.a", "com.missing"])
+        device.spawn.assert_not_called()
+
+    @patch("orange.core.apps.decrypt.frida_client._get_frida")
+    def test_snapshot_mode_keeps_apps_until_refresh(self, mock_get_frida):
+        """Snapshot mode should ignore the TTL until refresh_apps()."""
+        mock_frida = Mock()
+        device = Mock()
+        device.enumerate_applications.return_value = [self._mock_app("com.a")]
+        mock_frida.get_usb_device.return_value = device
+        mock_get_frida.return_value = mock_frida
+
+        client = FridaClient(snapshot_apps=True)
+        client.connect()
+
+        with patch("orange.core.apps.decrypt.frida_client.time.monotonic") as clock:
+            clock.return_value = 0.0
+            client.get_app_info("com.a")
+            clock.return_value = 1e9
+            client.get_app_info("com.a")
+            device.enumerate_applications.assert_called_once()
+
+            device.enumerate_applications.return_value = [self._mock_app("com.b")]
+            apps = client.refresh_apps()
+
+        assert [a.identifier for a in apps] == ["com.b"]
+        assert device.enumerate_applications.call_count == 2
+
+    @patch("orange.core.apps.decrypt.frida_client._get_frida")
+    def test_close_detaches_all_sessions(self, mock_get_frida):
+        """Should detach every session even if one detach fails."""
+        client, _ = self._connected_client(mock_get_frida, [])
+        sessions = [Mock() for _ in range(3)]
+        sessions[1].detach.side_effect = RuntimeError("already gone")
+        client._sessions.extend(sessions)
+
+        client.close()
+
+        for session in sessions:
+            session.detach.assert_called_once()
+        assert client._sessions == []
+        assert not client.is_connected
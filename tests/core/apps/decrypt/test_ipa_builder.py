@@ -2,13 +2,15 @@
 
 import struct
 import zipfile
+import zlib
 import tempfile
 import shutil
 from pathlib import Path
 
 import pytest
 
-from orange.core.apps.decrypt.ipa_builder import IPABuilder, build_ipa_simple
+from orange.core.apps.decrypt import ipa_builder
+from orange.core.apps.decrypt.ipa_builder import IPABuilder, build_ipa_simple, _clone_bundle
 from orange.core.apps.decrypt.macho import EncryptionInfo, MachOMagic, MachOCPUType
 from orange.core.apps.decrypt.exceptions import DecryptionError
 
@@ -217,6 +219,225 @@ class TestIPABuilder:
         assert result.exists()
         assert result.parent.exists()
 
+    def test_build_stores_incompressible_assets(self, sample_app_bundle, temp_dir):
+        """Should store already-compressed assets and deflate the rest."""
+        (sample_app_bundle / "icon.PNG").write_bytes(b"\x89PNG" + b"\x00" * 64)
+        output_path = temp_dir / "output.ipa"
+
+        class MockDumpInfo:
+            name = "TestApp"
+            decrypted_section = None
+            encryption_info = None
+
+        IPABuilder().build(
+            app_bundle_path=sample_app_bundle,
+            output_path=output_path,
+            main_binary_dump=MockDumpInfo(),
+        )
+
+        with zipfile.ZipFile(output_path, "r") as zf:
+            infos = {i.filename: i for i in zf.infolist()}
+            assert infos["Payload/TestApp.app/icon.PNG"].compress_type == zipfile.ZIP_STORED
+            assert infos["Payload/TestApp.app/Assets.car"].compress_type == zipfile.ZIP_STORED
+            assert infos["Payload/TestApp.app/Info.plist"].compress_type == zipfile.ZIP_DEFLATED
+
+    def test_create_ipa_parallel_deflate_round_trips(self, temp_dir):
+        """Precompressed entries should read back intact."""
+        app_path = temp_dir / "Payload" / "Many.app"
+        app_path.mkdir(parents=True)
+        contents = {
+            f"file{i}.strings": (b"key = value;\n" * (i + 1)) for i in range(50)
+        }
+        for name, data in contents.items():
+            (app_path / name).write_bytes(data)
+
+        output_path = temp_dir / "many.ipa"
+        IPABuilder()._create_ipa(temp_dir / "Payload", output_path)
+
+        with zipfile.ZipFile(output_path, "r") as zf:
+            assert zf.testzip() is None
+            for name, data in contents.items():
+                info = zf.getinfo(f"Payload/Many.app/{name}")
+                assert info.compress_type == zipfile.ZIP_DEFLATED
+                assert zf.read(info) == data
+
+    @pytest.mark.parametrize("internals", [True, False])
+    def test_create_ipa_crc_round_trip(self, temp_dir, monkeypatch, internals):
+        """Both write paths should produce entries whose CRCs verify."""
+        monkeypatch.setattr(ipa_builder, "_ZIPFILE_INTERNALS", internals)
+        app_path = temp_dir / "Payload" / "Crc.app"
+        app_path.mkdir(parents=True)
+        contents = {
+            "Info.plist": b"<plist/>" * 200,
+            "Crc": bytes(range(256)) * 64,
+            "Assets.car": b"\x00" * 1024,
+        }
+        for name, data in contents.items():
+            (app_path / name).write_bytes(data)
+
+        output_path = temp_dir / "crc.ipa"
+        IPABuilder()._create_ipa(temp_dir / "Payload", output_path)
+
+        with zipfile.ZipFile(output_path, "r") as zf:
+            assert zf.testzip() is None
+            for name, data in contents.items():
+                info = zf.getinfo(f"Payload/Crc.app/{name}")
+                assert info.CRC == zlib.crc32(data)
+                assert info.file_size == len(data)
+                assert zf.read(info) == data
+
+    @pytest.mark.parametrize("internals", [True, False])
+    def test_create_ipa_zip64_round_trip(self, temp_dir, monkeypatch, internals):
+        """Stored, streamed and precompressed ZIP64 entries should verify."""
+        monkeypatch.setattr(ipa_builder, "_ZIPFILE_INTERNALS", internals)
+        monkeypatch.setattr(ipa_builder, "PRECOMPRESS_MAX_SIZE", 4096)
+        # Reason: forces ZIP64 headers without writing a 4 GB fixture
+        monkeypatch.setattr(zipfile, "ZIP64_LIMIT", 1024)
+        app_path = temp_dir / "Payload" / "Big.app"
+        app_path.mkdir(parents=True)
+        contents = {
+            "Info.plist": b"<plist/>" * 256,  # deflated, precompressed
+            "Big": bytes(range(256)) * 64,  # deflated, streamed
+            "Assets.car": bytes(range(256)) * 16,  # stored
+            "small.strings": b"a = b;\n",  # below the ZIP64 limit
+        }
+        for name, data in contents.items():
+            (app_path / name).write_bytes(data)
+
+        output_path = temp_dir / "big.ipa"
+        IPABuilder()._create_ipa(temp_dir / "Payload", output_path)
+
+        assert b"PK\x06\x06" in output_path.read_bytes()  # ZIP64 end record
+        with zipfile.ZipFile(output_path, "r") as zf:
+            assert zf.testzip() is None
+            infos = {info.filename: info for info in zf.infolist()}
+            assert infos["Payload/Big.app/Assets.car"].compress_type == (
+                zipfile.ZIP_STORED
+            )
+            for name, data in contents.items():
+                info = infos[f"Payload/Big.app/{name}"]
+                assert info.CRC == zlib.crc32(data)
+                assert info.file_size == len(data)
+                assert zf.read(info) == data
+
+    def test_create_ipa_stores_symlinks_without_following(self, temp_dir):
+        """Symlinks, including to directories, become symlink entries."""
+        app_path = temp_dir / "Payload" / "Links.app"
+        (app_path / "Real").mkdir(parents=True)
+        (app_path / "Real" / "data.txt").write_bytes(b"data")
+        (app_path / "Alias").symlink_to("Real")
+
+        output_path = temp_dir / "links.ipa"
+        IPABuilder()._create_ipa(temp_dir / "Payload", output_path)
+
+        with zipfile.ZipFile(output_path, "r") as zf:
+            names = zf.namelist()
+            assert "Payload/Links.app/Real/data.txt" in names
+            assert "Payload/Links.app/Alias/data.txt" not in names
+            info = zf.getinfo("Payload/Links.app/Alias")
+            assert info.external_attr == 0xA1ED0000
+            assert zf.read(info) == b"Real"
+
+    def test_get_executable_name_reads_binary_plist(self, temp_dir):
+        """Binary plists should parse, and rewrites should bypass the cache."""
+        import plistlib
+
+        info_plist = temp_dir / "Info.plist"
+        info_plist.write_bytes(
+            plistlib.dumps({"CFBundleExecutable": "First"}, fmt=plistlib.FMT_BINARY)
+        )
+        builder = IPABuilder()
+        assert builder._get_executable_name(info_plist) == "First"
+
+        info_plist.write_bytes(
+            plistlib.dumps({"CFBundleExecutable": "SecondName"}, fmt=plistlib.FMT_BINARY)
+        )
+        assert builder._get_executable_name(info_plist) == "SecondName"
+
+    def test_get_executable_name_missing_plist(self, temp_dir):
+        """A missing Info.plist should return None."""
+        assert IPABuilder()._get_executable_name(temp_dir / "Info.plist") is None
+
+    def test_create_ipa_stored_mode(self, temp_dir):
+        """ZIP_STORED should skip compression for every entry."""
+        app_path = temp_dir / "Payload" / "Fast.app"
+        app_path.mkdir(parents=True)
+        (app_path / "Info.plist").write_bytes(b"<plist/>" * 100)
+        (app_path / "Fast").write_bytes(b"\x00" * 4096)
+
+        output_path = temp_dir / "fast.ipa"
+        IPABuilder(compression=zipfile.ZIP_STORED)._create_ipa(
+            temp_dir / "Payload", output_path
+        )
+
+        with zipfile.ZipFile(output_path, "r") as zf:
+            assert zf.testzip() is None
+            for info in zf.infolist():
+                assert info.compress_type == zipfile.ZIP_STORED
+
+    def test_create_ipa_compresslevel(self, temp_dir):
+        """A lower compresslevel should still produce a valid archive."""
+        app_path = temp_dir / "Payload" / "Level.app"
+        app_path.mkdir(parents=True)
+        data = b"key = value;\n" * 1000
+        (app_path / "Localizable.strings").write_bytes(data)
+
+        output_path = temp_dir / "level.ipa"
+        IPABuilder(compresslevel=1)._create_ipa(temp_dir / "Payload", output_path)
+
+        with zipfile.ZipFile(output_path, "r") as zf:
+            info = zf.getinfo("Payload/Level.app/Localizable.strings")
+            assert info.compress_type == zipfile.ZIP_DEFLATED
+            assert zf.read(info) == data
+
+    def test_build_leaves_source_bundle_untouched(self, sample_app_bundle, temp_dir):
+        """Patching the hard-linked clone must not modify the source binary."""
+        original = (sample_app_bundle / "TestApp").read_bytes()
+        (sample_app_bundle / "link").symlink_to("Assets.car")
+
+        class MockDumpInfo:
+            name = "TestApp"
+            decrypted_section = b"DECRYPTED_DATA!!"
+            encryption_info = EncryptionInfo(
+                cryptoff=32 + 24, cryptsize=16, cryptid=1, cmd_offset=32
+            )
+
+        IPABuilder(work_dir=temp_dir / "work").build(
+            app_bundle_path=sample_app_bundle,
+            output_path=temp_dir / "output.ipa",
+            main_binary_dump=MockDumpInfo(),
+        )
+
+        assert (sample_app_bundle / "TestApp").read_bytes() == original
+        clone = temp_dir / "work" / "Payload" / "TestApp.app"
+        assert b"DECRYPTED_DATA!!" in (clone / "TestApp").read_bytes()
+        assert (clone / "link").is_symlink()
+
+
+class TestCloneBundle:
+    """Test the hard-link bundle clone."""
+
+    def test_clone_hard_links_same_filesystem(self, sample_app_bundle, temp_dir):
+        """Files should share inodes with the source on the same filesystem."""
+        dst = temp_dir / "work" / "TestApp.app"
+        _clone_bundle(sample_app_bundle, dst)
+
+        src_stat = (sample_app_bundle / "TestApp").stat()
+        assert (dst / "TestApp").stat().st_ino == src_stat.st_ino
+
+    def test_clone_falls_back_to_copy(self, sample_app_bundle, temp_dir, monkeypatch):
+        """Should copy the bundle if hard links are refused."""
+
+        def refuse_link(src, dst, *args, **kwargs):
+            raise PermissionError("hard links not allowed")
+
+        monkeypatch.setattr("orange.core.apps.decrypt.ipa_builder.os.link", refuse_link)
+        dst = temp_dir / "work" / "TestApp.app"
+        _clone_bundle(sample_app_bundle, dst)
+
+        assert (dst / "TestApp").read_bytes() == (sample_app_bundle / "TestApp").read_bytes()
+        assert (dst / "TestApp").stat().st_nlink == 1
+
 
 class TestIPABuilderFrameworks:
     """Test framework handling."""
@@ -277,6 +498,45 @@ class TestIPABuilderFrameworks:
             )
             assert framework_found
 
+    def test_build_patches_multiple_frameworks(self, temp_dir):
+        """Should decrypt every framework that has a dump."""
+        app_path = temp_dir / "TestApp.app"
+        app_path.mkdir()
+        (app_path / "TestApp").write_bytes(_create_fake_encrypted_binary())
+
+        names = [f"Framework{i}" for i in range(4)]
+        for name in names:
+            framework_path = app_path / "Frameworks" / f"{name}.framework"
+            framework_path.mkdir(parents=True)
+            (framework_path / name).write_bytes(_create_fake_encrypted_binary())
+
+        class MockMainDump:
+            name = "TestApp"
+            decrypted_section = None
+            encryption_info = None
+
+        def framework_dump(fw_name):
+            dump = type("MockFrameworkDump", (), {})()
+            dump.name = fw_name
+            dump.decrypted_section = b"FRAMEWORK_DECRYP"
+            dump.encryption_info = EncryptionInfo(
+                cryptoff=32 + 24, cryptsize=16, cryptid=1, cmd_offset=32
+            )
+            return dump
+
+        output_path = temp_dir / "output.ipa"
+        IPABuilder().build(
+            app_bundle_path=app_path,
+            output_path=output_path,
+            main_binary_dump=MockMainDump(),
+            framework_dumps=[framework_dump(n) for n in names],
+        )
+
+        with zipfile.ZipFile(output_path, "r") as zf:
+            for name in names:
+                data = zf.read(f"Payload/TestApp.app/Frameworks/{name}.framework/{name}")
+                assert b"FRAMEWORK_DECRYP" in data
+
 
 class TestBuildIPASimple:
     """Test simplified IPA builder function."""
@@ -1,5 +1,6 @@
 """Tests for Mach-O binary parsing and manipulation."""
 
+import dataclasses
 import struct
 import pytest
 
@@ -38,6 +39,15 @@ class TestEncryptionInfo:
         )
         assert info.is_encrypted is False
 
+    def test_frozen_and_hashable(self):
+        """Should be immutable, hashable and have no per-instance __dict__."""
+        info = EncryptionInfo(4096, 1024, 1, 100)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            info.cryptid = 0  # type: ignore[misc]
+        assert info in {EncryptionInfo(4096, 1024, 1, 100)}
+        assert not hasattr(info, "__dict__")
+
 
 class TestMachOBinary:
     """Test MachOBinary dataclass."""
@@ -275,6 +285,35 @@ class TestMachOParser:
                 info,
             )
 
+    def test_patch_binary_cryptid_inplace_matches_copying_patch(self):
+        """patch_binary_cryptid_inplace should produce the same bytes."""
+        enc_cmd = self._create_encryption_cmd(
+            cryptoff=32 + 24, cryptsize=16, cryptid=1
+        )
+        header = self._create_macho_header(ncmds=1, sizeofcmds=len(enc_cmd))
+        data = header + enc_cmd + b"ENCRYPTED_DATA!!" + b"\x00" * 100
+        decrypted_section = b"DECRYPTED_DATA!!"
+        info = MachOParser.get_encryption_info(data)
+
+        buffer = bytearray(data)
+        MachOParser.patch_binary_cryptid_inplace(buffer, decrypted_section, info)
+
+        assert bytes(buffer) == MachOParser.patch_binary_cryptid(
+            data, decrypted_section, info
+        )
+
+    def test_patch_binary_cryptid_inplace_wrong_size_raises(self):
+        """patch_binary_cryptid_inplace should not touch the buffer on bad size."""
+        enc_cmd = self._create_encryption_cmd(cryptsize=16, cryptid=1)
+        header = self._create_macho_header(ncmds=1, sizeofcmds=len(enc_cmd))
+        data = header + enc_cmd + b"\x00" * 100
+        info = MachOParser.get_encryption_info(data)
+
+        buffer = bytearray(data)
+        with pytest.raises(ValueError):
+            MachOParser.patch_binary_cryptid_inplace(buffer, b"wrong_size", info)
+        assert bytes(buffer) == data
+
 
 class TestMachOParserEdgeCases:
     """Test edge cases and error handling."""
@@ -293,6 +332,17 @@ class TestMachOParserEdgeCases:
 
         assert binary.path == "/path/to/binary"
 
+    def test_parse_cpu_type(self):
+        """Known CPU types map to the enum; unknown ones stay plain ints."""
+        for cpu_type, expected in ((MachOCPUType.ARM64, MachOCPUType.ARM64), (99, 99)):
+            header = struct.pack(
+                "<IIIIIIII", MachOMagic.MH_MAGIC_64, cpu_type, 0, 2, 0, 0, 0, 0
+            )
+            binary = MachOParser.parse(header + b"\x00" * 100)
+
+            assert binary.slices[0].cpu_type == expected
+            assert type(binary.slices[0].cpu_type) is type(expected)
+
     def test_parse_handles_big_endian(self):
         """Should handle big-endian magic."""
         # MH_CIGAM_64 is big-endian 64-bit
@@ -308,3 +358,204 @@ class TestMachOParserEdgeCases:
 
         assert len(binary.slices) == 1
         assert binary.slices[0].is_64bit is True
+
+    def test_parse_32bit_binary(self):
+        """Should parse a 32-bit header and its LC_ENCRYPTION_INFO."""
+        enc_cmd = struct.pack(
+            "<IIIII", LoadCommand.LC_ENCRYPTION_INFO, 20, 4096, 512, 1
+        )
+        header = struct.pack(
+            "<IIIIIII",
+            MachOMagic.MH_MAGIC,
+            MachOCPUType.ARM,
+            0, 2, 1, len(enc_cmd), 0,
+        )
+        data = header + enc_cmd + b"\x00" * 100
+
+        binary = MachOParser.parse(data)
+
+        assert binary.slices[0].is_64bit is False
+        assert binary.encryption_info.cryptsize == 512
+        assert binary.encryption_info.cmd_offset == 28
+
+    def test_parse_fat_binary(self):
+        """Should parse each slice of a FAT binary with file offsets."""
+        enc_cmd = struct.pack(
+            "<IIIIII", LoadCommand.LC_ENCRYPTION_INFO_64, 24, 16384, 64, 1, 0
+        )
+        slice_data = struct.pack(
+            "<IIIIIIII",
+            MachOMagic.MH_MAGIC_64,
+            MachOCPUType.ARM64,
+            0, 2, 1, len(enc_cmd), 0, 0,
+        ) + enc_cmd + b"\x00" * 64
+        slice_offset = 4096
+        fat_header = struct.pack(">II", MachOMagic.FAT_MAGIC, 1) + struct.pack(
+            ">IIIII", MachOCPUType.ARM64, 0, slice_offset, len(slice_data), 12
+        )
+        data = fat_header.ljust(slice_offset, b"\x00") + slice_data
+
+        binary = MachOParser.parse(data)
+
+        assert binary.is_fat is True
+        assert binary.slices[0].offset == slice_offset
+        assert binary.encryption_info.cmd_offset == slice_offset + 32
+
+    def test_parse_fat_skips_unparseable_slice(self):
+        """Slices with an unknown magic should be dropped, leaving no gaps."""
+        slice_data = struct.pack(
+            "<IIIIIIII", MachOMagic.MH_MAGIC_64, MachOCPUType.ARM64, 0, 2, 0, 0, 0, 0
+        )
+        fat_header = struct.pack(">II", MachOMagic.FAT_MAGIC, 2)
+        fat_header += struct.pack(">IIIII", MachOCPUType.ARM, 0, 1024, 32, 12)
+        fat_header += struct.pack(">IIIII", MachOCPUType.ARM64, 0, 2048, 32, 12)
+        data = fat_header.ljust(1024, b"\x00") + b"\xff" * 1024 + slice_data
+
+        binary = MachOParser.parse(data)
+
+        assert [s.offset for s in binary.slices] == [2048]
+        assert binary.encryption_info is None
+        assert binary.is_encrypted is False
+
+    def test_parse_releases_buffer(self):
+        """Parsing a bytearray should not leave it locked by a view."""
+        header = struct.pack(
+            "<IIIIIIII",
+            MachOMagic.MH_MAGIC_64,
+            MachOCPUType.ARM64,
+            0, 2, 0, 0, 0, 0,
+        )
+        data = bytearray(header + b"\x00" * 100)
+
+        MachOParser.parse(data)
+        data.extend(b"\x00")  # Raises BufferError if a view is still alive
+
+    def test_patch_binary_cryptid_uses_given_cmd_offset(self):
+        """patch_binary_cryptid should patch at the caller's cmd_offset without parsing."""
+        enc_cmd = struct.pack(
+            "<IIIIII", LoadCommand.LC_ENCRYPTION_INFO_64, 24, 56, 16, 1, 0
+        )
+        header = struct.pack(
+            "<IIIIIIII",
+            MachOMagic.MH_MAGIC_64,
+            MachOCPUType.ARM64,
+            0, 2, 1, len(enc_cmd), 0, 0,
+        )
+        data = header + enc_cmd + b"ENCRYPTED_DATA!!" + b"\x00" * 100
+        info = EncryptionInfo(cryptoff=56, cryptsize=16, cryptid=1, cmd_offset=32)
+
+        from unittest.mock import patch
+
+        with patch.object(MachOParser, "parse", side_effect=AssertionError):
+            result = MachOParser.patch_binary_cryptid(data, b"DECRYPTED_DATA!!", info)
+
+        assert struct.unpack_from("<I", result, 32 + 16)[0] == 0
+
+    def test_parse_file_and_patch_file_cryptid(self, tmp_path):
+        """parse_file should match parse, and patch_file_cryptid should clear cryptid."""
+        enc_cmd = struct.pack(
+            "<IIIIII", LoadCommand.LC_ENCRYPTION_INFO_64, 24, 4096, 16, 1, 0
+        )
+        header = struct.pack(
+            "<IIIIIIII",
+            MachOMagic.MH_MAGIC_64,
+            MachOCPUType.ARM64,
+            0, 2, 1, len(enc_cmd), 0, 0,
+        )
+        path = tmp_path / "binary"
+        path.write_bytes(header + enc_cmd + b"\x00" * 100)
+
+        binary = MachOParser.parse_file(path)
+        assert binary.path == str(path)
+        assert binary.is_encrypted is True
+
+        MachOParser.patch_file_cryptid(path, binary.encryption_info.cmd_offset)
+        assert MachOParser.parse_file(path).is_encrypted is False
+
+    def test_parse_file_empty_raises(self, tmp_path):
+        """parse_file should raise MachOParseError for an empty file."""
+        path = tmp_path / "empty"
+        path.write_bytes(b"")
+
+        with pytest.raises(MachOParseError):
+            MachOParser.parse_file(path)
+
+    def test_is_macho_sniffs_magic(self):
+        """_is_macho should accept every Mach-O/FAT magic and reject others."""
+        for magic in MachOMagic:
+            assert MachOParser._is_macho(struct.pack("<I", magic)) is True
+        assert MachOParser._is_macho(b"\x89PNG\r\n") is False
+        assert MachOParser._is_macho(b"\xca\xfe") is False
+        assert MachOParser.is_encrypted(b"<?xml version='1.0'?>") is False
+
+    def test_parse_fat_stop_on_encrypted(self):
+        """stop_on_encrypted should skip slices after the first encrypted one."""
+        slices = []
+        for cryptid in (1, 0):
+            enc_cmd = struct.pack(
+                "<IIIIII", LoadCommand.LC_ENCRYPTION_INFO_64, 24, 16384, 64, cryptid, 0
+            )
+            slices.append(
+                struct.pack(
+                    "<IIIIIIII",
+                    MachOMagic.MH_MAGIC_64,
+                    MachOCPUType.ARM64,
+                    0, 2, 1, len(enc_cmd), 0, 0,
+                )
+                + enc_cmd
+                + b"\x00" * 64
+            )
+        fat_header = struct.pack(">II", MachOMagic.FAT_MAGIC, 2)
+        data_offset = 4096
+        for i, slice_data in enumerate(slices):
+            fat_header += struct.pack(
+                ">IIIII", MachOCPUType.ARM64, 0, data_offset * (i + 1), len(slice_data), 12
+            )
+        data = fat_header.ljust(data_offset, b"\x00")
+        data = data + slices[0].ljust(data_offset, b"\x00") + slices[1]
+
+        assert len(MachOParser.parse(data).slices) == 2
+        binary = MachOParser.parse(data, stop_on_encrypted=True)
+        assert len(binary.slices) == 1
+        assert binary.encryption_info.cmd_offset == data_offset + 32
+
+    def test_find_encryption_info_stops_at_sizeofcmds(self):
+        """Commands past the sizeofcmds region should be ignored."""
+        segment_cmd = struct.pack("<II", LoadCommand.LC_SEGMENT_64, 8)
+        enc_cmd = struct.pack(
+            "<IIIIII", LoadCommand.LC_ENCRYPTION_INFO_64, 24, 4096, 16, 1, 0
+        )
+        # ncmds claims two commands but sizeofcmds only covers the first
+        header = struct.pack(
+            "<IIIIIIII",
+            MachOMagic.MH_MAGIC_64,
+            MachOCPUType.ARM64,
+            0, 2, 2, len(segment_cmd), 0, 0,
+        )
+        data = header + segment_cmd + enc_cmd + b"\x00" * 100
+
+        assert MachOParser.parse(data).encryption_info is None
+
+    def test_find_encryption_info_zero_cmdsize(self):
+        """A zero cmdsize should end the walk instead of re-reading the command."""
+        bad_cmd = struct.pack("<II", LoadCommand.LC_SEGMENT_64, 0)
+        header = struct.pack(
+            "<IIIIIIII",
+            MachOMagic.MH_MAGIC_64,
+            MachOCPUType.ARM64,
+            0, 2, 1000, 0, 0, 0,
+        )
+        data = header + bad_cmd + b"\x00" * 100
+
+        assert MachOParser.parse(data).encryption_info is None
+
+    def test_patch_cryptid_inplace(self):
+        """patch_cryptid_inplace should write cryptid into the given buffer."""
+        buf = bytearray(64)
+        struct.pack_into("<I", buf, 32 + 16, 1)
+
+        MachOParser.patch_cryptid_inplace(buf, cmd_offset=32)
+        assert struct.unpack_from("<I", buf, 48)[0] == 0
+
+        MachOParser.patch_cryptid_inplace(buf, cmd_offset=4128, new_cryptid=7, slice_offset=4096)
+        assert struct.unpack_from("<I", buf, 48)[0] == 7
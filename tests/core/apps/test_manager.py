@@ -101,6 +101,59 @@ class TestAppManager:
         assert all(isinstance(app, AppInfo) for app in apps)
         mock_installation_proxy.get_apps.assert_called_once()
 
+    @patch("orange.core.apps.manager.create_lockdown_client")
+    @patch("orange.core.apps.manager.InstallationProxyService")
+    def test_list_apps_cached(
+        self,
+        mock_proxy_class,
+        mock_create_lockdown,
+        mock_lockdown,
+        mock_installation_proxy,
+    ) -> None:
+        """Repeated list_apps calls should reuse the cached result."""
+        mock_create_lockdown.return_value = mock_lockdown
+        mock_proxy_class.return_value = mock_installation_proxy
+
+        manager = AppManager("test-udid")
+        first = manager.list_apps()
+        first.clear()  # Callers get their own copy
+        second = manager.list_apps()
+
+        assert len(second) == 2
+        mock_installation_proxy.get_apps.assert_called_once()
+
+        manager.list_apps(calculate_sizes=False)
+        assert mock_installation_proxy.get_apps.call_count == 2
+
+        manager.invalidate_apps_cache()
+        manager.list_apps()
+        assert mock_installation_proxy.get_apps.call_count == 3
+
+    @patch("orange.core.apps.manager.create_lockdown_client")
+    @patch("orange.core.apps.manager.InstallationProxyService")
+    def test_list_apps_sort_flag(
+        self,
+        mock_proxy_class,
+        mock_create_lockdown,
+        mock_lockdown,
+        mock_installation_proxy,
+    ) -> None:
+        """list_apps should sort by name unless sort=False."""
+        mock_create_lockdown.return_value = mock_lockdown
+        mock_proxy_class.return_value = mock_installation_proxy
+
+        manager = AppManager("test-udid")
+
+        assert [a.name for a in manager.list_apps()] == ["Example App", "Netflix"]
+        mock_installation_proxy.get_apps.return_value = dict(
+            reversed(list(mock_installation_proxy.get_apps.return_value.items()))
+        )
+        manager.invalidate_apps_cache()
+        assert [a.name for a in manager.list_apps(sort=False)] == [
+            "Netflix",
+            "Example App",
+        ]
+
     @patch("orange.core.apps.manager.create_lockdown_client")
     @patch("orange.core.apps.manager.InstallationProxyService")
     def test_list_apps_by_type(
@@ -151,6 +204,49 @@ class TestAppManager:
         assert app.bundle_id == "com.netflix.Netflix"
         assert app.name == "Netflix"
 
+    @patch("orange.core.apps.manager.create_lockdown_client")
+    @patch("orange.core.apps.manager.InstallationProxyService")
+    def test_get_apps_single_query(
+        self,
+        mock_proxy_class,
+        mock_create_lockdown,
+        mock_lockdown,
+        mock_installation_proxy,
+    ) -> None:
+        """get_apps should fetch every bundle ID in one call."""
+        mock_create_lockdown.return_value = mock_lockdown
+        mock_proxy_class.return_value = mock_installation_proxy
+
+        manager = AppManager("test-udid")
+        apps = manager.get_apps(["com.example.app", "com.netflix.Netflix"])
+
+        assert set(apps) == {"com.example.app", "com.netflix.Netflix"}
+        mock_installation_proxy.get_apps.assert_called_once_with(
+            application_type="Any",
+            calculate_sizes=True,
+            bundle_identifiers=["com.example.app", "com.netflix.Netflix"],
+        )
+
+    @patch("orange.core.apps.manager.create_lockdown_client")
+    @patch("orange.core.apps.manager.InstallationProxyService")
+    def test_get_apps_uses_prewarmed_listing(
+        self,
+        mock_proxy_class,
+        mock_create_lockdown,
+        mock_lockdown,
+        mock_installation_proxy,
+    ) -> None:
+        """get_apps should answer from a fresh full listing without a query."""
+        mock_create_lockdown.return_value = mock_lockdown
+        mock_proxy_class.return_value = mock_installation_proxy
+
+        manager = AppManager("test-udid")
+        manager.list_apps(app_type=AppType.ANY)
+        app = manager.get_app("com.netflix.Netflix")
+
+        assert app.name == "Netflix"
+        mock_installation_proxy.get_apps.assert_called_once()
+
     @patch("orange.core.apps.manager.create_lockdown_client")
     @patch("orange.core.apps.manager.InstallationProxyService")
     def test_get_app_not_found(
@@ -205,6 +301,44 @@ class TestAppManager:
         assert len(results) == 1
         assert results[0].bundle_id == "com.example.app"
 
+    @patch("orange.core.apps.manager.create_lockdown_client")
+    @patch("orange.core.apps.manager.InstallationProxyService")
+    def test_search_apps_parses_only_matches(
+        self,
+        mock_proxy_class,
+        mock_create_lockdown,
+        mock_lockdown,
+        mock_installation_proxy,
+    ) -> None:
+        """search_apps should filter raw entries before parsing them."""
+        mock_create_lockdown.return_value = mock_lockdown
+        mock_proxy_class.return_value = mock_installation_proxy
+
+        manager = AppManager("test-udid")
+        with patch.object(
+            manager, "_parse_app_info", wraps=manager._parse_app_info
+        ) as parse:
+            results = manager.search_apps("netflix")
+
+        assert [a.bundle_id for a in results] == ["com.netflix.Netflix"]
+        parse.assert_called_once()
+
+    def test_parse_app_info_empty_containers(self) -> None:
+        """Apps without icons/entitlements should get their own empties."""
+        manager = AppManager("test-udid")
+        icons = {"CFBundlePrimaryIcon": {"CFBundleIconFiles": ["AppIcon60x60"]}}
+
+        bare_a = manager._parse_app_info("com.a", {})
+        bare_b = manager._parse_app_info("com.b", {})
+        full = manager._parse_app_info(
+            "com.c", {"CFBundleIcons": icons, "Entitlements": {"get-task-allow": True}}
+        )
+
+        assert bare_a.icon_files == [] and bare_a.entitlements == {}
+        assert bare_a.entitlements is not bare_b.entitlements
+        assert full.icon_files == ["AppIcon60x60"]
+        assert full.entitlements == {"get-task-allow": True}
+
     @patch("orange.core.apps.manager.create_lockdown_client")
     @patch("orange.core.apps.manager.InstallationProxyService")
     def test_context_manager(
@@ -308,3 +442,161 @@ class TestAppManager:
 
         with pytest.raises(AppExtractionError, match="Cannot extract system app"):
             manager.extract_ipa("com.apple.mobilesafari", Path("./Safari.ipa"))
+
+    @staticmethod
+    def _mock_afc(tree: dict, contents: dict) -> Mock:
+        """Create a mock AFC client serving an in-memory file tree."""
+        afc = Mock()
+        afc.listdir.side_effect = lambda path: tree[path]
+        afc.stat.side_effect = lambda path: (
+            {"st_ifmt": "S_IFDIR"}
+            if path in tree
+            else {"st_ifmt": "S_IFREG", "st_size": len(contents[path])}
+        )
+        afc.get_file_contents.side_effect = lambda path: contents[path]
+        reads = {}
+
+        def fopen(path):
+            reads[path] = 0
+            return path
+
+        def fread(handle, size):
+            start = reads[handle]
+            reads[handle] = start + size
+            return contents[handle][start : start + size]
+
+        afc.fopen.side_effect = fopen
+        afc.fread.side_effect = fread
+        return afc
+
+    @patch("orange.core.apps.manager.HouseArrestService")
+    @patch("orange.core.apps.manager.create_lockdown_client")
+    @patch("orange.core.apps.manager.InstallationProxyService")
+    def test_extract_ipa_streams_into_zip(
+        self,
+        mock_proxy_class,
+        mock_create_lockdown,
+        mock_house_arrest,
+        mock_installation_proxy,
+        tmp_path,
+    ) -> None:
+        """extract_ipa should archive device files and store compressed assets."""
+        import zipfile
+
+        contents = {"/Example": b"\x00" * 1024, "/icon.png": b"\x89PNG" * 256}
+        afc = self._mock_afc({"/": ["Example", "icon.png"]}, contents)
+        mock_proxy_class.return_value = mock_installation_proxy
+        mock_house_arrest.return_value.__enter__.return_value.send_command.return_value = afc
+
+        manager = AppManager("test-udid")
+        output = manager.extract_ipa("com.example.app", tmp_path / "Example.ipa")
+
+        with zipfile.ZipFile(output) as zf:
+            icon = zf.getinfo("Payload/Example.app/icon.png")
+            binary = zf.getinfo("Payload/Example.app/Example")
+            assert icon.compress_type == zipfile.ZIP_STORED
+            assert binary.compress_type == zipfile.ZIP_DEFLATED
+            assert zf.read(binary) == contents["/Example"]
+
+    def test_zip_directory_parallel_and_streamed(self, tmp_path) -> None:
+        """Small files should be prefetched on extra clients, large ones streamed."""
+        import zipfile
+
+        tree = {"/": ["a.txt", "sub"], "/sub": ["b.txt", "big.bin"]}
+        contents = {
+            "/a.txt": b"a" * 10,
+            "/sub/b.txt": b"b" * 10,
+            "/sub/big.bin": b"x" * 64,
+        }
+        primary = self._mock_afc(tree, contents)
+        extras = []
+
+        def factory():
+            extras.append(self._mock_afc(tree, contents))
+            return extras[-1]
+
+        progress = Mock()
+        output = tmp_path / "out.zip"
+        with patch("orange.core.apps.manager.PREFETCH_MAX_SIZE", 32), patch(
+            "orange.core.apps.manager.DEFAULT_CHUNK_SIZE", 16
+        ), zipfile.ZipFile(output, "w") as zf:
+            AppManager("test-udid")._zip_directory(
+                primary, "/", "Payload/App.app/", zf, progress, afc_factory=factory
+            )
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.namelist() == [
+                "Payload/App.app/a.txt",
+                "Payload/App.app/sub/b.txt",
+                "Payload/App.app/sub/big.bin",
+            ]
+            assert zf.read("Payload/App.app/sub/big.bin") == contents["/sub/big.bin"]
+        assert progress.call_count == 3
+        primary.get_file_contents.assert_not_called()
+        primary.fclose.assert_called_once_with("/sub/big.bin")
+        assert sum(e.get_file_contents.call_count for e in extras) == 2
+
+    def test_zip_directory_honors_compresslevel(self, tmp_path) -> None:
+        """Prefetched and streamed entries should use the archive's level."""
+        import zipfile
+        import zlib
+
+        data = bytes(range(256)) * 64 + b"key = value;\n" * 2000
+        tree = {"/": ["small.txt", "big.txt"]}
+        contents = {"/small.txt": data, "/big.txt": data + b"!"}
+
+        def deflated_size(raw: bytes, level: int) -> int:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+            return len(compressor.compress(raw) + compressor.flush())
+
+        output = tmp_path / "out.zip"
+        with patch(
+            "orange.core.apps.manager.PREFETCH_MAX_SIZE", len(data)
+        ), zipfile.ZipFile(
+            output, "w", zipfile.ZIP_DEFLATED, compresslevel=1
+        ) as zf:
+            AppManager("test-udid")._zip_directory(
+                self._mock_afc(tree, contents),
+                "/",
+                "",
+                zf,
+                afc_factory=lambda: self._mock_afc(tree, contents),
+            )
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+            for name in ("small.txt", "big.txt"):
+                raw = contents[f"/{name}"]
+                info = zf.getinfo(name)
+                assert info.compress_size == deflated_size(raw, 1)
+                assert info.compress_size != deflated_size(raw, 6)
+
+    def test_stream_file_survives_short_reads(self, tmp_path) -> None:
+        """Short AFC reads should not truncate a streamed entry."""
+        import zipfile
+
+        data = b"0123456789" * 10
+        afc = self._mock_afc({"/": ["f.bin"]}, {"/f.bin": data})
+        read = afc.fread.side_effect
+        afc.fread.side_effect = lambda handle, size: read(handle, min(size, 7))
+
+        output = tmp_path / "out.zip"
+        with patch("orange.core.apps.manager.DEFAULT_CHUNK_SIZE", 16), zipfile.ZipFile(
+            output, "w"
+        ) as zf:
+            AppManager("test-udid")._zip_directory(afc, "/", "", zf)
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.read("f.bin") == data
+
+    def test_zip_info_uses_remote_mtime(self) -> None:
+        """Entries should carry the device file's mtime, not the current time."""
+        from datetime import datetime
+
+        mtime = datetime(2024, 5, 6, 7, 8, 10)
+        zinfo = AppManager._zip_info("a.txt", 1, mtime, 1)
+        assert zinfo.date_time == (2024, 5, 6, 7, 8, 10)
+
+        nanos = int(mtime.timestamp() * 1e9)
+        assert AppManager._zip_info("a.txt", 1, nanos, 1).date_time == zinfo.date_time
+        assert AppManager._zip_info("a.txt", 1, 1, 1).date_time == (1980, 1, 1, 0, 0, 0)
@@ -1,8 +1,8 @@
 """Tests for app models."""
 
-import pytest
+import json
 
-from orange.core.apps.models import AppInfo, AppType, _format_size
+from orange.core.apps.models import AppInfo, AppType
 
 
 class TestAppType:
@@ -159,31 +159,33 @@ class TestAppInfo:
         assert "size_human" in d
         assert d["is_extractable"] is True
 
+    def test_to_dict_without_human_sizes(self) -> None:
+        """include_human=False should drop only the formatted size strings."""
+        app = AppInfo(
+            bundle_id="com.example.app",
+            name="Example App",
+            version="1.0.0",
+            short_version="1.0",
+            app_type=AppType.USER,
+            size=1024,
+            data_size=512,
+        )
+        full = app.to_dict()
+        lean = app.to_dict(include_human=False)
 
-class TestFormatSize:
-    """Tests for _format_size helper function."""
-
-    def test_format_zero(self) -> None:
-        """Should format zero bytes."""
-        assert _format_size(0) == "0 B"
+        human = {"size_human", "data_size_human", "total_size_human"}
+        assert list(lean) == [k for k in full if k not in human]
+        assert lean["total_size"] == 1536
 
-    def test_format_bytes(self) -> None:
-        """Should format bytes."""
-        assert "B" in _format_size(100)
-        assert "100" in _format_size(100)
 
-    def test_format_kilobytes(self) -> None:
-        """Should format kilobytes."""
-        assert "KB" in _format_size(2048)
+    def test_collection_defaults_are_mutable_and_serializable(self) -> None:
+        """Default collections should be fresh, mutable and JSON-friendly."""
+        a = AppInfo("com.a", "A", "1", "1", AppType.USER)
+        b = AppInfo("com.b", "B", "1", "1", AppType.USER)
 
-    def test_format_megabytes(self) -> None:
-        """Should format megabytes."""
-        assert "MB" in _format_size(5 * 1024 * 1024)
+        a.icon_files.append("AppIcon")
+        a.extra["x"] = 1
 
-    def test_format_gigabytes(self) -> None:
-        """Should format gigabytes."""
-        assert "GB" in _format_size(3 * 1024 * 1024 * 1024)
+        assert b.icon_files == [] and b.extra == {}
+        json.dumps({**a.to_dict(), "extra": a.extra, "icons": a.icon_files})
 
-    def test_format_terabytes(self) -> None:
-        """Should format terabytes."""
-        assert "TB" in _format_size(2 * 1024 * 1024 * 1024 * 1024)
@@ -0,0 +1,50 @@
+"""Tests for backup blob copy helpers."""
+
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from orange.core.backup import blobs as blobs_module
+from orange.core.backup.blobs import copy_blob
+
+
+class TestCopyBlob:
+    """Tests for the backup blob copy helper."""
+
+    @pytest.mark.parametrize("content", [b"", b"x" * 70000])
+    def test_copies_content(self, tmp_path: Path, content: bytes) -> None:
+        """Blobs should be copied byte for byte."""
+        source = tmp_path / "blob"
+        source.write_bytes(content)
+
+        assert copy_blob(source, tmp_path / "out").read_bytes() == content
+
+    def test_falls_back_to_copyfile(self, tmp_path: Path) -> None:
+        """An unsupported in-kernel copy should fall back to shutil.copyfile."""
+        source = tmp_path / "blob"
+        source.write_bytes(b"data")
+
+        error = OSError(18, "Invalid cross-device link")
+        with patch.object(blobs_module, "_HAS_COPY_FILE_RANGE", True):
+            with patch.object(
+                blobs_module.os, "copy_file_range", side_effect=error, create=True
+            ):
+                assert copy_blob(source, tmp_path / "out").read_bytes() == b"data"
+
+    def test_buffered_copy_without_native_fastcopy(self, tmp_path: Path) -> None:
+        """Platforms without a zero-copy path should use a 1 MiB buffer."""
+        source = tmp_path / "blob"
+        source.write_bytes(b"y" * 5000)
+
+        with patch.object(blobs_module, "_HAS_COPY_FILE_RANGE", False):
+            with patch.object(blobs_module, "_NATIVE_FASTCOPY", False):
+                with patch(
+                    "orange.core.backup.blobs.shutil.copyfileobj",
+                    wraps=shutil.copyfileobj,
+                ) as copyfileobj:
+                    out = copy_blob(source, tmp_path / "out")
+
+        assert out.read_bytes() == b"y" * 5000
+        assert copyfileobj.call_args.args[2] == blobs_module.COPY_BUFFER_SIZE
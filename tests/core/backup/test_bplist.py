@@ -0,0 +1,46 @@
+"""Tests for manifest blob decoding."""
+
+import plistlib
+
+from orange.core.backup.bplist import extract_manifest_metadata
+
+
+class TestExtractManifestMetadata:
+    """Tests for the bplist00 manifest metadata extractor."""
+
+    @staticmethod
+    def _mbfile_blob(**metadata) -> bytes:
+        """Build an NSKeyedArchiver-style MBFile archive."""
+        archive = {
+            "$archiver": "NSKeyedArchiver",
+            "$version": 100000,
+            "$top": {"root": plistlib.UID(1)},
+            "$objects": [
+                "$null",
+                {
+                    "$class": plistlib.UID(3),
+                    "RelativePath": plistlib.UID(2),
+                    **metadata,
+                },
+                "Library/SMS/sms.db",
+                {"$classname": "MBFile", "$classes": ["MBFile", "NSObject"]},
+            ],
+        }
+        return plistlib.dumps(archive, fmt=plistlib.FMT_BINARY)
+
+    def test_reads_archived_scalars(self) -> None:
+        """Extractor should match the values plistlib decodes."""
+        blob = self._mbfile_blob(
+            Size=5_000_000_000, Mode=0o100644, Flags=4, LastModified=1700000000
+        )
+
+        assert extract_manifest_metadata(blob) == (
+            5_000_000_000,
+            0o100644,
+            4,
+            1700000000,
+        )
+
+    def test_missing_keys_default(self) -> None:
+        """Absent keys should come back as 0/None."""
+        assert extract_manifest_metadata(self._mbfile_blob(Size=7)) == (7, 0, 0, None)
@@ -1,5 +1,6 @@
 """Tests for backup manager."""
 
+import os
 import pytest
 from datetime import datetime
 from pathlib import Path
@@ -7,7 +8,15 @@ from unittest.mock import Mock, patch, MagicMock
 import tempfile
 import plistlib
 
-from orange.core.backup.manager import BackupManager, DEFAULT_BACKUP_DIR
+from orange.core.backup.manager import (
+    BackupManager,
+    DEFAULT_BACKUP_DIR,
+    LOCKDOWN_CACHE_TTL,
+    _load_info_plist_keys,
+    _load_plist,
+    _scan_backup_dir,
+    _throttled_progress,
+)
 from orange.core.backup.models import BackupInfo
 from orange.exceptions import BackupError, DeviceNotFoundError
 
@@ -77,6 +86,50 @@ class TestBackupManager:
         assert backups[0].device_udid == "test-udid"
         assert backups[0].ios_version == "17.0"
 
+    def test_list_backups_parses_all_and_sorts(self, tmp_path: Path) -> None:
+        """list_backups should parse every backup and sort newest first."""
+        for i in range(5):
+            backup_dir = tmp_path / f"udid-{i}"
+            backup_dir.mkdir()
+            info = {
+                "Target Identifier": f"udid-{i}",
+                "Last Backup Date": datetime(2024, 1, i + 1),
+            }
+            (backup_dir / "Info.plist").write_bytes(plistlib.dumps(info))
+        broken = tmp_path / "broken"
+        broken.mkdir()
+        (broken / "Info.plist").write_bytes(b"not a plist")
+
+        backups = BackupManager(backup_dir=tmp_path).list_backups()
+
+        expected = [f"udid-{i}" for i in (4, 3, 2, 1, 0)]
+        assert [b.device_udid for b in backups] == expected
+
+    def test_list_backups_reused_until_directory_changes(self, tmp_path: Path) -> None:
+        """list_backups should skip re-parsing while the directory is unchanged."""
+        for udid in ("udid-a", "udid-b"):
+            backup_dir = tmp_path / udid
+            backup_dir.mkdir()
+            info = {"Target Identifier": udid, "Last Backup Date": datetime.now()}
+            (backup_dir / "Info.plist").write_bytes(plistlib.dumps(info))
+        manager = BackupManager(backup_dir=tmp_path)
+
+        first = manager.list_backups()
+        with patch.object(manager, "_parse_backup_info") as parse:
+            second = manager.list_backups()
+        assert parse.call_count == 0
+        assert second == first
+        assert second is not first
+
+        new_dir = tmp_path / "udid-c"
+        new_dir.mkdir()
+        info = {"Target Identifier": "udid-c", "Last Backup Date": datetime.now()}
+        (new_dir / "Info.plist").write_bytes(plistlib.dumps(info))
+        stat = os.stat(tmp_path)
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert len(manager.list_backups()) == 3
+
     def test_get_backup_info(self, tmp_path: Path) -> None:
         """get_backup_info should return BackupInfo for valid backup."""
         # Create a fake backup
@@ -105,6 +158,26 @@ class TestBackupManager:
         assert backup_info.device_name == "Test iPhone"
         assert backup_info.is_encrypted is True
 
+    def test_get_backup_info_cached_until_modified(self, tmp_path: Path) -> None:
+        """Unchanged backups should not be re-parsed; rewritten ones should."""
+        backup_dir = tmp_path / "cached-udid"
+        backup_dir.mkdir()
+        info_plist = backup_dir / "Info.plist"
+        info_plist.write_bytes(plistlib.dumps({"Device Name": "Before"}))
+
+        manager = BackupManager(backup_dir=tmp_path)
+        with patch(
+            "orange.core.backup.manager._load_info_plist_keys",
+            wraps=_load_info_plist_keys,
+        ) as load:
+            assert manager.get_backup_info(backup_dir).device_name == "Before"
+            assert manager.get_backup_info(backup_dir).device_name == "Before"
+            assert load.call_count == 1
+
+            info_plist.write_bytes(plistlib.dumps({"Device Name": "After"}))
+            os.utime(info_plist, ns=(0, 10**18))
+            assert manager.get_backup_info(backup_dir).device_name == "After"
+
     def test_get_backup_info_missing_info_plist(self, tmp_path: Path) -> None:
         """get_backup_info should raise for missing Info.plist."""
         backup_dir = tmp_path / "invalid-backup"
@@ -126,6 +199,19 @@ class TestBackupManager:
         assert result is True
         assert not backup_dir.exists()
 
+    def test_delete_backup_many_subdirectories(self, tmp_path: Path) -> None:
+        """delete_backup should remove a hash-prefix layout with nested files."""
+        backup_dir = tmp_path / "udid"
+        backup_dir.mkdir()
+        (backup_dir / "Manifest.db").write_bytes(b"db")
+        for prefix in ("00", "0a", "ff"):
+            (backup_dir / prefix / "deep").mkdir(parents=True)
+            (backup_dir / prefix / f"{prefix}abcdef").write_bytes(b"x")
+            (backup_dir / prefix / "deep" / "file").write_bytes(b"x")
+
+        assert BackupManager().delete_backup(backup_dir) is True
+        assert not backup_dir.exists()
+
     def test_delete_backup_nonexistent(self, tmp_path: Path) -> None:
         """delete_backup should return False for nonexistent directory."""
         manager = BackupManager()
@@ -176,6 +262,94 @@ class TestBackupManager:
         assert backup_info.device_name == "Test iPhone"
         mock_service_instance.backup.assert_called_once()
 
+    @patch("orange.core.backup.manager.create_lockdown_client")
+    def test_lockdown_client_reused_until_closed(
+        self,
+        mock_create_lockdown: MagicMock,
+    ) -> None:
+        """Lockdown clients should be cached per UDID and closed on close()."""
+        first, second = Mock(), Mock()
+        mock_create_lockdown.side_effect = [first, second]
+
+        with BackupManager() as manager:
+            with manager._lockdown("udid") as lockdown:
+                assert lockdown is first
+            with manager._lockdown("udid") as lockdown:
+                assert lockdown is first
+        first.close.assert_called_once()
+
+        with manager._lockdown("udid") as lockdown:
+            assert lockdown is second
+        assert mock_create_lockdown.call_count == 2
+
+    @patch("orange.core.backup.manager.create_lockdown_client")
+    def test_lockdown_ttl_counts_from_last_use(
+        self,
+        mock_create_lockdown: MagicMock,
+    ) -> None:
+        """A client in use past the TTL must stay open and be reused."""
+        first, second = Mock(), Mock()
+        mock_create_lockdown.side_effect = [first, second]
+        clock = [0.0]
+
+        with (
+            patch("orange.core.backup.manager.time.monotonic", lambda: clock[0]),
+            BackupManager() as manager,
+        ):
+            with manager._lockdown("udid") as lockdown:
+                clock[0] = LOCKDOWN_CACHE_TTL * 2
+                with manager._lockdown("udid") as nested:
+                    assert nested is lockdown
+                first.close.assert_not_called()
+
+            clock[0] += LOCKDOWN_CACHE_TTL / 2
+            with manager._lockdown("udid") as lockdown:
+                assert lockdown is first
+
+            clock[0] += LOCKDOWN_CACHE_TTL * 2
+            with manager._lockdown("udid") as lockdown:
+                assert lockdown is second
+            first.close.assert_called_once()
+
+    @patch("orange.core.backup.manager.create_lockdown_client")
+    def test_lockdown_dropped_after_failure(
+        self,
+        mock_create_lockdown: MagicMock,
+    ) -> None:
+        """A failed operation should close its client once no one uses it."""
+        first, second = Mock(), Mock()
+        mock_create_lockdown.side_effect = [first, second]
+        manager = BackupManager()
+
+        with manager._lockdown("udid") as outer:
+            with pytest.raises(RuntimeError):
+                with manager._lockdown("udid"):
+                    raise RuntimeError("connection lost")
+            first.close.assert_not_called()
+            assert outer is first
+        first.close.assert_called_once()
+
+        with manager._lockdown("udid") as lockdown:
+            assert lockdown is second
+
+    @patch("orange.core.backup.manager.create_lockdown_client")
+    def test_lockdown_without_udid_not_cached(
+        self,
+        mock_create_lockdown: MagicMock,
+    ) -> None:
+        """Clients leased without a UDID should be closed after each use."""
+        first, second = Mock(), Mock()
+        mock_create_lockdown.side_effect = [first, second]
+        manager = BackupManager()
+
+        with manager._lockdown(None) as lockdown:
+            assert lockdown is first
+        first.close.assert_called_once()
+
+        with manager._lockdown(None) as lockdown:
+            assert lockdown is second
+        assert manager._lockdown_cache == {}
+
     @patch("orange.core.backup.manager.create_lockdown_client")
     def test_create_backup_device_not_found(
         self,
@@ -187,3 +361,122 @@ class TestBackupManager:
         manager = BackupManager()
         with pytest.raises(DeviceNotFoundError):
             manager.create_backup(udid="invalid-udid")
+
+
+class TestDirSize:
+    """Tests for the backup size walk."""
+
+    def test_scan_backup_dir(self, tmp_path: Path) -> None:
+        """Should sum nested regular files, skip symlinks and find the manifest."""
+        (tmp_path / "ab").mkdir()
+        (tmp_path / "ab" / "deep").mkdir()
+        (tmp_path / "Info.plist").write_bytes(b"x" * 10)
+        (tmp_path / "ab" / "abcdef").write_bytes(b"x" * 100)
+        (tmp_path / "ab" / "deep" / "file").write_bytes(b"x" * 1000)
+        (tmp_path / "link").symlink_to(tmp_path / "ab" / "abcdef")
+
+        assert _scan_backup_dir(str(tmp_path)) == (1110, False)
+
+        (tmp_path / "ab" / "Manifest.plist").write_bytes(b"x")
+        assert _scan_backup_dir(str(tmp_path)) == (1111, False)
+        (tmp_path / "Manifest.plist").write_bytes(b"x")
+        assert _scan_backup_dir(str(tmp_path)) == (1112, True)
+
+
+class TestLoadInfoPlistKeys:
+    """Tests for the streaming Info.plist reader."""
+
+    INFO = {
+        "Applications": {"com.example.app": {"iTunesMetadata": b"x" * 64}},
+        "Device Name": "Test iPhone",
+        "Last Backup Date": datetime(2024, 1, 2, 3, 4, 5),
+        "Target Identifier": "test-udid",
+        "iTunes Files": {"IC-Info.sidv": b"y" * 64},
+    }
+    KEYS = frozenset(
+        {"Device Name", "Last Backup Date", "Target Identifier", "Serial Number"}
+    )
+
+    @pytest.mark.parametrize("fmt", [plistlib.FMT_XML, plistlib.FMT_BINARY])
+    def test_reads_requested_scalars(self, tmp_path: Path, fmt) -> None:
+        """Should return only requested, present scalar keys for both formats."""
+        path = tmp_path / "Info.plist"
+        path.write_bytes(plistlib.dumps(self.INFO, fmt=fmt))
+
+        assert _load_info_plist_keys(path, self.KEYS) == {
+            "Device Name": "Test iPhone",
+            "Last Backup Date": datetime(2024, 1, 2, 3, 4, 5),
+            "Target Identifier": "test-udid",
+        }
+
+    def test_stops_once_all_keys_found(self, tmp_path: Path) -> None:
+        """Content after the last requested key should never be parsed."""
+        path = tmp_path / "Info.plist"
+        xml = plistlib.dumps({"Device Name": "Test iPhone", "Z": "z" * 100_000})
+        path.write_bytes(xml.replace(b"<string>zzz", b"<broken<string>zzz"))
+
+        assert _load_info_plist_keys(path, frozenset({"Device Name"})) == {
+            "Device Name": "Test iPhone"
+        }
+
+
+class TestThrottledProgress:
+    """Tests for progress callback throttling."""
+
+    def test_throttles_small_steps(self) -> None:
+        """Sub-step ticks within the interval should be dropped; 100% never is."""
+        seen: list[float] = []
+        wrapper = _throttled_progress(seen.append, "Backup")
+
+        with patch("orange.core.backup.manager.time.monotonic", return_value=1.0):
+            for pct in (0.0, 0.1, 0.2, 0.5, 0.6, 1.0, 100.0):
+                wrapper(pct)
+
+        assert seen == [0.0, 0.5, 1.0, 100.0]
+
+    def test_forwards_after_interval(self) -> None:
+        """A small step should still be forwarded once the interval has passed."""
+        seen: list[float] = []
+        wrapper = _throttled_progress(seen.append, "Restore")
+
+        with patch("orange.core.backup.manager.time.monotonic", side_effect=[0.0, 1.0]):
+            wrapper(10.0)
+            wrapper(10.1)
+
+        assert seen == [10.0, 10.1]
+
+
+class TestLoadPlist:
+    """Tests for the backup metadata plist loader."""
+
+    PLIST = {
+        "Device Name": "Test iPhone",
+        "IsEncrypted": True,
+        "Last Backup Date": datetime(2024, 1, 2, 3, 4, 5),
+        "Applications": {"com.example.app": {"Version": "1.0"}},
+    }
+
+    def test_binary_plist_uses_plistlib(self, tmp_path: Path) -> None:
+        """Binary plists should load in full, nested values included."""
+        path = tmp_path / "Info.plist"
+        path.write_bytes(plistlib.dumps(self.PLIST, fmt=plistlib.FMT_BINARY))
+
+        assert _load_plist(path) == self.PLIST
+
+    def test_xml_plist_with_lxml(self, tmp_path: Path) -> None:
+        """lxml should return the top-level scalars plistlib would."""
+        pytest.importorskip("lxml")
+        path = tmp_path / "Info.plist"
+        path.write_bytes(plistlib.dumps(self.PLIST))
+
+        result = _load_plist(path)
+
+        assert result == {k: v for k, v in self.PLIST.items() if k != "Applications"}
+
+    def test_xml_plist_without_lxml(self, tmp_path: Path) -> None:
+        """Without lxml, XML plists should fall back to plistlib."""
+        path = tmp_path / "Info.plist"
+        path.write_bytes(plistlib.dumps(self.PLIST))
+
+        with patch("orange.core.backup.manager._etree", None):
+            assert _load_plist(path) == self.PLIST
@@ -0,0 +1,33 @@
+"""Tests for indexed Manifest.db copies."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from orange import constants
+from orange.core.backup import manifest_index
+from orange.core.backup.manifest_index import indexed_manifest_copy
+
+
+class TestIndexedManifestCopy:
+    """Tests for the indexed manifest copy cache."""
+
+    def test_cache_is_bounded(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Older indexed copies should be pruned past the cache limit."""
+        monkeypatch.setattr(constants, "DEFAULT_CACHE_DIR", tmp_path / "cache")
+        monkeypatch.setattr(manifest_index, "MANIFEST_INDEX_CACHE_LIMIT", 2)
+
+        for name in ("a", "b", "c"):
+            manifest = tmp_path / name / "Manifest.db"
+            manifest.parent.mkdir()
+            conn = sqlite3.connect(str(manifest))
+            conn.execute(
+                "CREATE TABLE Files (fileID TEXT, domain TEXT, relativePath TEXT)"
+            )
+            conn.close()
+            indexed_manifest_copy(manifest)
+
+        assert len(list((tmp_path / "cache" / "manifests").glob("*.db"))) == 2
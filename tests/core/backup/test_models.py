@@ -95,6 +95,15 @@ class TestBackupInfo:
         )
         assert "GB" in info.size_human
 
+    def test_display_strings_follow_fields(self, backup_info: BackupInfo) -> None:
+        """display_name/size_human should reflect reassigned fields."""
+        assert "_display_name_cache" not in backup_info.__slots__
+
+        backup_info.device_name = "Renamed"
+        backup_info.size_bytes = 0
+        assert backup_info.display_name.startswith("Renamed - ")
+        assert backup_info.size_human == "0 B"
+
     def test_to_dict(self, backup_info: BackupInfo) -> None:
         """to_dict should return all fields."""
         d = backup_info.to_dict()
@@ -104,6 +113,18 @@ class TestBackupInfo:
         assert "size_human" in d
         assert d["path"] == "/backups/test"
 
+    def test_to_json_dict_keeps_datetime(self, backup_info: BackupInfo) -> None:
+        """to_json_dict should match to_dict except for the raw datetime."""
+        d = backup_info.to_json_dict()
+        assert d["backup_date"] is backup_info.backup_date
+        assert {**d, "backup_date": d["backup_date"].isoformat()} == backup_info.to_dict()
+
+    def test_to_dict_without_human_size(self, backup_info: BackupInfo) -> None:
+        """include_human=False should omit size_human."""
+        d = backup_info.to_dict(include_human=False)
+        assert "size_human" not in d
+        assert d["size_bytes"] == backup_info.size_bytes
+
 
 class TestBackupFile:
     """Tests for BackupFile dataclass."""
@@ -145,6 +166,19 @@ class TestBackupFile:
         assert d["domain"] == "HomeDomain"
         assert d["full_path"] == "HomeDomain/Library/SMS/sms.db"
 
+    def test_slotted_value_equality(self, backup_file: BackupFile) -> None:
+        """BackupFile should have no __dict__ and compare by value."""
+        copy = BackupFile(**{f: getattr(backup_file, f) for f in backup_file.__slots__})
+
+        assert not hasattr(backup_file, "__dict__")
+        assert copy == backup_file
+        assert copy is not backup_file
+
+    def test_to_json_dict_keeps_datetime(self, backup_file: BackupFile) -> None:
+        """to_json_dict should leave modified_time as a datetime."""
+        assert backup_file.to_json_dict()["modified_time"] == datetime(2026, 1, 25, 12, 0, 0)
+        assert backup_file.to_dict()["modified_time"] == "2026-01-25T12:00:00"
+
     def test_directory_file(self) -> None:
         """BackupFile should handle directories."""
         dir_file = BackupFile(
@@ -1,15 +1,19 @@
 """Tests for backup reader."""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import Mock, patch
 import plistlib
+import shutil
 import sqlite3
 import tempfile
 
+from orange import constants
+from orange.core.backup import reader as reader_module
+from orange.core.backup.bplist import extract_manifest_metadata
 from orange.core.backup.reader import BackupReader
-from orange.core.backup.models import BackupFile
+from orange.core.backup.models import BackupFile, BackupFileTuple
 from orange.exceptions import BackupError
 
 
@@ -99,6 +103,19 @@ class TestBackupReader:
         assert "CameraRollDomain" in domains
         assert len(domains) == 2
 
+    def test_list_domains_sorted_and_empty(self, mock_backup: Path) -> None:
+        """list_domains should be sorted and return [] for an empty manifest."""
+        reader = BackupReader(mock_backup)
+        assert reader.list_domains() == ["CameraRollDomain", "HomeDomain"]
+        reader.close()
+
+        conn = sqlite3.connect(str(mock_backup / "Manifest.db"))
+        conn.execute("DELETE FROM Files")
+        conn.commit()
+        conn.close()
+
+        assert BackupReader(mock_backup).list_domains() == []
+
     def test_list_files_all(self, mock_backup: Path) -> None:
         """list_files should return all files."""
         reader = BackupReader(mock_backup)
@@ -127,6 +144,38 @@ class TestBackupReader:
         assert len(files) == 1
         assert files[0].relative_path == "Library/SMS/sms.db"
 
+    def test_list_files_exact_and_literal_path(self, mock_backup: Path) -> None:
+        """exact_path should match whole paths; wildcards should be literal."""
+        reader = BackupReader(mock_backup)
+
+        assert reader.list_files(path_filter="sms.db", exact_path=True) == []
+        exact = reader.list_files(path_filter="Library/SMS/sms.db", exact_path=True)
+        assert [f.file_id for f in exact] == ["abc123"]
+        assert reader.list_files(path_filter="sms_db") == []
+        assert reader.list_files(path_filter="%") == []
+
+    def test_extract_database_prefers_exact_match(
+        self, mock_backup: Path, tmp_path: Path
+    ) -> None:
+        """extract_database should pick the exact path over substring hits."""
+        conn = sqlite3.connect(str(mock_backup / "Manifest.db"))
+        conn.execute(
+            "INSERT INTO Files VALUES (?, ?, ?, ?, ?)",
+            ("aaa000", "HomeDomain", "Backup/Library/SMS/sms.db", 0, None),
+        )
+        conn.commit()
+        conn.close()
+        for file_id in ("aaa000", "abc123"):
+            (mock_backup / file_id[:2]).mkdir(exist_ok=True)
+            (mock_backup / file_id[:2] / file_id).write_text(file_id)
+        reader = BackupReader(mock_backup)
+
+        exact = reader.extract_database("HomeDomain", "Library/SMS/sms.db", tmp_path)
+        partial = reader.extract_database("HomeDomain", "SMS/sms.db", tmp_path / "p")
+
+        assert exact.read_text() == "abc123"
+        assert partial is not None
+
     def test_get_file(self, mock_backup: Path) -> None:
         """get_file should return specific file by ID."""
         reader = BackupReader(mock_backup)
@@ -159,6 +208,83 @@ class TestBackupReader:
         assert extracted is not None
         assert extracted.exists()
 
+    def test_extract_file_preserve_mtime(
+        self, mock_backup: Path, tmp_path: Path
+    ) -> None:
+        """preserve_mtime should apply the manifest's LastModified time."""
+        self._add_file_with_metadata(mock_backup, "meta01")
+        (mock_backup / "me").mkdir()
+        (mock_backup / "me" / "meta01").write_text("notes")
+        reader = BackupReader(mock_backup)
+
+        plain = reader.extract_file("meta01", tmp_path / "plain")
+        kept = reader.extract_file("meta01", tmp_path / "kept", preserve_mtime=True)
+
+        assert kept.read_text() == "notes"
+        assert kept.stat().st_mtime == 1700000000
+        assert plain.stat().st_mtime != 1700000000
+
+    def test_extract_files(self, mock_backup: Path, tmp_path: Path) -> None:
+        """extract_files should copy every present file in one pass."""
+        for file_id in ("abc123", "def456"):
+            file_dir = mock_backup / file_id[:2]
+            file_dir.mkdir()
+            (file_dir / file_id).write_text(file_id)
+        reader = BackupReader(mock_backup)
+
+        with patch("orange.core.backup.reader.EXTRACT_QUERY_CHUNK", 1):
+            extracted = reader.extract_files(
+                ["abc123", "def456", "ghi789", "missing", "abc123"],
+                tmp_path / "out",
+                preserve_path=True,
+            )
+
+        assert set(extracted) == {"abc123", "def456"}
+        assert extracted["abc123"] == (
+            tmp_path / "out" / "HomeDomain" / "Library/SMS/sms.db"
+        )
+        assert extracted["def456"].read_text() == "def456"
+
+    def test_extract_files_same_basename(
+        self, mock_backup: Path, tmp_path: Path
+    ) -> None:
+        """Same-named files should not be copied onto one destination."""
+        conn = sqlite3.connect(str(mock_backup / "Manifest.db"))
+        conn.executemany(
+            "INSERT INTO Files VALUES (?, ?, ?, ?, ?)",
+            [
+                ("aa0000000001", "AppDomain-a", "Info.plist", 0, None),
+                ("bb0000000002", "AppDomain-b", "Info.plist", 0, None),
+            ],
+        )
+        conn.commit()
+        conn.close()
+        for file_id in ("aa0000000001", "bb0000000002"):
+            (mock_backup / file_id[:2]).mkdir(exist_ok=True)
+            (mock_backup / file_id[:2] / file_id).write_text(file_id)
+        reader = BackupReader(mock_backup)
+
+        extracted = reader.extract_files(["bb0000000002", "aa0000000001"], tmp_path)
+
+        assert extracted["aa0000000001"] == tmp_path / "Info.plist"
+        assert extracted["bb0000000002"] == tmp_path / "Info-bb000000.plist"
+        assert extracted["aa0000000001"].read_text() == "aa0000000001"
+        assert extracted["bb0000000002"].read_text() == "bb0000000002"
+
+    def test_extract_directory_row(self, mock_backup: Path, tmp_path: Path) -> None:
+        """Directory rows should be recreated without looking for a blob."""
+        self._add_file_with_metadata(
+            mock_backup, "dir001", mode=0o40755, relative_path="Library/Caches"
+        )
+        reader = BackupReader(mock_backup)
+
+        extracted = reader.extract_file("dir001", tmp_path / "out", preserve_path=True)
+        bulk = reader.extract_files(["dir001"], tmp_path / "bulk")
+
+        assert extracted == tmp_path / "out" / "HomeDomain" / "Library/Caches"
+        assert extracted.is_dir()
+        assert bulk["dir001"].is_dir()
+
     def test_extract_file_not_found(self, mock_backup: Path, tmp_path: Path) -> None:
         """extract_file should return None if file doesn't exist."""
         reader = BackupReader(mock_backup)
@@ -185,6 +311,165 @@ class TestBackupReader:
         assert len(files) == 1
         assert files[0].domain == "CameraRollDomain"
 
+    def test_iter_file_tuples(self, mock_backup: Path) -> None:
+        """iter_file_tuples should yield tuples that round-trip to BackupFile."""
+        reader = BackupReader(mock_backup)
+        tuples = list(reader.iter_file_tuples(domain="CameraRollDomain"))
+
+        assert len(tuples) == 1
+        assert isinstance(tuples[0], BackupFileTuple)
+        assert BackupFile.from_tuple(tuples[0]).to_tuple() == tuples[0]
+
+    @staticmethod
+    def _add_file_with_metadata(
+        backup_dir: Path,
+        file_id: str,
+        mode: int = 0o100644,
+        relative_path: str = "Documents/notes.txt",
+    ) -> None:
+        """Insert a row whose file blob mimics an NSKeyedArchiver MBFile."""
+        blob = plistlib.dumps(
+            {
+                "$objects": [
+                    "$null",
+                    {
+                        "Size": 42,
+                        "Mode": mode,
+                        "Flags": 1,
+                        "LastModified": 1700000000,
+                    },
+                ]
+            },
+            fmt=plistlib.FMT_BINARY,
+        )
+        conn = sqlite3.connect(str(backup_dir / "Manifest.db"))
+        conn.execute(
+            "INSERT INTO Files VALUES (?, ?, ?, ?, ?)",
+            (file_id, "HomeDomain", relative_path, 1, blob),
+        )
+        conn.commit()
+        conn.close()
+
+    def test_list_files_without_metadata(self, mock_backup: Path) -> None:
+        """load_metadata=False should skip decoding the file blob."""
+        self._add_file_with_metadata(mock_backup, "meta01")
+        reader = BackupReader(mock_backup)
+
+        with_meta = reader.get_file("meta01")
+        with patch("orange.core.backup.reader.plistlib.loads") as loads:
+            files = reader.list_files(path_filter="notes.txt", load_metadata=False)
+            tuples = list(reader.iter_file_tuples(load_metadata=False))
+        loads.assert_not_called()
+
+        assert with_meta.size == 42
+        assert files[0].file_id == "meta01"
+        assert files[0].size == 0
+        assert files[0].modified_time is None
+        assert len(tuples) == 4
+
+    def test_parsed_rows_cached_by_file_id(self, mock_backup: Path) -> None:
+        """Revisiting a file should not decode its metadata blob again."""
+        self._add_file_with_metadata(mock_backup, "meta01")
+        reader = BackupReader(mock_backup)
+
+        with patch(
+            "orange.core.backup.reader.load_manifest_metadata",
+            return_value=(42, 0o100644, 1, None),
+        ) as load:
+            listed = reader.list_files(path_filter="notes.txt")
+            fetched = reader.get_file("meta01")
+            assert load.call_count == 1
+            assert fetched.size == listed[0].size == 42
+            assert fetched is not listed[0]
+
+            reader.close()
+            reader.get_file("meta01")
+            assert load.call_count == 2
+
+    def test_large_manifest_uses_indexed_copy(
+        self, mock_backup: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Unindexed manifests should be queried via an indexed cache copy."""
+        monkeypatch.setattr(constants, "DEFAULT_CACHE_DIR", tmp_path / "cache")
+        monkeypatch.setattr(reader_module, "MANIFEST_INDEX_MIN_BYTES", 0)
+        index_sql = "SELECT name FROM sqlite_master WHERE type = 'index'"
+
+        with patch(
+            "orange.core.backup.manifest_index.shutil.copyfile", wraps=shutil.copyfile
+        ) as copy:
+            for _ in range(2):
+                with BackupReader(mock_backup, index_manifest=True) as reader:
+                    assert len(reader.list_files(domain="HomeDomain")) == 2
+                    names = [r[0] for r in reader._get_conn().execute(index_sql)]
+                    assert "idx_files_domain_path" in names
+            assert copy.call_count == 1
+
+        conn = sqlite3.connect(str(mock_backup / "Manifest.db"))
+        assert "idx_files_domain_path" not in [r[0] for r in conn.execute(index_sql)]
+        conn.close()
+
+    def test_manifest_index_is_opt_in(
+        self, mock_backup: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without index_manifest the backup's own Manifest.db is queried."""
+        monkeypatch.setattr(constants, "DEFAULT_CACHE_DIR", tmp_path / "cache")
+        monkeypatch.setattr(reader_module, "MANIFEST_INDEX_MIN_BYTES", 0)
+
+        with BackupReader(mock_backup) as reader:
+            assert len(reader.list_files(domain="HomeDomain")) == 2
+
+        assert not (tmp_path / "cache").exists()
+
+    def test_connection_reused_until_closed(self, mock_backup: Path) -> None:
+        """Queries should share one connection until the reader is closed."""
+        with patch(
+            "orange.core.backup.reader.sqlite3.connect", wraps=sqlite3.connect
+        ) as connect:
+            with BackupReader(mock_backup) as reader:
+                reader.list_domains()
+                reader.list_files()
+                reader.get_file("abc123")
+                list(reader.iter_files())
+                assert connect.call_count == 1
+                assert connect.call_args.kwargs["cached_statements"] == 256
+            assert reader._conn is None
+
+    def test_manifest_opened_read_only(self, mock_backup: Path) -> None:
+        """The shared connection must not be able to modify Manifest.db."""
+        with BackupReader(mock_backup) as reader:
+            with pytest.raises(sqlite3.OperationalError):
+                reader._get_conn().execute("DELETE FROM Files")
+
+    def test_falls_back_for_non_binary_plist(self, tmp_path: Path) -> None:
+        """Reader should still decode blobs the bplist extractor rejects."""
+        blob = plistlib.dumps({"Size": 3, "Mode": 0o40755, "LastModified": 1.5e9})
+        with pytest.raises(ValueError):
+            extract_manifest_metadata(blob)
+
+        row = {"fileID": "x", "domain": "d", "relativePath": "p", "file": blob}
+        with patch.object(BackupReader, "__init__", return_value=None):
+            reader = BackupReader(tmp_path)
+        reader._is_encrypted = False
+        reader._row_cache = {}
+        parsed = reader._parse_file_tuple(row)
+
+        assert parsed.size == 3
+        assert parsed.is_directory is True
+        assert parsed.modified_time == datetime.fromtimestamp(1.5e9, timezone.utc)
+        assert parsed.modified_time.tzinfo is timezone.utc
+
+    def test_encrypted_extraction_raises(
+        self, mock_backup: Path, tmp_path: Path
+    ) -> None:
+        """Both extract paths should refuse encrypted backups outright."""
+        reader = BackupReader(mock_backup, password="secret")
+        reader._is_encrypted = True
+
+        with pytest.raises(BackupError, match="not yet implemented"):
+            reader.extract_file("abc123", tmp_path)
+        with pytest.raises(BackupError, match="not yet implemented"):
+            reader.extract_files(["abc123"], tmp_path)
+
     def test_encrypted_backup_detection(self, tmp_path: Path) -> None:
         """Reader should detect encrypted backups."""
         backup_dir = tmp_path / "encrypted-backup"
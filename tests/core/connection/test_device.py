@@ -6,11 +6,13 @@ Tests the DeviceDetector class and DeviceInfo dataclass.
 
 from __future__ import annotations
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from orange.core.connection.device import (
+    DEVICE_VALUES_TTL,
     ConnectionType,
     DeviceDetector,
     DeviceInfo,
@@ -63,6 +65,12 @@ class TestDeviceInfo:
         assert data["state"] == "paired"
         assert data["battery_level"] == 85
 
+    def test_device_info_is_slotted(self, mock_device_info: DeviceInfo) -> None:
+        """DeviceInfo instances should not carry a per-instance __dict__."""
+        assert not hasattr(mock_device_info, "__dict__")
+        with pytest.raises(AttributeError):
+            mock_device_info.nickname = "phone"
+
     def test_connection_type_enum(self) -> None:
         """ConnectionType enum should have expected values."""
         assert ConnectionType.USB.value == "usb"
@@ -233,3 +241,100 @@ class TestDeviceDetector:
         # With refresh, should return empty
         devices = detector.list_devices(refresh=True)
         assert len(devices) == 0
+
+    def test_lockdown_values_reused_within_ttl(
+        self,
+        mock_mux_device: MagicMock,
+        mock_lockdown_client: MagicMock,
+    ) -> None:
+        """Repeated lookups should reuse lockdown values until the TTL expires."""
+        create = MagicMock(return_value=mock_lockdown_client)
+        detector = DeviceDetector()
+
+        with patch("orange.core.connection.device.create_using_usbmux", new=create):
+            first = detector._get_device_info(mock_mux_device)
+            second = detector._get_device_info(mock_mux_device)
+            assert create.call_count == 1
+
+            with patch("orange.core.connection.device.DEVICE_VALUES_TTL", 0.0):
+                detector._get_device_info(mock_mux_device)
+            assert create.call_count == 2
+
+        assert first.name == second.name == "Test iPhone"
+
+    def test_lockdown_values_refetched_after_expiry(
+        self,
+        mock_mux_device: MagicMock,
+        mock_lockdown_client: MagicMock,
+    ) -> None:
+        """An expired entry should be refetched and the client closed each time."""
+        create = MagicMock(return_value=mock_lockdown_client)
+        clock = [100.0]
+        detector = DeviceDetector()
+
+        with (
+            patch("orange.core.connection.device.create_using_usbmux", new=create),
+            patch("orange.core.connection.device.time.monotonic", lambda: clock[0]),
+        ):
+            detector._get_device_info(mock_mux_device)
+            clock[0] += DEVICE_VALUES_TTL / 2
+            detector._get_device_info(mock_mux_device)
+            assert create.call_count == 1
+
+            clock[0] += DEVICE_VALUES_TTL
+            detector._get_device_info(mock_mux_device)
+            assert create.call_count == 2
+
+        assert mock_lockdown_client.close.call_count == 2
+
+    def test_refresh_evicts_values_for_detached_devices(
+        self,
+        mock_lockdown_client: MagicMock,
+    ) -> None:
+        """Lockdown values should be dropped once a UDID leaves usbmux."""
+        devices = [MagicMock(serial="udid-a"), MagicMock(serial="udid-b")]
+        listing = MagicMock(side_effect=[devices, devices[:1]])
+        create = MagicMock(return_value=mock_lockdown_client)
+        detector = DeviceDetector(include_wifi=False)
+
+        with (
+            patch("orange.core.connection.device.usbmux_list_devices", new=listing),
+            patch("orange.core.connection.device.create_using_usbmux", new=create),
+        ):
+            detector.refresh()
+            assert {udid for udid, _ in detector._values_cache} == {
+                "udid-a",
+                "udid-b",
+            }
+
+            detector.refresh()
+            assert {udid for udid, _ in detector._values_cache} == {"udid-a"}
+
+    def test_refresh_probes_devices_concurrently(self) -> None:
+        """Devices should be probed in parallel and listed in usbmux order."""
+        mux_devices = [MagicMock(serial=f"udid-{i}") for i in range(2)]
+        barrier = threading.Barrier(2, timeout=5)
+
+        def probe(mux_device: MagicMock) -> DeviceInfo:
+            # Both probes must be in flight at once for the barrier to pass
+            barrier.wait()
+            return DeviceInfo(
+                udid=mux_device.serial,
+                name=mux_device.serial,
+                model="iPhone",
+                model_number="iPhone14,2",
+                ios_version="17.0",
+                build_version="21A329",
+                serial_number="SN",
+                connection_type=ConnectionType.USB,
+                state=DeviceState.PAIRED,
+            )
+
+        detector = DeviceDetector(include_wifi=False)
+        with patch(
+            "orange.core.connection.device.usbmux_list_devices",
+            new=MagicMock(return_value=mux_devices),
+        ), patch.object(detector, "_get_device_info", side_effect=probe):
+            devices = detector.list_devices()
+
+        assert [d.udid for d in devices] == ["udid-0", "udid-1"]
@@ -0,0 +1,47 @@
+"""
+Tests for connection package helpers.
+"""
+
+from __future__ import annotations
+
+import os
+import plistlib
+from pathlib import Path
+from unittest.mock import patch
+
+from orange.core.connection import _load_pairing_record, _read_pairing_record
+
+UDID = "00000000-TESTPAIRINGRECORD0000"
+
+
+class TestLoadPairingRecord:
+    """Tests for _load_pairing_record."""
+
+    def test_cached_until_modified(self, tmp_path: Path) -> None:
+        """Pairing records should be re-read only after the file changes."""
+        record_dir = tmp_path / "Library/Lockdown"
+        record_dir.mkdir(parents=True)
+        record_path = record_dir / f"{UDID}.plist"
+        record_path.write_bytes(plistlib.dumps({"HostID": "one"}))
+        _read_pairing_record.cache_clear()
+
+        with patch("orange.core.connection.Path.home", return_value=tmp_path):
+            with patch(
+                "orange.core.connection.plistlib.load", wraps=plistlib.load
+            ) as load:
+                first = _load_pairing_record(UDID)
+                first["HostID"] = "mutated"
+                second = _load_pairing_record(UDID)
+                assert load.call_count == 1
+                assert second == {"HostID": "one"}
+
+                record_path.write_bytes(plistlib.dumps({"HostID": "two"}))
+                stat = os.stat(record_path)
+                os.utime(record_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+                assert _load_pairing_record(UDID) == {"HostID": "two"}
+                assert load.call_count == 2
+
+    def test_missing_record(self, tmp_path: Path) -> None:
+        """A device without a pairing record should yield None."""
+        with patch("orange.core.connection.Path.home", return_value=tmp_path):
+            assert _load_pairing_record(UDID) is None
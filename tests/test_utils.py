@@ -0,0 +1,39 @@
+"""Tests for shared utilities."""
+
+from orange.utils import format_size
+
+
+class TestFormatSize:
+    """Tests for format_size helper function."""
+
+    def test_format_zero(self) -> None:
+        """Should format zero bytes."""
+        assert format_size(0) == "0 B"
+
+    def test_format_bytes(self) -> None:
+        """Should format bytes."""
+        assert "B" in format_size(100)
+        assert "100" in format_size(100)
+
+    def test_format_kilobytes(self) -> None:
+        """Should format kilobytes."""
+        assert "KB" in format_size(2048)
+
+    def test_format_megabytes(self) -> None:
+        """Should format megabytes."""
+        assert "MB" in format_size(5 * 1024 * 1024)
+
+    def test_format_gigabytes(self) -> None:
+        """Should format gigabytes."""
+        assert "GB" in format_size(3 * 1024 * 1024 * 1024)
+
+    def test_format_terabytes(self) -> None:
+        """Should format terabytes."""
+        assert "TB" in format_size(2 * 1024 * 1024 * 1024 * 1024)
+
+    def test_format_unit_boundaries(self) -> None:
+        """Unit should switch exactly at each power of 1024."""
+        assert format_size(1023) == "1023.0 B"
+        assert format_size(1024) == "1.0 KB"
+        assert format_size(1024**5) == "1.0 PB"
+        assert format_size(1024**6) == "1024.0 PB"